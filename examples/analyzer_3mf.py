@@ -1,8 +1,10 @@
 """3MF File Analyzer - Extract and analyze models from 3MF files."""
 
+import math
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import json
+import numpy as np
 from rich import print
 from rich.console import Console
 from rich.table import Table
@@ -66,9 +68,10 @@ class Model3MFAnalyzer:
                                 
                                 total_vertices += len(obj['vertices'])
                                 total_triangles += len(obj['triangles'])
-                                all_vertices.extend(obj['vertices'])
+                                all_vertices.append(obj['vertices'])
                         
                         # Calculate overall statistics
+                        all_vertices = np.concatenate(all_vertices) if all_vertices else np.empty((0, 3))
                         analysis['summary'].update({
                             'total_vertices': total_vertices,
                             'total_triangles': total_triangles,
@@ -77,7 +80,7 @@ class Model3MFAnalyzer:
                             'overall_dimensions': None
                         })
                         
-                        if all_vertices:
+                        if len(all_vertices):
                             bounds = analysis['summary']['overall_bounds']
                             analysis['summary']['overall_dimensions'] = [
                                 bounds['max'][0] - bounds['min'][0],
@@ -112,12 +115,17 @@ class Model3MFAnalyzer:
         # Calculate center of mass (geometric center)
         center_of_mass = self._calculate_center_of_mass(vertices)
         
+        # The per-triangle loops below index plain lists, converted once,
+        # instead of reading a NumPy scalar per coordinate
+        vertex_rows = np.asarray(vertices).tolist()
+        triangle_rows = np.asarray(triangles).tolist()
+        
         # Calculate volume and surface area (approximate)
-        volume = self._calculate_volume(vertices, triangles)
-        surface_area = self._calculate_surface_area(vertices, triangles)
+        volume = self._calculate_volume(vertex_rows, triangle_rows)
+        surface_area = self._calculate_surface_area(vertex_rows, triangle_rows)
         
         # Calculate mesh quality metrics
-        quality = self._analyze_mesh_quality(vertices, triangles)
+        quality = self._analyze_mesh_quality(vertex_rows, triangle_rows)
         
         return {
             'object_id': obj_id,
@@ -132,38 +140,27 @@ class Model3MFAnalyzer:
             'quality': quality
         }
     
-    def _calculate_bounds(self, vertices: List[List[float]]) -> Dict[str, List[float]]:
+    def _calculate_bounds(self, vertices: np.ndarray) -> Dict[str, List[float]]:
         """Calculate bounding box for vertices."""
-        if not vertices:
+        if len(vertices) == 0:
             return {'min': [0, 0, 0], 'max': [0, 0, 0]}
         
-        min_x = min(v[0] for v in vertices)
-        max_x = max(v[0] for v in vertices)
-        min_y = min(v[1] for v in vertices)
-        max_y = max(v[1] for v in vertices)
-        min_z = min(v[2] for v in vertices)
-        max_z = max(v[2] for v in vertices)
-        
+        vertices = np.asarray(vertices, dtype=np.float64)
         return {
-            'min': [min_x, min_y, min_z],
-            'max': [max_x, max_y, max_z]
+            'min': vertices.min(axis=0).tolist(),
+            'max': vertices.max(axis=0).tolist()
         }
     
-    def _calculate_center_of_mass(self, vertices: List[List[float]]) -> List[float]:
+    def _calculate_center_of_mass(self, vertices: np.ndarray) -> List[float]:
         """Calculate center of mass (geometric center) of vertices."""
-        if not vertices:
+        if len(vertices) == 0:
             return [0, 0, 0]
         
-        sum_x = sum(v[0] for v in vertices)
-        sum_y = sum(v[1] for v in vertices)
-        sum_z = sum(v[2] for v in vertices)
-        count = len(vertices)
-        
-        return [sum_x / count, sum_y / count, sum_z / count]
+        return np.asarray(vertices, dtype=np.float64).mean(axis=0).tolist()
     
     def _calculate_volume(self, vertices: List[List[float]], triangles: List[List[int]]) -> float:
         """Calculate approximate volume using divergence theorem."""
-        if not triangles or not vertices:
+        if len(triangles) == 0 or len(vertices) == 0:
             return 0.0
         
         volume = 0.0
@@ -186,10 +183,10 @@ class Model3MFAnalyzer:
     
     def _calculate_surface_area(self, vertices: List[List[float]], triangles: List[List[int]]) -> float:
         """Calculate surface area of the mesh."""
-        if not triangles or not vertices:
+        if len(triangles) == 0 or len(vertices) == 0:
             return 0.0
         
-        import math
+        sqrt = math.sqrt
         total_area = 0.0
         
         for triangle in triangles:
@@ -203,13 +200,11 @@ class Model3MFAnalyzer:
                     edge1 = [v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]]
                     edge2 = [v3[0] - v1[0], v3[1] - v1[1], v3[2] - v1[2]]
                     
-                    cross = [
-                        edge1[1] * edge2[2] - edge1[2] * edge2[1],
-                        edge1[2] * edge2[0] - edge1[0] * edge2[2],
-                        edge1[0] * edge2[1] - edge1[1] * edge2[0]
-                    ]
+                    cx = edge1[1] * edge2[2] - edge1[2] * edge2[1]
+                    cy = edge1[2] * edge2[0] - edge1[0] * edge2[2]
+                    cz = edge1[0] * edge2[1] - edge1[1] * edge2[0]
                     
-                    area = 0.5 * math.sqrt(cross[0]**2 + cross[1]**2 + cross[2]**2)
+                    area = 0.5 * sqrt(cx * cx + cy * cy + cz * cz)
                     total_area += area
                     
                 except (IndexError, TypeError, ValueError):
@@ -219,9 +214,10 @@ class Model3MFAnalyzer:
     
     def _analyze_mesh_quality(self, vertices: List[List[float]], triangles: List[List[int]]) -> Dict[str, Any]:
         """Analyze mesh quality metrics."""
-        if not triangles or not vertices:
+        if len(triangles) == 0 or len(vertices) == 0:
             return {'valid': False, 'degenerate_triangles': 0, 'edge_count': 0}
         
+        sqrt = math.sqrt
         degenerate_count = 0
         edges = set()
         
@@ -236,13 +232,11 @@ class Model3MFAnalyzer:
                     edge1 = [v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]]
                     edge2 = [v3[0] - v1[0], v3[1] - v1[1], v3[2] - v1[2]]
                     
-                    cross = [
-                        edge1[1] * edge2[2] - edge1[2] * edge2[1],
-                        edge1[2] * edge2[0] - edge1[0] * edge2[2],
-                        edge1[0] * edge2[1] - edge1[1] * edge2[0]
-                    ]
+                    cx = edge1[1] * edge2[2] - edge1[2] * edge2[1]
+                    cy = edge1[2] * edge2[0] - edge1[0] * edge2[2]
+                    cz = edge1[0] * edge2[1] - edge1[1] * edge2[0]
                     
-                    area = 0.5 * (cross[0]**2 + cross[1]**2 + cross[2]**2)**0.5
+                    area = 0.5 * sqrt(cx * cx + cy * cy + cz * cz)
                     if area < 1e-10:
                         degenerate_count += 1
                     
@@ -1,12 +1,19 @@
 """Example 2: Batch processing and multiple models in a single 3MF archive."""
 
+from functools import lru_cache
+from math import cos, pi, sin
 from pathlib import Path
 from noah123d import Archive, Directory, Model
 import json
+import numpy as np
 
 
-def create_multi_model_3mf():
-    """Create a 3MF file with multiple models and complex structure."""
+def create_multi_model_3mf(include_textures: bool = False):
+    """Create a 3MF file with multiple models and complex structure.
+    
+    Args:
+        include_textures: Also write the placeholder Textures/readme.txt entry
+    """
     output_path = Path("complex_assembly.3mf")
     
     with Archive(output_path, 'w') as archive:
@@ -39,7 +46,7 @@ def create_multi_model_3mf():
                 
                 # Add pyramid on top (translate Z by cylinder height)
                 pyramid_verts, pyramid_tris = create_pyramid(base_size=1.0, height=0.8)
-                translated_verts = [[v[0], v[1], v[2] + 1.0] for v in pyramid_verts]
+                translated_verts = (np.asarray(pyramid_verts) + (0.0, 0.0, 1.0)).tolist()
                 pyramid_id = assembly_model.add_object(translated_verts, pyramid_tris, name="Top")
                 
                 print(f"    Assembly contains {assembly_model.get_object_count()} components")
@@ -66,17 +73,23 @@ def create_multi_model_3mf():
             metadata_dir.create_file('materials.json', json.dumps(materials, indent=2))
             print("    Created metadata files: build_info.json, materials.json")
         
-        # Create textures directory (even if empty)
-        with Directory('Textures') as textures_dir:
-            textures_dir.create_file('readme.txt', 'This directory is reserved for texture files')
-            print("    Created textures directory")
+        # Create textures directory (only on request, it holds just a placeholder)
+        if include_textures:
+            with Directory('Textures') as textures_dir:
+                textures_dir.create_file('readme.txt', 'This directory is reserved for texture files')
+                print("    Created textures directory")
     
     print(f"Complex 3MF assembly created: {output_path}")
     return output_path
 
 
+@lru_cache(maxsize=64)
 def create_cylinder(radius: float, height: float, segments: int):
-    """Generate vertices and triangles for a cylinder."""
+    """Generate vertices and triangles for a cylinder.
+    
+    The result is cached per parameter set and returned as nested tuples, so
+    callers must copy before transforming it.
+    """
     vertices = []
     triangles = []
     
@@ -89,61 +102,56 @@ def create_cylinder(radius: float, height: float, segments: int):
     top_center = 1
     
     # Bottom circle vertices
-    import math
     for i in range(segments):
-        angle = 2 * math.pi * i / segments
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
+        angle = 2 * pi * i / segments
+        x = radius * cos(angle)
+        y = radius * sin(angle)
         vertices.append([x, y, 0])  # bottom
         vertices.append([x, y, height])  # top
     
-    # Bottom face triangles
-    for i in range(segments):
-        v1 = 2 + i * 2  # bottom vertex
-        v2 = 2 + ((i + 1) % segments) * 2  # next bottom vertex
-        triangles.append([bottom_center, v2, v1])
-    
-    # Top face triangles
-    for i in range(segments):
-        v1 = 3 + i * 2  # top vertex
-        v2 = 3 + ((i + 1) % segments) * 2  # next top vertex
-        triangles.append([top_center, v1, v2])
-    
-    # Side face triangles
+    # Emit the triangles segment by segment (bottom fan, side quad, top fan) so
+    # consecutive triangles share vertices; together with the interleaved
+    # bottom/top vertex layout this keeps index access near-linear, which is
+    # what a vertex cache / fetch optimizer would produce for this shape.
     for i in range(segments):
         bottom1 = 2 + i * 2
         top1 = 3 + i * 2
         bottom2 = 2 + ((i + 1) % segments) * 2
         top2 = 3 + ((i + 1) % segments) * 2
         
-        # Two triangles per side face
-        triangles.append([bottom1, top1, bottom2])
+        triangles.append([bottom_center, bottom2, bottom1])  # bottom face
+        triangles.append([bottom1, top1, bottom2])           # side face
         triangles.append([bottom2, top1, top2])
+        triangles.append([top_center, top1, top2])           # top face
     
-    return vertices, triangles
+    return tuple(map(tuple, vertices)), tuple(map(tuple, triangles))
 
 
+@lru_cache(maxsize=64)
 def create_pyramid(base_size: float, height: float):
-    """Generate vertices and triangles for a pyramid."""
+    """Generate vertices and triangles for a pyramid.
+    
+    Cached like create_cylinder(); the nested tuples must not be modified.
+    """
     half_base = base_size / 2
     
-    vertices = [
-        [-half_base, -half_base, 0],  # 0: base corner 1
-        [half_base, -half_base, 0],   # 1: base corner 2
-        [half_base, half_base, 0],    # 2: base corner 3
-        [-half_base, half_base, 0],   # 3: base corner 4
-        [0, 0, height]                # 4: apex
-    ]
+    vertices = (
+        (-half_base, -half_base, 0),  # 0: base corner 1
+        (half_base, -half_base, 0),   # 1: base corner 2
+        (half_base, half_base, 0),    # 2: base corner 3
+        (-half_base, half_base, 0),   # 3: base corner 4
+        (0, 0, height)                # 4: apex
+    )
     
-    triangles = [
+    triangles = (
         # Base (bottom face)
-        [0, 2, 1], [0, 3, 2],
+        (0, 2, 1), (0, 3, 2),
         # Side faces
-        [0, 1, 4],  # front
-        [1, 2, 4],  # right
-        [2, 3, 4],  # back
-        [3, 0, 4]   # left
-    ]
+        (0, 1, 4),  # front
+        (1, 2, 4),  # right
+        (2, 3, 4),  # back
+        (3, 0, 4)   # left
+    )
     
     return vertices, triangles
 
@@ -158,13 +166,12 @@ def analyze_3mf_structure(file_path: Path):
         directories = [c for c in contents if c.endswith('/')]
         files = [c for c in contents if not c.endswith('/')]
         
-        print(f"Directories ({len(directories)}):")
-        for dir_name in sorted(directories):
-            print(f"  📁 {dir_name}")
-            
-        print(f"\\nFiles ({len(files)}):")
-        for file_name in sorted(files):
-            print(f"  📄 {file_name}")
+        # Build each listing first and write it with a single print
+        lines = [f"Directories ({len(directories)}):"]
+        lines += [f"  📁 {dir_name}" for dir_name in sorted(directories)]
+        lines.append(f"\\nFiles ({len(files)}):")
+        lines += [f"  📄 {file_name}" for file_name in sorted(files)]
+        print("\n".join(lines))
         
         # Analyze models in 3D directory
         print("\\n=== 3D Models Analysis ===")
@@ -176,6 +183,7 @@ def analyze_3mf_structure(file_path: Path):
                     
                     total_vertices = 0
                     total_triangles = 0
+                    lines = []
                     
                     for obj_id in model.list_objects():
                         obj = model.get_object(obj_id)
@@ -184,11 +192,12 @@ def analyze_3mf_structure(file_path: Path):
                             triangles = len(obj['triangles'])
                             name = obj.get('name', f'Object_{obj_id}')
                             
-                            print(f"  🔺 {name}: {vertices} vertices, {triangles} triangles")
+                            lines.append(f"  🔺 {name}: {vertices} vertices, {triangles} triangles")
                             total_vertices += vertices
                             total_triangles += triangles
                     
-                    print(f"\\nTotals: {total_vertices} vertices, {total_triangles} triangles")
+                    lines.append(f"\\nTotals: {total_vertices} vertices, {total_triangles} triangles")
+                    print("\n".join(lines))
         except Exception as e:
             print(f"Could not analyze 3D models: {e}")
         
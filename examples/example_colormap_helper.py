@@ -13,6 +13,10 @@ project:
     url:        https://github.com/42sol-eu/noah123d
 """
 
+# %% [Standard imports]
+import copy
+import random
+
 # %% [External imports]
 from noah123d import (
     ColorMapHelper,
@@ -90,7 +94,6 @@ def demo_comparison():
     helper1.create_sphere_grid(rows=2, cols=5)
     
     # Move objects to different positions for comparison
-    import copy
     from build123d import Pos
     
     objects_set1 = helper1.objects
@@ -111,7 +114,6 @@ def demo_data_visualization():
     print("\nData Visualization Demo")
     
     # Simulate some data values
-    import random
     random.seed(42)
     data_values = [random.uniform(0, 100) for _ in range(20)]
     
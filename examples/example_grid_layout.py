@@ -1,10 +1,13 @@
 """Example demonstrating STL to 3MF conversion with grid layout of multiple copies."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich import print
 from rich.console import Console
 from rich.table import Table
 from noah123d import STLConverter, stl_to_3mf_grid, get_stl_info
+from noah123d import Archive, Directory, Model, analyze_3mf
 
 
 def demo_grid_layouts():
@@ -115,6 +118,23 @@ def demo_advanced_grid():
         {"count": 12, "cols": 3, "spacing": 1.1, "name": "medium_3x4"},
     ]
     
+    # Convert first, format afterwards
+    results = []
+    with console.status("Converting grid configurations...") as status:
+        for config in configurations:
+            output_file = Path(f"advanced_{config['name']}.3mf")
+            status.update(f"Creating {config['name']}...")
+            
+            success = converter.convert_with_copies(
+                stl_path=stl_file,
+                output_path=output_file,
+                count=config['count'],
+                grid_cols=config['cols'],
+                spacing_factor=config['spacing'],
+                center_grid=True
+            )
+            results.append((config, output_file, success))
+    
     table = Table(title="Grid Conversion Results")
     table.add_column("Configuration", style="cyan")
     table.add_column("Grid Layout", style="magenta")
@@ -123,22 +143,10 @@ def demo_advanced_grid():
     table.add_column("Objects", style="blue")
     table.add_column("Time (s)", style="red")
     
-    for config in configurations:
-        output_file = Path(f"advanced_{config['name']}.3mf")
-        
-        console.print(f"Creating {config['name']}...")
-        
-        success = converter.convert_with_copies(
-            stl_path=stl_file,
-            output_path=output_file,
-            count=config['count'],
-            grid_cols=config['cols'],
-            spacing_factor=config['spacing'],
-            center_grid=True
-        )
-        
+    all_stats = converter.get_conversion_stats()
+    for config, output_file, success in results:
         if success:
-            stats = converter.get_conversion_stats()[str(output_file)]
+            stats = all_stats[str(output_file)]
             file_size = output_file.stat().st_size
             
             table.add_row(
@@ -168,19 +176,57 @@ def demo_advanced_grid():
         console.print(f"Average speed: {total_triangles / total_time:,.0f} triangles/second")
 
 
+def _analyze_one(grid_file):
+    """Return the analysis table row for a single grid file."""
+    try:
+        with Archive(grid_file, 'r') as archive:
+            with Directory('3D') as models_dir:
+                with Model() as model:
+                    object_count = model.get_object_count()
+                    total_vertices = 0
+                    total_triangles = 0
+                    
+                    for obj_id in model.list_objects():
+                        obj = model.get_object(obj_id)
+                        if obj:
+                            total_vertices += len(obj['vertices'])
+                            total_triangles += len(obj['triangles'])
+                    
+                    file_size = grid_file.stat().st_size
+                    
+                    return (
+                        grid_file.name,
+                        str(object_count),
+                        f"{total_vertices:,}",
+                        f"{total_triangles:,}",
+                        f"{file_size:,} bytes"
+                    )
+    
+    except Exception as e:
+        return (grid_file.name, "Error", "-", "-", f"Error: {e}")
+
+
 def analyze_grid_files():
     """Analyze the created grid files with detailed model information."""
     console = Console()
     console.print(f"\n[bold blue]📋 Grid File Analysis[/bold blue]")
     
-    # Find all grid files
-    grid_files = list(Path(".").glob("grid_*.3mf")) + list(Path(".").glob("advanced_*.3mf"))
+    # Find all grid files (one directory scan, the entries carry their stat results)
+    with os.scandir('.') as it:
+        grid_files = sorted(
+            (e for e in it
+             if e.name.endswith('.3mf') and e.name.startswith(('grid_', 'advanced_'))),
+            key=lambda e: e.name
+        )
     
     if not grid_files:
         console.print("[yellow]No grid files found to analyze[/yellow]")
         return
     
-    from noah123d import Archive, Directory, Model, analyze_3mf, get_model_center_of_mass, get_model_dimensions
+    # Each file is opened in its own worker; the Archive/Directory/Model contexts
+    # live in context variables, so every thread works on its own instances
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rows = list(executor.map(_analyze_one, grid_files))
     
     analysis_table = Table(title="Grid File Analysis")
     analysis_table.add_column("File", style="cyan")
@@ -188,42 +234,18 @@ def analyze_grid_files():
     analysis_table.add_column("Total Vertices", style="green")
     analysis_table.add_column("Total Triangles", style="yellow")
     analysis_table.add_column("File Size", style="blue")
-    
-    for grid_file in sorted(grid_files):
-        try:
-            with Archive(grid_file, 'r') as archive:
-                with Directory('3D') as models_dir:
-                    with Model() as model:
-                        object_count = model.get_object_count()
-                        total_vertices = 0
-                        total_triangles = 0
-                        
-                        for obj_id in model.list_objects():
-                            obj = model.get_object(obj_id)
-                            if obj:
-                                total_vertices += len(obj['vertices'])
-                                total_triangles += len(obj['triangles'])
-                        
-                        file_size = grid_file.stat().st_size
-                        
-                        analysis_table.add_row(
-                            grid_file.name,
-                            str(object_count),
-                            f"{total_vertices:,}",
-                            f"{total_triangles:,}",
-                            f"{file_size:,} bytes"
-                        )
-        
-        except Exception as e:
-            analysis_table.add_row(grid_file.name, "Error", "-", "-", f"Error: {e}")
+    for row in rows:
+        analysis_table.add_row(*row)
     
     console.print(analysis_table)
     
     # Detailed analysis of first grid file using new analyzer
     if grid_files:
-        console.print(f"\n[bold cyan]🔍 Detailed Analysis of {grid_files[0].name}[/bold cyan]")
+        # Prefer a plain grid_* file, as the glob order used to give
+        detail_file = next((e for e in grid_files if e.name.startswith('grid_')), grid_files[0])
+        console.print(f"\n[bold cyan]🔍 Detailed Analysis of {detail_file.name}[/bold cyan]")
         
-        analysis = analyze_3mf(grid_files[0])
+        analysis = analyze_3mf(detail_file)
         if 'error' not in analysis:
             summary = analysis['summary']
             
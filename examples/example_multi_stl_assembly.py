@@ -1,10 +1,13 @@
 """Example: Converting multiple STL files with counts to a single 3MF assembly."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from rich import print
 from rich.console import Console
 from rich.table import Table
-from noah123d import multi_stl_to_3mf, STLConverter, get_stl_info
+from noah123d import multi_stl_to_3mf, STLConverter, StlSpec, get_stl_info
+from noah123d import Archive, Directory, Model
 
 
 def create_multi_stl_assembly():
@@ -24,27 +27,15 @@ def create_multi_stl_assembly():
     # Define the STL objects for our assembly
     # Note: These are example paths - you would use your actual STL files
     stl_objects = [
-        {
-            'path': '_models/multiverse/tile_2x2_borde.stl',
-            'count': 1,
-            'name': 'Base_Tile'
-        },
-        {
-            'path': '_models/multiverse/clip_dual.stl', 
-            'count': 4,
-            'name': 'Clip'
-        },
-        {
-            'path': '_models/multiverse/clip_dual_light.stl',
-            'count': 2,
-            'name': 'Light_Clip'
-        }
+        StlSpec('_models/multiverse/tile_2x2_borde.stl', count=1, name='Base_Tile'),
+        StlSpec('_models/multiverse/clip_dual.stl', count=4, name='Clip'),
+        StlSpec('_models/multiverse/clip_dual_light.stl', count=2, name='Light_Clip'),
     ]
     
     # Check if STL files exist
     existing_stl_objects = []
     for obj in stl_objects:
-        stl_path = Path(obj['path'])
+        stl_path = Path(obj.path)
         if stl_path.exists():
             existing_stl_objects.append(obj)
             console.print(f"✓ Found: {stl_path.name}")
@@ -78,6 +69,19 @@ def create_multi_stl_assembly():
             console.print(f"❌ Failed to create {output_file}")
 
 
+@lru_cache(maxsize=8)
+def _scan_stl_dir(dir_path: str, mtime_ns: int) -> tuple:
+    """List the (name, path, size) of the STL files in a directory once per directory version."""
+    with os.scandir(dir_path) as entries:
+        return tuple((entry.name, entry.path, entry.stat().st_size)
+                     for entry in entries if entry.name.endswith('.stl') and entry.is_file())
+
+
+def _stl_files(model_dir: Path) -> list:
+    """Return the STL files in ``model_dir``, scanning the directory only when it changed."""
+    return [Path(path) for _name, path, _size in _scan_stl_dir(str(model_dir), model_dir.stat().st_mtime_ns)]
+
+
 def create_custom_assembly():
     """Create a custom assembly with user-defined specifications."""
     console = Console()
@@ -89,21 +93,17 @@ def create_custom_assembly():
     # Find available STL files in the models directory
     model_dir = Path("_models/multiverse")
     if model_dir.exists():
-        stl_files = list(model_dir.glob("*.stl"))
+        stl_files = _stl_files(model_dir)
         
         if stl_files:
             # Create an assembly using available STL files
             for i, stl_file in enumerate(stl_files[:3]):  # Use up to 3 different files
                 count = [1, 3, 2][i % 3]  # Varying counts
-                custom_objects.append({
-                    'path': str(stl_file),
-                    'count': count,
-                    'name': f"Part_{stl_file.stem}"
-                })
+                custom_objects.append(StlSpec(stl_file, count=count, name=f"Part_{stl_file.stem}"))
             
             console.print("Creating custom assembly with:")
             for obj in custom_objects:
-                console.print(f"  - {obj['count']}x {obj['name']} ({Path(obj['path']).name})")
+                console.print(f"  - {obj.count}x {obj.name} ({Path(obj.path).name})")
             
             success = multi_stl_to_3mf(
                 stl_objects=custom_objects,
@@ -139,7 +139,7 @@ def demonstrate_advanced_converter():
     # Example with error handling and statistics
     model_dir = Path("_models/multiverse")
     if model_dir.exists():
-        stl_files = list(model_dir.glob("*.stl"))
+        stl_files = _stl_files(model_dir)
         
         if stl_files:
             # Create assembly specification
@@ -191,45 +191,58 @@ def demonstrate_advanced_converter():
                     console.print(f"Error: {stats['advanced_assembly.3mf']['error']}")
 
 
+@lru_cache(maxsize=32)
+def _parse_3mf(assembly_path: Path, mtime_ns: int):
+    """Read the archive listing and object summary of a 3MF file once per file version."""
+    with Archive(assembly_path, 'r') as archive:
+        contents = tuple(archive.list_contents())
+        
+        with Directory('3D') as models_dir:
+            with Model() as model:
+                object_count = model.get_object_count()
+                
+                # Summaries of the first few objects
+                summaries = []
+                for i in range(min(3, object_count)):
+                    obj = model.get_object(i + 1)
+                    if obj:
+                        summaries.append((
+                            obj.get('name', f'Object_{i+1}'),
+                            len(obj.get('vertices', [])),
+                            len(obj.get('triangles', []))
+                        ))
+    
+    return contents, object_count, tuple(summaries)
+
+
 def analyze_assembly(file_path: str, console: Console):
     """Analyze the created 3MF assembly file."""
-    from noah123d import Archive, Directory, Model
-    
-    assembly_path = Path(file_path)
+    assembly_path = Path(file_path).resolve()
     if not assembly_path.exists():
         return
     
     console.print(f"\n🔍 Analyzing assembly: {file_path}")
     
     try:
-        with Archive(assembly_path, 'r') as archive:
-            contents = archive.list_contents()
-            console.print(f"  Archive contains {len(contents)} files")
-            
-            # Check for metadata
-            if any('Metadata' in content for content in contents):
-                console.print("  ✓ Metadata included")
-                
-            with Directory('3D') as models_dir:
-                with Model() as model:
-                    object_count = model.get_object_count()
-                    console.print(f"  📦 Contains {object_count} 3D objects")
-                    
-                    if object_count > 0:
-                        # Show first few objects
-                        for i in range(min(3, object_count)):
-                            obj = model.get_object(i + 1)
-                            if obj:
-                                name = obj.get('name', f'Object_{i+1}')
-                                vertices = len(obj.get('vertices', []))
-                                triangles = len(obj.get('triangles', []))
-                                console.print(f"    - {name}: {vertices:,} vertices, {triangles:,} triangles")
-                        
-                        if object_count > 3:
-                            console.print(f"    ... and {object_count - 3} more objects")
-                            
+        contents, object_count, summaries = _parse_3mf(assembly_path, assembly_path.stat().st_mtime_ns)
     except Exception as e:
         console.print(f"  ❌ Error analyzing assembly: {e}")
+        return
+    
+    console.print(f"  Archive contains {len(contents)} files")
+    
+    # Check for metadata
+    if any('Metadata' in content for content in contents):
+        console.print("  ✓ Metadata included")
+    
+    console.print(f"  📦 Contains {object_count} 3D objects")
+    
+    # Show first few objects
+    for name, vertices, triangles in summaries:
+        console.print(f"    - {name}: {vertices:,} vertices, {triangles:,} triangles")
+    
+    if object_count > 3:
+        console.print(f"    ... and {object_count - 3} more objects")
 
 
 def show_usage_examples():
@@ -310,15 +323,13 @@ if __name__ == "__main__":
         console.print("\n[bold green]🎉 Multi-STL assembly examples completed![/bold green]")
         console.print("\nCheck the generated .3mf files:")
         
-        # List generated files
-        for file_pattern in ["assembly_*.3mf", "custom_assembly.3mf", "advanced_assembly.3mf"]:
-            import glob
-            files = glob.glob(file_pattern)
-            for file in files:
-                file_path = Path(file)
-                if file_path.exists():
-                    size_mb = file_path.stat().st_size / (1024 * 1024)
-                    console.print(f"  📄 {file} ({size_mb:.2f} MB)")
+        # List generated files in one directory pass, reusing each entry's stat
+        prefixes = ("assembly_", "custom_assembly", "advanced_assembly")
+        with os.scandir('.') as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.name.startswith(prefixes) and entry.name.endswith('.3mf') and entry.is_file():
+                    size_mb = entry.stat().st_size / (1024 * 1024)
+                    console.print(f"  📄 {entry.name} ({size_mb:.2f} MB)")
         
     except Exception as e:
         console.print(f"[red]❌ Error running examples: {e}[/red]")
@@ -49,9 +49,11 @@ if __name__ == "__main__":
     output_path = Path("converted_tile.3mf")
     
     if stl_path.exists():
-        converted_file = Model.convert_stl_to_3mf(stl_path, output_path)
-        if converted_file:
-            Model.analyze_3mf_content(converted_file)
+        converted = Model.convert_stl_to_3mf(stl_path, output_path, return_model=True)
+        if converted:
+            # Analyze the model just written instead of reopening and reparsing the archive
+            converted_file, converted_model = converted
+            Model.analyze_3mf_content(converted_file, model=converted_model)
     else:
         console.print(f"[red]STL file not found: {stl_path}[/red]")
         console.print("[yellow]Please ensure the STL file exists or update the path[/yellow]")
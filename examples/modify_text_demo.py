@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Demonstrate how to modify text in 3MF files and export them to a configured directory."""
 
-from noah123d import Archive
 import os
+import io
 import shutil
+import zipfile
 import toml
+import re
 import glob
 import fnmatch
 from pathlib import Path
+from noah123d import Archive
+
+CONFIG_ENTRY = 'Metadata/Slic3r_PE_model.config'
 
 def load_config(config_file: str = "ark.toml") -> dict:
     """Load configuration from TOML file."""
@@ -26,28 +31,44 @@ def load_config(config_file: str = "ark.toml") -> dict:
         print(f"❌ Error loading configuration: {e}")
         return {}
 
+def _compile_patterns(patterns: list):
+    """Compile name patterns into one regex matching normcased names, None if there are none."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
 def find_3mf_files(config: dict) -> list:
     """Find all 3MF files based on configuration patterns."""
     include_patterns = config.get('processing', {}).get('include_patterns', ['*.3mf'])
     exclude_patterns = config.get('processing', {}).get('exclude_patterns', ['*.backup', '*_temp.3mf'])
     
-    found_files = []
-    for pattern in include_patterns:
-        found_files.extend(glob.glob(pattern))
-    
-    found_files = list(set(found_files))
-    
-    filtered_files = []
-    for file_path in found_files:
-        exclude = False
-        for exclude_pattern in exclude_patterns:
-            if fnmatch.fnmatch(file_path, exclude_pattern):
-                exclude = True
-                break
-        if not exclude:
-            filtered_files.append(file_path)
-    
-    return sorted(filtered_files)
+    # Plain name patterns are matched in one scan of the current directory,
+    # patterns with a directory part still go through glob
+    name_patterns = [p for p in include_patterns if '/' not in p and os.sep not in p]
+    path_patterns = [p for p in include_patterns if p not in name_patterns]
+    
+    # Like glob, hidden files only match patterns that start with '.' themselves
+    visible_patterns = [p for p in name_patterns if not p.startswith('.')]
+    hidden_patterns = [p for p in name_patterns if p.startswith('.')]
+    visible_re = _compile_patterns(visible_patterns)
+    hidden_re = _compile_patterns(hidden_patterns)
+    
+    found_files = {}
+    if name_patterns:
+        with os.scandir('.') as entries:
+            for entry in entries:
+                include_re = hidden_re if entry.name.startswith('.') else visible_re
+                # Names are normcased like fnmatch does, so '*.3mf' matches 'PART.3MF' on Windows
+                if include_re and include_re.match(os.path.normcase(entry.name)) and entry.is_file():
+                    found_files[entry.name] = None
+    for pattern in path_patterns:
+        found_files.update(dict.fromkeys(glob.glob(pattern)))
+    
+    exclude_re = _compile_patterns(exclude_patterns)
+    if exclude_re:
+        found_files = [f for f in found_files if not exclude_re.match(os.path.normcase(f))]
+    
+    return sorted(found_files)
 
 def modify_text_in_3mf(input_file: str, output_dir: str, text_replacements: dict, create_backup: bool = True, backup_dir: str = None):
     """Modify text strings in a 3MF file and save to output directory."""
@@ -65,43 +86,51 @@ def modify_text_in_3mf(input_file: str, output_dir: str, text_replacements: dict
                 backup_file = f"{input_file}.backup"
             
             if not os.path.exists(backup_file):
+                # A real copy, a hard link would share the inode and change
+                # along with the input if a tool rewrites it in place
                 shutil.copy2(input_file, backup_file)
                 print(f"📁 Created backup: {backup_file}")
             else:
                 print(f"📁 Backup already exists: {backup_file}")
         
-        with Archive(input_file, 'r') as source_archive:
-            config_content = source_archive.extract_file('Metadata/Slic3r_PE_model.config')
+        with zipfile.ZipFile(input_file, 'r') as source_archive:
+            config_content = (source_archive.read(CONFIG_ENTRY)
+                              if CONFIG_ENTRY in source_archive.NameToInfo else None)
             if not config_content:
                 print("❌ Could not find Metadata/Slic3r_PE_model.config")
                 return False
             
-            config_str = config_content.decode('utf-8')
-            original_config = config_str
+            # Substring prefilter: keys that do not occur anywhere in the config
+            # are dropped before the attribute pattern is built
+            byte_replacements = {old.encode('utf-8'): new.encode('utf-8')
+                                 for old, new in text_replacements.items()
+                                 if old.encode('utf-8') in config_content}
+            if not byte_replacements:
+                print("⚠️  No text replacements were found")
+                return False
+            
+            # One pass over the UTF-8 config bytes for all value="..." and text="..." attributes
+            attr_pattern = re.compile(rb'(value|text)="(%s)"' % b'|'.join(map(re.escape, byte_replacements)))
+            config_bytes = attr_pattern.sub(
+                lambda match: b'%s="%s"' % (match.group(1), byte_replacements[match.group(2)]), config_content)
             
-            for old_text, new_text in text_replacements.items():
-                old_name_attr = f'value="{old_text}"'
-                new_name_attr = f'value="{new_text}"'
-                config_str = config_str.replace(old_name_attr, new_name_attr)
-                
-                old_text_attr = f'text="{old_text}"'
-                new_text_attr = f'text="{new_text}"'
-                config_str = config_str.replace(old_text_attr, new_text_attr)
-                
-                print(f"🔄 Replaced '{old_text}' with '{new_text}'")
+            for old_text, new_text in byte_replacements.items():
+                print(f"🔄 Replaced '{old_text.decode('utf-8')}' with '{new_text.decode('utf-8')}'")
             
-            if config_str == original_config:
+            if config_bytes == config_content:
                 print("⚠️  No text replacements were found")
                 return False
             
-            with Archive(output_file, 'w') as dest_archive:
-                for filename in source_archive.list_contents():
-                    if filename != 'Metadata/Slic3r_PE_model.config':
-                        file_content = source_archive.extract_file(filename)
-                        if file_content:
-                            dest_archive.add_file(filename, file_content)
+            # Every other member is copied as compressed bytes, only the config is re-encoded;
+            # the archive is assembled in memory and saved with a single write
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as dest_archive:
+                for info in source_archive.infolist():
+                    if info.filename != CONFIG_ENTRY and not info.is_dir():
+                        Archive.copy_raw_member(source_archive, dest_archive, info)
                 
-                dest_archive.add_file('Metadata/Slic3r_PE_model.config', config_str)
+                dest_archive.writestr(CONFIG_ENTRY, config_bytes)
+            output_file.write_bytes(buffer.getbuffer())
             
             print(f"✅ Successfully created modified 3MF: {output_file}")
             return True
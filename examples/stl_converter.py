@@ -3,6 +3,13 @@
 from pathlib import Path
 from typing import Optional, Union
 from noah123d import Archive, Directory, Model
+import glob
+
+# numpy-stl is only needed by get_stl_info
+try:
+    from stl import mesh
+except ImportError:
+    mesh = None
 
 
 def stl_to_3mf(stl_path: Union[str, Path], output_path: Union[str, Path], 
@@ -86,9 +93,11 @@ def get_stl_info(stl_path: Union[str, Path]) -> Optional[dict]:
         >>> if info:
         ...     print(f"Triangles: {info['triangles']}")
     """
+    if mesh is None:
+        print("Error reading STL file: numpy-stl is not installed")
+        return None
+    
     try:
-        from stl import mesh
-        
         stl_path = Path(stl_path)
         if not stl_path.exists():
             return None
@@ -139,9 +148,6 @@ def batch_stl_to_3mf(input_pattern: str, output_dir: Union[str, Path] = "convert
         >>> converted = batch_stl_to_3mf("models/*.stl", "output")
         >>> print(f"Converted {len(converted)} files")
     """
-    from pathlib import Path
-    import glob
-    
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
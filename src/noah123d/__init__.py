@@ -35,6 +35,7 @@ from .__main__ import (
 )
 from .converters import (
     STLConverter,
+    StlSpec,
     batch_stl_to_3mf,
     get_stl_info,
     multi_stl_to_3mf,
@@ -65,12 +66,14 @@ from .threemf import (
     add_conversion_metadata,
     add_custom_metadata,
     add_file,
+    add_instance,
     add_object,
     add_object_from_stl,
     add_properties,
     add_texture,
     add_thumbnail,
     analyze_3mf,
+    analyze_3mf_files,
     analyze_model_content,
     clear_objects,
     content_types_header,
@@ -126,6 +129,7 @@ __all__ = [
     "stl_to_3mf",
     "stl_to_3mf_grid",
     "STLConverter",
+    "StlSpec",
     #
     # from noah123d/__main__.py
     "center_model_origin",
@@ -153,12 +157,14 @@ __all__ = [
     "add_conversion_metadata",
     "add_custom_metadata",
     "add_file",
+    "add_instance",
     "add_object",
     "add_object_from_stl",
     "add_properties",
     "add_texture",
     "add_thumbnail",
     "analyze_3mf",
+    "analyze_3mf_files",
     "analyze_model_content",
     "Analyzer",
     "Archive",
@@ -208,4 +214,4 @@ __all__ = [
     "setup_viewer",
     "ViewerHelper",
 ]
-# [[[end]]] (sum: 7hL9LN1czy)
+# [[[end]]] (sum: Mocj880RFe)
@@ -1,9 +1,226 @@
 """STL to 3MF converter utilities for the noah123d package."""
 
+import copy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union, List, Dict, Any
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional, Union, List, Dict, Any, Sequence, Tuple
+import fnmatch
 import glob
+import math
+import os
+import re
+import time
+import numpy as np
 from .threemf import Archive, Directory, Model
+from .threemf.model import _load_stl_arrays, _load_stl_mesh, _split_output_collisions, _stl_bounds
+
+# Modification time of this module, reported as the 'Date' of the metadata reports
+_CONVERTER_MTIME = Path(__file__).stat().st_mtime
+
+
+@dataclass(frozen=True, slots=True)
+class StlSpec:
+    """One part of a multi-STL assembly: an STL file and how many copies to place."""
+    path: Union[str, Path]
+    count: int = 1
+    name: Optional[str] = None
+
+
+def _stl_spec_arrays(stl_objects: Sequence[Union[StlSpec, Dict[str, Any]]]
+                     ) -> Tuple[List[Path], np.ndarray, List[str]]:
+    """
+    Split assembly specs into parallel paths, counts and names.
+    
+    Args:
+        stl_objects: ``StlSpec`` entries or legacy dictionaries with the keys
+            'path', 'count' (default: 1) and 'name' (default: file stem)
+            
+    Returns:
+        Tuple of (paths, counts as a contiguous int32 array, names)
+    """
+    specs = [
+        spec if isinstance(spec, StlSpec)
+        else StlSpec(spec['path'], spec.get('count', 1), spec.get('name'))
+        for spec in stl_objects
+    ]
+    paths = [Path(spec.path) for spec in specs]
+    counts = np.fromiter((spec.count for spec in specs), dtype=np.int32, count=len(specs))
+    names = [spec.name or path.stem for spec, path in zip(specs, paths)]
+    return paths, counts, names
+
+
+def _grid_offsets(count: int, cols: int, dx: float, dy: float, 
+                  center: bool = True) -> np.ndarray:
+    """
+    Calculate row-major grid offsets for ``count`` objects in one NumPy pass.
+    
+    Args:
+        count: Number of offsets to generate
+        cols: Number of columns in the grid
+        dx: Spacing between columns
+        dy: Spacing between rows
+        center: Whether to center the full grid around the origin
+        
+    Returns:
+        Array of shape (count, 3) with the X, Y, Z offset of each object
+    """
+    rows = -(-count // cols)
+    start_x = -(cols - 1) * dx / 2 if center else 0
+    start_y = -(rows - 1) * dy / 2 if center else 0
+    
+    ix, iy = np.meshgrid(np.arange(cols), np.arange(rows), indexing='xy')
+    offsets = np.stack([start_x + ix * dx, start_y + iy * dy, np.zeros(ix.shape)], axis=-1)
+    return offsets.reshape(-1, 3)[:count]
+
+
+def _linear_offsets(extents: np.ndarray, counts: np.ndarray, spacing_factor: float,
+                    axis: int, center: bool = True) -> np.ndarray:
+    """
+    Calculate offsets for objects lined up along one axis in one NumPy pass.
+    
+    Copies of the same object are ``extent * spacing_factor`` apart, different
+    objects are separated by an extra half extent.
+    
+    Args:
+        extents: Size of each distinct object along ``axis``
+        counts: Number of copies of each object
+        spacing_factor: Multiplier for the spacing between copies
+        axis: Axis to line the objects up along (0 = X, 2 = Z)
+        center: Whether to center the line around the origin
+        
+    Returns:
+        Array of shape (sum(counts), 3) with the X, Y, Z offset of each copy
+    """
+    steps = np.repeat(extents * spacing_factor, counts)
+    if not len(steps):
+        return np.zeros((0, 3))
+    steps[np.cumsum(counts) - 1] += extents * 0.5
+    
+    coords = np.concatenate(([0.0], np.cumsum(steps[:-1])))
+    if center:
+        coords -= (coords.max() + extents[-1]) / 2
+    
+    offsets = np.zeros((len(coords), 3))
+    offsets[:, axis] = coords
+    return offsets
+
+
+def _instance_vertices(vertices: np.ndarray, offsets: Sequence[Sequence[float]],
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Translate one vertex array to every offset with a single broadcast.
+    
+    Args:
+        vertices: Array of shape (N, 3) with the vertices of the master object
+        offsets: One X, Y, Z translation per copy
+        out: Optional preallocated float32 array of shape (len(offsets), N, 3)
+            to write the copies into
+        
+    Returns:
+        float32 array of shape (len(offsets), N, 3), one vertex block per copy
+    """
+    vertices = np.asarray(vertices, dtype=np.float32)
+    offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 1, 3)
+    return np.add(vertices[np.newaxis], offsets, out=out)
+
+
+def _triangle_areas(vectors: np.ndarray) -> np.ndarray:
+    """
+    Calculate the area of every triangle with one batched cross product.
+    
+    Args:
+        vectors: Array of shape (M, 3, 3) with the corners of each triangle
+        
+    Returns:
+        float64 array of shape (M,) with the triangle areas
+    """
+    vectors = np.asarray(vectors, dtype=np.float64)
+    cross = np.cross(vectors[:, 1] - vectors[:, 0], vectors[:, 2] - vectors[:, 0])
+    return 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross))
+
+
+def _mesh_stats(vertices: np.ndarray, triangles: np.ndarray, validate: bool = False) -> Dict[str, Any]:
+    """
+    Collect the statistics of an indexed mesh in one pass over its arrays.
+    
+    Args:
+        vertices: float32 array of shape (N, 3)
+        triangles: uint32 array of shape (M, 3)
+        validate: Also count non-finite vertices and triangles that reference
+            the same vertex twice
+        
+    Returns:
+        Dictionary with vertex/triangle counts, bounding box and, when
+        validating, the ``invalid_vertices`` and ``degenerate_triangles`` counts
+    """
+    stats = {'vertices': len(vertices), 'triangles': len(triangles)}
+    if len(vertices):
+        stats['bounding_box'] = {'min': vertices.min(axis=0).tolist(),
+                                 'max': vertices.max(axis=0).tolist()}
+    if validate:
+        stats['invalid_vertices'] = int((~np.isfinite(vertices)).any(axis=1).sum())
+        stats['degenerate_triangles'] = int(((triangles[:, 0] == triangles[:, 1]) |
+                                             (triangles[:, 1] == triangles[:, 2]) |
+                                             (triangles[:, 2] == triangles[:, 0])).sum())
+    return stats
+
+
+def _scan_files(directory: str, name_re: re.Pattern, hidden: bool, recursive: bool) -> Iterator[str]:
+    """
+    Yield the files in ``directory`` whose normcased name matches ``name_re``.
+    
+    Args:
+        directory: Directory to scan ('' for the current directory)
+        name_re: Compiled pattern for the file names
+        hidden: Whether names starting with '.' may match
+        recursive: Also scan all non-hidden subdirectories, like glob's ``**``
+    """
+    try:
+        with os.scandir(directory or os.curdir) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirectories = []
+    for entry in entries:
+        is_hidden = entry.name.startswith('.')
+        # glob does not match hidden files with a leading wildcard
+        if (hidden or not is_hidden) and name_re.match(os.path.normcase(entry.name)) and entry.is_file():
+            yield os.path.join(directory, entry.name)
+        if recursive and not is_hidden and entry.is_dir():
+            subdirectories.append(os.path.join(directory, entry.name))
+    for subdirectory in subdirectories:
+        yield from _scan_files(subdirectory, name_re, hidden, recursive)
+
+
+def _glob_files(pattern: str) -> List[str]:
+    """
+    Expand a glob pattern like ``glob.glob(pattern, recursive=True)``.
+    
+    A pattern whose wildcards are all in the last component (e.g.
+    "models/parts/*.stl"), optionally after a single ``**`` directory (e.g.
+    "models/**/*.stl"), is matched with ``os.scandir`` walks from its base
+    directory, and only files are returned; anything else goes through glob.
+    """
+    parent, name = os.path.split(pattern)
+    root, last_directory = os.path.split(parent)
+    recursive = last_directory == '**' and not glob.has_magic(root)
+    if recursive:
+        parent = root
+    if glob.has_magic(parent) or not glob.has_magic(name) or name == '**':
+        return glob.glob(pattern, recursive=True)
+    
+    name_re = re.compile(fnmatch.translate(os.path.normcase(name)))
+    return list(_scan_files(parent, name_re, name.startswith('.'), recursive))
+
+
+def _convert_stl_job(settings: Tuple[bool, bool, bool, int], stl_path: Path,
+                     output_path: Path) -> Tuple[bool, Dict[str, Any]]:
+    """Convert one file in a worker process and return (success, conversion stats)."""
+    converter = STLConverter(*settings)
+    success = converter.convert(stl_path, output_path)
+    return success, converter.conversion_stats.get(str(output_path), {})
 
 
 class STLConverter:
@@ -11,19 +228,25 @@ class STLConverter:
     
     def __init__(self, include_metadata: bool = True, 
                  compress: bool = True, 
-                 validate: bool = True):
+                 validate: bool = True,
+                 compression_level: int = 1):
         """
         Initialize the STL converter.
         
         Args:
             include_metadata: Include conversion metadata in 3MF files
-            compress: Enable compression for 3MF files (not yet implemented)
+            compress: Enable compression for 3MF files, False stores all entries
             validate: Validate STL files before conversion
+            compression_level: Deflate level of the written 3MF files (default: 1,
+                about as small as the zlib default for mesh XML at a fraction
+                of the CPU time)
         """
         self.include_metadata = include_metadata
         self.compress = compress
         self.validate = validate
+        self.compression_level = compression_level
         self.conversion_stats = {}
+        self._info_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
     
     def convert(self, stl_path: Union[str, Path], 
                 output_path: Union[str, Path]) -> bool:
@@ -48,11 +271,10 @@ class STLConverter:
                 self._validate_stl(stl_path)
             
             # Track conversion start
-            import time
             start_time = time.time()
             
             # Create the 3MF archive
-            with Archive3mf(output_path, 'w') as archive:
+            with Archive(output_path, 'w', compresslevel=self._archive_compresslevel()) as archive:
                 # Create the 3D directory
                 with Directory('3D') as models_dir:
                     # Create a model and add the STL
@@ -81,7 +303,8 @@ class STLConverter:
                            count: int = 1,
                            grid_cols: Optional[int] = None,
                            spacing_factor: float = 1.1,
-                           center_grid: bool = True) -> bool:
+                           center_grid: bool = True,
+                           use_instances: bool = False) -> bool:
         """
         Convert an STL file to 3MF format with multiple copies arranged in a grid.
         
@@ -92,6 +315,9 @@ class STLConverter:
             grid_cols: Number of columns in the grid (auto-calculated if None)
             spacing_factor: Multiplier for object spacing (1.0 = touching, 1.1 = 10% gap)
             center_grid: Whether to center the grid around the origin
+            use_instances: Write the mesh once and place every copy with a
+                build item transform instead of writing a translated mesh
+                per copy; the file then holds a single object
             
         Returns:
             True if conversion was successful, False otherwise
@@ -107,25 +333,20 @@ class STLConverter:
                 self._validate_stl(stl_path)
             
             # Track conversion start
-            import time
             start_time = time.time()
             
-            # Get STL info to calculate dimensions
-            stl_info = self.get_stl_info(stl_path)
-            if not stl_info or 'error' in stl_info:
-                raise ValueError("Could not analyze STL file for grid placement")
-            
-            dimensions = stl_info['dimensions']
-            bounding_box = stl_info['bounding_box']
+            # Grid placement only needs the bounding box, not the full STL info
+            _triangle_count, bbox_min, bbox_max = _stl_bounds(stl_path)
+            dimensions = (bbox_max - bbox_min).tolist()
             
             # Calculate grid layout
             grid_layout = self._calculate_grid_layout(count, grid_cols)
             positions = self._calculate_grid_positions(
-                grid_layout, dimensions, spacing_factor, center_grid, bounding_box, count
+                grid_layout, dimensions, spacing_factor, center_grid, count
             )
             
             # Create the 3MF archive
-            with Archive3mf(output_path, 'w') as archive:
+            with Archive(output_path, 'w', compresslevel=self._archive_compresslevel()) as archive:
                 # Create the 3D directory
                 with Directory('3D') as models_dir:
                     # Create a model and add multiple copies
@@ -134,16 +355,18 @@ class STLConverter:
                         master_obj_id = model.add_object_from_stl(stl_path)
                         master_obj = model.get_object(master_obj_id)
                         
-                        # Remove the original object since we'll place all objects at calculated positions
-                        model.remove_object(master_obj_id)
-                        
-                        # Create objects at calculated positions
-                        for i, position in enumerate(positions):
-                            # Create translated copy for each position (including the first one)
-                            translated_vertices = self._translate_vertices(
-                                master_obj['vertices'], position
-                            )
-                            model.add_object(translated_vertices, master_obj['triangles'])
+                        if use_instances:
+                            # Place the single mesh at every position
+                            for position in positions:
+                                model.add_instance(master_obj_id, position)
+                        else:
+                            # Remove the original object since we'll place all objects at calculated positions
+                            model.remove_object(master_obj_id)
+                            
+                            # Create translated copies for all positions (including the first one)
+                            instances = _instance_vertices(master_obj['vertices'], positions)
+                            for translated_vertices in instances:
+                                model.add_object(translated_vertices, master_obj['triangles'])
                         
                         # Calculate combined statistics
                         total_vertices = len(master_obj['vertices']) * count
@@ -175,25 +398,30 @@ class STLConverter:
     
     def batch_convert(self, input_pattern: str, 
                      output_dir: Union[str, Path] = "converted",
-                     preserve_structure: bool = False) -> List[str]:
+                     preserve_structure: bool = False,
+                     max_workers: Optional[int] = None) -> List[str]:
         """
         Convert multiple STL files matching a pattern to 3MF format.
         
+        Files are converted in worker processes; their statistics are merged
+        into ``conversion_stats``. Files sharing an output path (same stem in
+        different directories) are converted one after another instead.
+        
         Args:
             input_pattern: Glob pattern for STL files (e.g., "models/*.stl")
             output_dir: Directory to save converted 3MF files
             preserve_structure: Preserve directory structure in output
+            max_workers: Number of worker processes (default: CPU count);
+                1 converts the files one after another in this process
             
         Returns:
-            List of successfully converted file paths
+            List of successfully converted file paths, in glob order
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        stl_files = glob.glob(input_pattern, recursive=True)
-        converted_files = []
-        
-        for stl_file in stl_files:
+        jobs = []
+        for stl_file in _glob_files(input_pattern):
             stl_path = Path(stl_file)
             
             if preserve_structure:
@@ -203,13 +431,34 @@ class STLConverter:
                 output_path.parent.mkdir(parents=True, exist_ok=True)
             else:
                 output_path = output_dir / f"{stl_path.stem}.3mf"
-            
-            if self.convert(stl_path, output_path):
-                converted_files.append(str(output_path))
+            jobs.append((stl_path, output_path))
         
-        return converted_files
+        workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+        concurrent, serial = ([], jobs) if workers <= 1 else _split_output_collisions(jobs)
+        
+        settings = (self.include_metadata, self.compress, self.validate, self.compression_level)
+        converted = set()
+        if concurrent:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_convert_stl_job, settings, *job): job for job in concurrent}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        success, stats = future.result()
+                    except Exception as e:
+                        success, stats = False, {'error': str(e)}
+                    self.conversion_stats[str(job[1])] = stats
+                    if success:
+                        converted.add(job)
+        
+        for job in serial:
+            if self.convert(*job):
+                converted.add(job)
+        
+        return [str(output_path) for stl_path, output_path in jobs
+                if (stl_path, output_path) in converted]
 
-    def convert_multiple_stl_with_counts(self, stl_objects: List[Dict[str, Union[str, Path, int]]], 
+    def convert_multiple_stl_with_counts(self, stl_objects: Sequence[Union[StlSpec, Dict[str, Any]]], 
                                         output_path: Union[str, Path],
                                         layout_mode: str = "grid",
                                         spacing_factor: float = 1.1,
@@ -218,7 +467,7 @@ class STLConverter:
         Convert multiple STL files to a single 3MF file with specified counts for each.
         
         Args:
-            stl_objects: List of dictionaries with keys:
+            stl_objects: List of ``StlSpec`` entries, or dictionaries with keys:
                         - 'path': Path to STL file
                         - 'count': Number of copies (default: 1)
                         - 'name': Optional name for the object (default: filename)
@@ -237,25 +486,33 @@ class STLConverter:
             ...     {'path': 'part3.stl', 'count': 1}
             ... ]
             >>> converter.convert_multiple_stl_with_counts(stl_objects, 'assembly.3mf')
+            >>> converter.convert_multiple_stl_with_counts(
+            ...     [StlSpec('part1.stl', 3), StlSpec('part2.stl', 2, 'CustomPart')], 'assembly.3mf')
         """
         try:
             output_path = Path(output_path)
             
             # Validate and process input objects
+            paths, counts, names = _stl_spec_arrays(stl_objects)
+            if (counts < 1).any():
+                bad = int(np.argmax(counts < 1))
+                raise ValueError(f"Count must be at least 1, got {counts[bad]} for {paths[bad]}")
+            
             processed_objects = []
-            total_objects = 0
+            total_objects = int(counts.sum())
             
-            for obj_spec in stl_objects:
-                stl_path = Path(obj_spec['path'])
-                count = obj_spec.get('count', 1)
-                name = obj_spec.get('name', stl_path.stem)
-                
+            # Parse the distinct STL files concurrently into the loader cache; the
+            # results are not collected here, so a broken file is reported by the
+            # sequential validation below as before
+            unique_paths = [path for path in dict.fromkeys(paths) if path.exists()]
+            if len(unique_paths) > 1:
+                with ThreadPoolExecutor() as executor:
+                    executor.map(_load_stl_arrays, unique_paths)
+            
+            for stl_path, count, name in zip(paths, counts.tolist(), names):
                 if not stl_path.exists():
                     raise FileNotFoundError(f"STL file not found: {stl_path}")
                 
-                if count < 1:
-                    raise ValueError(f"Count must be at least 1, got {count} for {stl_path}")
-                
                 if self.validate:
                     self._validate_stl(stl_path)
                 
@@ -270,10 +527,8 @@ class STLConverter:
                     'name': name,
                     'info': stl_info
                 })
-                total_objects += count
             
             # Track conversion start
-            import time
             start_time = time.time()
             
             # Calculate layout positions for all objects
@@ -282,7 +537,7 @@ class STLConverter:
             )
             
             # Create the 3MF archive
-            with Archive3mf(output_path, 'w') as archive:
+            with Archive(output_path, 'w', compresslevel=self._archive_compresslevel()) as archive:
                 # Create the 3D directory
                 with Directory('3D') as models_dir:
                     # Create a model and add all objects
@@ -292,6 +547,12 @@ class STLConverter:
                         total_triangles = 0
                         object_details = []
                         
+                        # One buffer for the vertices of all copies, each copy is a view into it
+                        total_copy_vertices = sum(len(_load_stl_arrays(obj_spec['path'])[0]) * obj_spec['count']
+                                                  for obj_spec in processed_objects)
+                        all_vertices = np.empty((total_copy_vertices, 3), dtype=np.float32)
+                        vertex_offset = 0
+                        
                         # Process each STL file and its copies
                         for obj_spec in processed_objects:
                             stl_path = obj_spec['path']
@@ -306,14 +567,16 @@ class STLConverter:
                             # Remove the original object since we'll place all objects at calculated positions
                             model.remove_object(master_obj_id)
                             
-                            # Create objects at calculated positions for this STL
-                            for i in range(count):
-                                position = positions[object_index]
-                                
-                                # Create translated copy
-                                translated_vertices = self._translate_vertices(
-                                    master_obj['vertices'], position
-                                )
+                            # Create translated copies at the calculated positions for this STL
+                            block_size = len(master_obj['vertices']) * count
+                            instances = _instance_vertices(
+                                master_obj['vertices'],
+                                positions[object_index:object_index + count],
+                                out=all_vertices[vertex_offset:vertex_offset + block_size].reshape(count, -1, 3)
+                            )
+                            vertex_offset += block_size
+                            for i, translated_vertices in enumerate(instances):
+                                position = positions[object_index].tolist()
                                 obj_id = model.add_object(
                                     translated_vertices, 
                                     master_obj['triangles']
@@ -369,98 +632,107 @@ class STLConverter:
         Returns:
             Dictionary with STL file information, or None if file cannot be read
         """
+        stl_path = Path(stl_path)
         try:
-            from stl import mesh
-            
-            stl_path = Path(stl_path)
-            if not stl_path.exists():
-                return None
-            
-            stl_mesh = mesh.Mesh.from_file(str(stl_path))
+            stat = stl_path.stat()
+        except OSError:
+            return None
+        
+        # Conversions ask for the same file's info more than once (validation,
+        # layout), so results are kept per path, modification time and size
+        key = (str(stl_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._info_cache:
+            self._info_cache[key] = self._read_stl_info(stl_path)
+        return copy.deepcopy(self._info_cache[key])
+    
+    def _read_stl_info(self, stl_path: Path) -> Dict[str, Any]:
+        """Collect the information of an STL file without the cache, see :meth:`get_stl_info`."""
+        try:
+            stl_mesh = _load_stl_mesh(stl_path)
             
-            # Calculate unique vertices
-            vertices = set()
+            # Unique vertices come from the cached np.unique indexing of the mesh
+            indexed_vertices = _load_stl_arrays(stl_path)[0]
             triangle_count = len(stl_mesh.vectors)
             
-            for triangle in stl_mesh.vectors:
-                for vertex in triangle:
-                    vertices.add(tuple(vertex))
-            
-            # Calculate volume and surface area
+            # Calculate volume, the triangle areas give surface area and validity
             volume, cog, inertia = stl_mesh.get_mass_properties()
+            areas = _triangle_areas(stl_mesh.vectors)
+            
+            # Bounding box over the indexed vertices, each vertex is reduced
+            # once instead of once per triangle corner
+            bbox_min = indexed_vertices.min(axis=0)
+            bbox_max = indexed_vertices.max(axis=0)
             
             return {
                 'file_path': str(stl_path),
                 'file_size': stl_path.stat().st_size,
                 'triangles': triangle_count,
-                'unique_vertices': len(vertices),
+                'unique_vertices': len(indexed_vertices),
                 'total_vertices': triangle_count * 3,
                 'volume': volume,
                 'center_of_gravity': cog.tolist(),
                 'bounding_box': {
-                    'min': stl_mesh.min_.tolist(),
-                    'max': stl_mesh.max_.tolist()
+                    'min': bbox_min.tolist(),
+                    'max': bbox_max.tolist()
                 },
-                'dimensions': (stl_mesh.max_ - stl_mesh.min_).tolist(),
-                'surface_area': self._calculate_surface_area(stl_mesh),
-                'is_valid': self._validate_mesh(stl_mesh)
+                'dimensions': (bbox_max - bbox_min).tolist(),
+                'surface_area': self._calculate_surface_area(stl_mesh, areas),
+                'is_valid': self._validate_mesh(stl_mesh, areas)
             }
             
         except Exception as e:
             return {'error': str(e)}
     
-    def get_conversion_stats(self) -> Dict[str, Any]:
-        """Get statistics from recent conversions."""
-        return self.conversion_stats.copy()
+    def get_conversion_stats(self) -> Mapping[str, Any]:
+        """Get statistics from recent conversions, as a read-only live view."""
+        return MappingProxyType(self.conversion_stats)
     
     def clear_stats(self):
         """Clear conversion statistics."""
         self.conversion_stats.clear()
     
+    def _archive_compresslevel(self) -> int:
+        """Deflate level for written archives, 0 (stored) when compression is off."""
+        return self.compression_level if self.compress else 0
+    
     def _validate_stl(self, stl_path: Path):
         """Validate STL file before conversion."""
-        if stl_path.stat().st_size == 0:
+        file_size = stl_path.stat().st_size
+        if file_size == 0:
             raise ValueError("STL file is empty")
         
-        # Additional validation could be added here
+        # A binary STL whose size matches the triangle count in its header
+        # (84 byte header + 50 bytes per triangle) is complete, only other
+        # files are parsed to check them
+        with open(stl_path, 'rb') as fh:
+            header = fh.read(84)
+        if len(header) == 84:
+            triangle_count = int.from_bytes(header[80:84], 'little')
+            if triangle_count and file_size == 84 + 50 * triangle_count:
+                return
+        
         info = self.get_stl_info(stl_path)
         if info and 'error' in info:
             raise ValueError(f"Invalid STL file: {info['error']}")
     
-    def _validate_mesh(self, stl_mesh) -> bool:
-        """Validate mesh geometry."""
+    def _validate_mesh(self, stl_mesh, areas: Optional[np.ndarray] = None) -> bool:
+        """Validate mesh geometry, ``areas`` are the triangle areas if already computed."""
         try:
-            # Check for degenerate triangles
-            for triangle in stl_mesh.vectors:
-                # Calculate triangle area
-                v1, v2, v3 = triangle
-                area = 0.5 * abs((v2[0] - v1[0]) * (v3[1] - v1[1]) - 
-                                (v3[0] - v1[0]) * (v2[1] - v1[1]))
-                if area < 1e-10:  # Very small area threshold
-                    return False
-            return True
+            if areas is None:
+                areas = _triangle_areas(stl_mesh.vectors)
+            # Check for degenerate triangles (very small area threshold)
+            return not (areas < 1e-10).any()
         except:
             return False
     
-    def _calculate_surface_area(self, stl_mesh) -> float:
-        """Calculate surface area of the mesh."""
-        import numpy as np
-        
-        total_area = 0.0
-        for triangle in stl_mesh.vectors:
-            v1, v2, v3 = triangle
-            # Calculate triangle area using cross product
-            edge1 = v2 - v1
-            edge2 = v3 - v1
-            cross = np.cross(edge1, edge2)
-            area = 0.5 * np.linalg.norm(cross)
-            total_area += area
-        
-        return total_area
+    def _calculate_surface_area(self, stl_mesh, areas: Optional[np.ndarray] = None) -> float:
+        """Calculate surface area of the mesh, ``areas`` are the triangle areas if already computed."""
+        if areas is None:
+            areas = _triangle_areas(stl_mesh.vectors)
+        return float(areas.sum())
     
     def _calculate_grid_layout(self, count: int, grid_cols: Optional[int] = None) -> tuple:
         """Calculate optimal grid layout (rows, cols) for given count."""
-        import math
         
         if grid_cols is None:
             # Calculate optimal square-ish grid
@@ -470,69 +742,29 @@ class STLConverter:
         return (grid_rows, grid_cols)
     
     def _calculate_grid_positions(self, grid_layout: tuple, dimensions: List[float], 
-                                 spacing_factor: float, center_grid: bool,
-                                 bounding_box: Dict[str, List[float]], count: int) -> List[List[float]]:
-        """Calculate positions for objects in a grid layout."""
-        rows, cols = grid_layout
-        positions = []
+                                 spacing_factor: float, center_grid: bool, count: int) -> np.ndarray:
+        """Calculate positions for objects in a grid layout as one (count, 3) array."""
+        _, cols = grid_layout
         
         # Calculate spacing between objects
         x_spacing = dimensions[0] * spacing_factor
         y_spacing = dimensions[1] * spacing_factor
         
-        # Calculate grid dimensions
-        total_width = (cols - 1) * x_spacing
-        total_height = (rows - 1) * y_spacing
-        
-        # Calculate starting position (center grid if requested)
-        if center_grid:
-            start_x = -total_width / 2
-            start_y = -total_height / 2
-        else:
-            start_x = 0
-            start_y = 0
-        
-        # Generate positions
-        for row in range(rows):
-            for col in range(cols):
-                if len(positions) >= count:  # Stop when we have enough positions
-                    break
-                    
-                x = start_x + col * x_spacing
-                y = start_y + row * y_spacing
-                z = 0  # Keep all objects at the same Z level
-                
-                # Don't adjust for bounding box here - the STL is already properly positioned
-                # The adjustment will be done consistently in the object creation logic
-                
-                positions.append([x, y, z])
-            
-            if len(positions) >= count:  # Break outer loop too
-                break
-                
-        return positions
-    
-    def _translate_vertices(self, vertices: List[List[float]], 
-                           translation: List[float]) -> List[List[float]]:
-        """Translate vertices by the given translation vector."""
-        return [
-            [v[0] + translation[0], v[1] + translation[1], v[2] + translation[2]]
-            for v in vertices
-        ]
+        # Don't adjust for bounding box here - the STL is already properly positioned
+        # The adjustment will be done consistently in the object creation logic
+        return _grid_offsets(count, cols, x_spacing, y_spacing, center_grid)
     
     def _translate_object(self, obj: Dict[str, Any], translation: List[float]):
-        """Translate an object's vertices in place."""
-        for i, vertex in enumerate(obj['vertices']):
-            obj['vertices'][i] = [
-                vertex[0] + translation[0],
-                vertex[1] + translation[1], 
-                vertex[2] + translation[2]
-            ]
+        """Translate an object's vertices, replacing its vertex array.
+        
+        The array is replaced rather than written to, it may be the shared
+        read-only array of a cached STL.
+        """
+        obj['vertices'] = _instance_vertices(obj['vertices'], [translation])[0]
     
     def _calculate_stats(self, obj: Dict[str, Any], stl_path: Path, 
                         start_time: float) -> Dict[str, Any]:
         """Calculate conversion statistics."""
-        import time
         
         end_time = time.time()
         conversion_time = end_time - start_time
@@ -540,11 +772,14 @@ class STLConverter:
         stats = {
             'source_file': str(stl_path),
             'source_size': stl_path.stat().st_size,
-            'vertices': len(obj['vertices']) if obj else 0,
-            'triangles': len(obj['triangles']) if obj else 0,
+            'vertices': 0,
+            'triangles': 0,
             'conversion_time': conversion_time,
             'timestamp': end_time
         }
+        if obj:
+            # Counts, bounds and the validation checks from a single pass over the mesh
+            stats.update(_mesh_stats(obj['vertices'], obj['triangles'], self.validate))
         
         return stats
     
@@ -553,7 +788,7 @@ class STLConverter:
         with Directory('Metadata') as metadata_dir:
             metadata_content = f"""STL to 3MF Conversion Report
 Generated by: Noah123d STL Converter v2025.0.1
-Date: {Path(__file__).stat().st_mtime}
+Date: {_CONVERTER_MTIME}
 
 Source Information:
 - File: {Path(stats['source_file']).name}
@@ -573,12 +808,12 @@ Conversion successful!
             metadata_dir.create_file('conversion_report.txt', metadata_content)
     
     def _add_grid_metadata(self, stats: Dict[str, Any], output_path: Path, 
-                          positions: List[List[float]]):
+                          positions: np.ndarray):
         """Add grid conversion metadata to the 3MF file."""
         with Directory('Metadata') as metadata_dir:
-            metadata_content = f"""STL to 3MF Grid Conversion Report
+            report_header = f"""STL to 3MF Grid Conversion Report
 Generated by: Noah123d STL Converter v2025.0.1
-Date: {Path(__file__).stat().st_mtime}
+Date: {_CONVERTER_MTIME}
 
 Source Information:
 - File: {Path(stats['source_file']).name}
@@ -602,119 +837,53 @@ Performance:
 Object Positions:
 """
             
-            for i, pos in enumerate(positions):
-                metadata_content += f"- Object {i+1}: X={pos[0]:.2f}, Y={pos[1]:.2f}, Z={pos[2]:.2f}\n"
+            # All position lines in one format operation over the (count, 3) array
+            numbered = np.column_stack([np.arange(1, len(positions) + 1), positions])
+            position_lines = ("- Object %d: X=%.2f, Y=%.2f, Z=%.2f\n" * len(positions)) % tuple(numbered.ravel().tolist())
             
-            metadata_content += "\nGrid conversion successful!"
+            metadata_content = ''.join([report_header, position_lines, "\nGrid conversion successful!"])
             
             metadata_dir.create_file('grid_conversion_report.txt', metadata_content)
 
     def _calculate_multi_object_layout(self, processed_objects: List[Dict], 
                                      layout_mode: str, spacing_factor: float, 
-                                     center_layout: bool) -> List[List[float]]:
-        """Calculate positions for multiple different objects with counts."""
-        import math
+                                     center_layout: bool) -> np.ndarray:
+        """Calculate positions for multiple different objects with counts as one (total, 3) array."""
+        if not processed_objects:
+            return np.zeros((0, 3))
         
-        positions = []
+        dimensions = np.array([obj_spec['info']['dimensions'] for obj_spec in processed_objects],
+                              dtype=float)
+        counts = np.array([obj_spec['count'] for obj_spec in processed_objects])
         
         if layout_mode == "linear":
             # Arrange all objects in a single line
-            current_x = 0
-            
-            for obj_spec in processed_objects:
-                dimensions = obj_spec['info']['dimensions']
-                count = obj_spec['count']
-                
-                # Place copies of this object
-                for i in range(count):
-                    positions.append([current_x, 0, 0])
-                    current_x += dimensions[0] * spacing_factor
-                
-                # Add extra space between different object types
-                current_x += dimensions[0] * 0.5
-                
-            # Center the layout if requested
-            if center_layout and positions:
-                total_width = max(pos[0] for pos in positions) + dimensions[0]
-                offset_x = -total_width / 2
-                for pos in positions:
-                    pos[0] += offset_x
+            offsets = _linear_offsets(dimensions[:, 0], counts, spacing_factor, 0, center_layout)
                     
         elif layout_mode == "stack":
             # Stack all objects vertically
-            current_z = 0
-            
-            for obj_spec in processed_objects:
-                dimensions = obj_spec['info']['dimensions']
-                count = obj_spec['count']
-                
-                # Place copies of this object
-                for i in range(count):
-                    positions.append([0, 0, current_z])
-                    current_z += dimensions[2] * spacing_factor
-                
-                # Add extra space between different object types
-                current_z += dimensions[2] * 0.5
-                
-            # Center the layout if requested
-            if center_layout and positions:
-                total_height = max(pos[2] for pos in positions) + dimensions[2]
-                offset_z = -total_height / 2
-                for pos in positions:
-                    pos[2] += offset_z
+            offsets = _linear_offsets(dimensions[:, 2], counts, spacing_factor, 2, center_layout)
                     
         else:  # grid layout (default)
-            # Calculate total number of objects
-            total_objects = sum(obj['count'] for obj in processed_objects)
-            
-            # Calculate grid dimensions
+            total_objects = int(counts.sum())
             grid_cols = math.ceil(math.sqrt(total_objects))
-            grid_rows = math.ceil(total_objects / grid_cols)
-            
-            # Find maximum dimensions for spacing
-            max_dimensions = [0, 0, 0]
-            for obj_spec in processed_objects:
-                dimensions = obj_spec['info']['dimensions']
-                for i in range(3):
-                    max_dimensions[i] = max(max_dimensions[i], dimensions[i])
             
-            # Calculate spacing
-            x_spacing = max_dimensions[0] * spacing_factor
-            y_spacing = max_dimensions[1] * spacing_factor
-            
-            # Calculate grid positions
-            total_width = (grid_cols - 1) * x_spacing
-            total_height = (grid_rows - 1) * y_spacing
-            
-            start_x = -total_width / 2 if center_layout else 0
-            start_y = -total_height / 2 if center_layout else 0
-            
-            object_index = 0
-            for obj_spec in processed_objects:
-                count = obj_spec['count']
-                
-                for i in range(count):
-                    if object_index >= total_objects:
-                        break
-                        
-                    row = object_index // grid_cols
-                    col = object_index % grid_cols
-                    
-                    x = start_x + col * x_spacing
-                    y = start_y + row * y_spacing
-                    
-                    positions.append([x, y, 0])
-                    object_index += 1
+            # Space the grid by the largest object
+            max_dimensions = dimensions.max(axis=0, initial=0)
+            offsets = _grid_offsets(total_objects, grid_cols,
+                                    max_dimensions[0] * spacing_factor,
+                                    max_dimensions[1] * spacing_factor,
+                                    center_layout)
         
-        return positions
+        return offsets
 
     def _add_multi_object_metadata(self, stats: Dict[str, Any], output_path: Path,
                                   processed_objects: List[Dict]):
         """Add multi-object conversion metadata to the 3MF file."""
         with Directory('Metadata') as metadata_dir:
-            metadata_content = f"""Multi-STL to 3MF Conversion Report
+            report_parts = [f"""Multi-STL to 3MF Conversion Report
 Generated by: Noah123d STL Converter v2025.0.1
-Date: {Path(__file__).stat().st_mtime}
+Date: {_CONVERTER_MTIME}
 
 Conversion Summary:
 - Total STL Files: {stats['total_stl_files']}
@@ -732,15 +901,16 @@ Performance:
 - Triangles/Second: {stats['total_triangles'] / stats['conversion_time']:,.0f}
 
 Source Files and Object Details:
-"""
+"""]
             
+            # Parts are collected and joined once, the report grows with the object count
             for obj_spec in processed_objects:
                 stl_path = obj_spec['path']
                 count = obj_spec['count']
                 name = obj_spec['name']
                 info = obj_spec['info']
                 
-                metadata_content += f"""
+                report_parts.append(f"""
 - STL File: {stl_path.name}
   Name: {name}
   Copies: {count}
@@ -748,21 +918,22 @@ Source Files and Object Details:
   Triangles per copy: {info['triangles']:,}
   Dimensions: {info['dimensions'][0]:.2f} × {info['dimensions'][1]:.2f} × {info['dimensions'][2]:.2f}
   Volume: {info['volume']:.3f} cubic units
-"""
+""")
             
-            metadata_content += f"\nObject Placement Details:\n"
+            report_parts.append("\nObject Placement Details:\n")
             for detail in stats['object_details']:
                 pos = detail['position']
-                metadata_content += f"- {detail['name']}: Position=({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})\n"
+                report_parts.append(f"- {detail['name']}: Position=({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})\n")
             
-            metadata_content += "\nMulti-object conversion successful!"
+            report_parts.append("\nMulti-object conversion successful!")
+            metadata_content = ''.join(report_parts)
             
             metadata_dir.create_file('multi_object_conversion_report.txt', metadata_content)
 
 
 # Convenience functions for backward compatibility and simple usage
 def stl_to_3mf(stl_path: Union[str, Path], output_path: Union[str, Path], 
-               include_metadata: bool = True) -> bool:
+               include_metadata: bool = True, compression_level: int = 1) -> bool:
     """
     Simple function to convert an STL file to 3MF format.
     
@@ -770,11 +941,14 @@ def stl_to_3mf(stl_path: Union[str, Path], output_path: Union[str, Path],
         stl_path: Path to the input STL file
         output_path: Path for the output 3MF file
         include_metadata: Whether to include conversion metadata
+        compression_level: Deflate level, 1 (fast, default) to 9 (smallest)
+            or 0 to store the entries uncompressed
         
     Returns:
         True if conversion was successful, False otherwise
     """
-    converter = STLConverter(include_metadata=include_metadata)
+    converter = STLConverter(include_metadata=include_metadata,
+                             compression_level=compression_level)
     return converter.convert(stl_path, output_path)
 
 
@@ -793,7 +967,8 @@ def get_stl_info(stl_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
 
 
 def batch_stl_to_3mf(input_pattern: str, output_dir: Union[str, Path] = "converted",
-                     include_metadata: bool = True) -> List[str]:
+                     include_metadata: bool = True,
+                     max_workers: Optional[int] = None) -> List[str]:
     """
     Convert multiple STL files matching a pattern to 3MF format.
     
@@ -801,18 +976,20 @@ def batch_stl_to_3mf(input_pattern: str, output_dir: Union[str, Path] = "convert
         input_pattern: Glob pattern for STL files (e.g., "models/*.stl")
         output_dir: Directory to save converted 3MF files
         include_metadata: Whether to include conversion metadata
+        max_workers: Number of worker processes (default: CPU count)
         
     Returns:
         List of successfully converted file paths
     """
     converter = STLConverter(include_metadata=include_metadata)
-    return converter.batch_convert(input_pattern, output_dir)
+    return converter.batch_convert(input_pattern, output_dir, max_workers=max_workers)
 
 
 def stl_to_3mf_grid(stl_path: Union[str, Path], output_path: Union[str, Path],
                     count: int = 1, grid_cols: Optional[int] = None,
                     spacing_factor: float = 1.1, center_grid: bool = True,
-                    include_metadata: bool = True) -> bool:
+                    include_metadata: bool = True,
+                    use_instances: bool = False) -> bool:
     """
     Convert an STL file to 3MF format with multiple copies in a grid layout.
     
@@ -824,6 +1001,8 @@ def stl_to_3mf_grid(stl_path: Union[str, Path], output_path: Union[str, Path],
         spacing_factor: Multiplier for object spacing (1.0 = touching, 1.1 = 10% gap)
         center_grid: Whether to center the grid around the origin
         include_metadata: Whether to include conversion metadata
+        use_instances: Write the mesh once and place the copies with build
+            item transforms instead of one translated mesh per copy
         
     Returns:
         True if conversion was successful, False otherwise
@@ -835,10 +1014,11 @@ def stl_to_3mf_grid(stl_path: Union[str, Path], output_path: Union[str, Path],
     """
     converter = STLConverter(include_metadata=include_metadata)
     return converter.convert_with_copies(stl_path, output_path, count, 
-                                       grid_cols, spacing_factor, center_grid)
+                                       grid_cols, spacing_factor, center_grid,
+                                       use_instances)
 
 
-def multi_stl_to_3mf(stl_objects: List[Dict[str, Union[str, Path, int]]], 
+def multi_stl_to_3mf(stl_objects: Sequence[Union[StlSpec, Dict[str, Any]]], 
                      output_path: Union[str, Path],
                      layout_mode: str = "grid",
                      spacing_factor: float = 1.1,
@@ -848,7 +1028,7 @@ def multi_stl_to_3mf(stl_objects: List[Dict[str, Union[str, Path, int]]],
     Convert multiple STL files with specified counts to a single 3MF file.
     
     Args:
-        stl_objects: List of dictionaries with keys:
+        stl_objects: List of ``StlSpec`` entries, or dictionaries with keys:
                     - 'path': Path to STL file (required)
                     - 'count': Number of copies (default: 1)
                     - 'name': Optional name for the object (default: filename)
@@ -869,6 +1049,9 @@ def multi_stl_to_3mf(stl_objects: List[Dict[str, Union[str, Path, int]]],
         ...     {'path': 'washer.stl', 'count': 4, 'name': 'Washer'}
         ... ]
         >>> success = multi_stl_to_3mf(stl_objects, 'assembly.3mf', layout_mode='grid')
+        >>> # or with typed specs
+        >>> success = multi_stl_to_3mf([StlSpec('base.stl', 1, 'Base'), StlSpec('screw.stl', 4)],
+        ...                            'assembly.3mf')
     """
     converter = STLConverter(include_metadata=include_metadata)
     return converter.convert_multiple_stl_with_counts(  stl_objects, output_path,
@@ -43,6 +43,8 @@ def context_function_with_check(context_var: ContextVar[Optional[_T]],
         """
         Decorator that wraps the function to enforce context and type checks.
         """
+        method_name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             """
@@ -55,11 +57,8 @@ def context_function_with_check(context_var: ContextVar[Optional[_T]],
             if expected_type and not isinstance(current_instance, expected_type):
                 ctx_name = context_name or expected_type.__name__
                 raise TypeError(f"{func.__name__}() can only be used within a {ctx_name} context")
-            method_name = func.__name__
-            if not hasattr(current_instance, method_name):
-                raise AttributeError(f"{type(current_instance).__name__} has no method '{method_name}'")
-            method = getattr(current_instance, method_name)
-            return method(*args, **kwargs)
+            # A missing method raises AttributeError from getattr itself
+            return getattr(current_instance, method_name)(*args, **kwargs)
         return wrapper
     return decorator
 
@@ -79,6 +78,8 @@ def context_function(context_var: ContextVar) -> Callable:
         """
         Decorator that wraps the function to enforce context presence.
         """
+        method_name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             """
@@ -86,9 +87,8 @@ def context_function(context_var: ContextVar) -> Callable:
             """
             current_instance = context_var.get()
             if not current_instance:
-                raise RuntimeError(f"{func.__name__}() must be called within a context manager")
-            method = getattr(current_instance, func.__name__)
-            return method(*args, **kwargs)
+                raise RuntimeError(f"{method_name}() must be called within a context manager")
+            return getattr(current_instance, method_name)(*args, **kwargs)
         return wrapper
     return decorator
 
@@ -123,10 +123,7 @@ def auto_context_function_with_checks(  context_var: ContextVar[Optional[_T]],
                     raise RuntimeError(f"{name}() must be called within a {context_name} context manager")
                 if not isinstance(current_instance, expected_type):
                     raise TypeError(f"{name}() can only be used within a {context_name} context")
-                if not hasattr(current_instance, name):
-                    raise AttributeError(f"{type(current_instance).__name__} has no method '{name}'")
-                method = getattr(current_instance, name)
-                return method(*args, **kwargs)
+                return getattr(current_instance, name)(*args, **kwargs)
             return context_function_wrapper
         
         functions[method_name] = create_function(method_name)
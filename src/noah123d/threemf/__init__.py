@@ -26,6 +26,7 @@ project:
 from .analyzer import (
     Analyzer,
     analyze_3mf,
+    analyze_3mf_files,
     get_model_center_of_mass,
     get_model_dimensions,
 )
@@ -56,6 +57,7 @@ from .metadata import (
 from .model import (
     Model,
     add_conversion_metadata,
+    add_instance,
     add_object,
     add_object_from_stl,
     analyze_model_content,
@@ -90,12 +92,14 @@ __all__ = [
 
     # From src/noah123d/threemf/analyzer.py
     "analyze_3mf",
+    "analyze_3mf_files",
     "Analyzer",
     "get_model_center_of_mass",
     "get_model_dimensions",
 
     # From src/noah123d/threemf/model.py
     "add_conversion_metadata",
+    "add_instance",
     "add_object",
     "add_object_from_stl",
     "analyze_model_content",
@@ -1,13 +1,103 @@
 """3MF file analysis utilities for the noah123d package."""
 
+import copy
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
+
+import numpy as np
 
 from .archive import Archive
 from .directory import Directory, current_directory
 from .model import Model
 
 
+def _as_vertex_array(vertices) -> np.ndarray:
+    """Return vertex coordinates as a float64 (N, 3) array, without copying float64 input."""
+    return np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+
+
+def _as_triangle_array(triangles, vertex_count: int) -> np.ndarray:
+    """Return triangle indices as an (M, 3) array, without triangles that index missing vertices."""
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    valid = ((triangles >= 0) & (triangles < vertex_count)).all(axis=1)
+    return triangles if valid.all() else triangles[valid]
+
+
+# Meshes with this many triangles go through the numba kernel when numba is
+# installed; smaller ones stay on the NumPy path and never trigger the compile
+_NUMBA_MIN_TRIANGLES = 50_000
+
+
+def _volume_and_area_loop(vertices: np.ndarray, triangles: np.ndarray) -> Tuple[float, float]:
+    """Signed volume and area accumulated face by face, compiled by :func:`_volume_and_area_kernel`."""
+    volume = 0.0
+    area = 0.0
+    for t in range(triangles.shape[0]):
+        v1 = vertices[triangles[t, 0]]
+        v2 = vertices[triangles[t, 1]]
+        v3 = vertices[triangles[t, 2]]
+        e1x, e1y, e1z = v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]
+        e2x, e2y, e2z = v3[0] - v1[0], v3[1] - v1[1], v3[2] - v1[2]
+        nx = e1y * e2z - e1z * e2y
+        ny = e1z * e2x - e1x * e2z
+        nz = e1x * e2y - e1y * e2x
+        volume += v1[0] * nx + v1[1] * ny + v1[2] * nz
+        area += np.sqrt(nx * nx + ny * ny + nz * nz)
+    return volume / 6.0, area / 2.0
+
+
+@lru_cache(maxsize=None)
+def _volume_and_area_kernel():
+    """
+    Compile :func:`_volume_and_area_loop` with numba, on first use.
+    
+    Returns:
+        The compiled one-pass kernel, or None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    # The package logs at DEBUG, keep numba's compiler trace out of it
+    logging.getLogger('numba').setLevel(logging.WARNING)
+    # Serial on purpose: numba's parallel thread pools hang forked
+    # processes, and the batch converters fork their workers
+    return numba.njit(cache=True, fastmath=True)(_volume_and_area_loop)
+
+
+def _volume_and_area(vertices: np.ndarray, triangles: np.ndarray) -> Tuple[float, float]:
+    """
+    Calculate mesh volume and surface area from one gather of the triangle corners.
+    
+    Both come from the edge cross product n = (v2 - v1) x (v3 - v1): each
+    face adds |n| / 2 to the area and v1 . n / 6 (= v1 . (v2 x v3) / 6, the
+    signed tetrahedron spanned with the origin) to the volume.
+    
+    Args:
+        vertices: Vertex coordinates, float64 (N, 3)
+        triangles: Valid triangle indices, (M, 3)
+        
+    Returns:
+        Tuple of (absolute volume, surface area), zeros for an empty mesh
+    """
+    if not len(triangles) or not len(vertices):
+        return 0.0, 0.0
+    kernel = _volume_and_area_kernel() if len(triangles) >= _NUMBA_MIN_TRIANGLES else None
+    if kernel is not None:
+        volume, area = kernel(vertices, triangles)
+        return abs(float(volume)), float(area)
+    
+    v1, v2, v3 = (vertices[triangles[:, i]] for i in range(3))
+    cross = np.cross(v2 - v1, v3 - v1)
+    volume = np.einsum('ij,ij->', v1, cross) / 6.0
+    area = 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross)).sum()
+    return abs(float(volume)), float(area)
+
+
 class Analyzer:
     """3MF file analyzer for extracting model information."""
     
@@ -29,6 +119,34 @@ class Analyzer:
         if not file_path.exists():
             return {'error': f'File not found: {file_path}'}
         
+        # Analyses are cached per file version; callers get their own copy
+        stat = file_path.stat()
+        analysis = copy.deepcopy(_analyze_cached(file_path.resolve(), stat.st_mtime_ns, stat.st_size))
+        if 'file_path' in analysis:
+            analysis['file_path'] = str(file_path)
+        return analysis
+    
+    def analyze_many(self, file_paths: Iterable[Union[str, Path]],
+                     max_workers: Optional[int] = None) -> Dict[Union[str, Path], Dict[str, Any]]:
+        """
+        Analyze several 3MF files, in worker processes when there is more than one.
+        
+        Args:
+            file_paths: Paths to the 3MF files
+            max_workers: Number of worker processes (default: one per CPU)
+            
+        Returns:
+            Dictionary mapping each given path to its analysis results
+        """
+        file_paths = list(file_paths)
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            return {path: self.analyze_file(path) for path in file_paths}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(file_paths, executor.map(_analyze_worker, file_paths)))
+    
+    def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
+        """Analyze a 3MF file without the cache, see :meth:`analyze_file`."""
         try:
             analysis = {
                 'file_path': str(file_path),
@@ -51,7 +169,11 @@ class Analyzer:
                         
                         total_vertices = 0
                         total_triangles = 0
-                        all_vertices = []
+                        # Overall bounds and centroid are reduced from the per-object
+                        # results, the vertices of all objects are never gathered
+                        overall_min = np.full(3, np.inf)
+                        overall_max = np.full(3, -np.inf)
+                        vertex_sum = np.zeros(3)
                         
                         for obj_id in model.list_objects():
                             obj = model.get_object(obj_id)
@@ -59,19 +181,29 @@ class Analyzer:
                                 obj_analysis = self._analyze_object(obj, obj_id)
                                 analysis['models'].append(obj_analysis)
                                 
-                                total_vertices += len(obj['vertices'])
+                                vertex_count = obj_analysis['vertex_count']
+                                total_vertices += vertex_count
                                 total_triangles += len(obj['triangles'])
-                                all_vertices.extend(obj['vertices'])
+                                if vertex_count:
+                                    np.minimum(overall_min, obj_analysis['bounds']['min'], out=overall_min)
+                                    np.maximum(overall_max, obj_analysis['bounds']['max'], out=overall_max)
+                                    vertex_sum += np.multiply(obj_analysis['center_of_mass'], vertex_count)
                         
                         # Overall statistics
+                        if total_vertices:
+                            overall_bounds = {'min': overall_min.tolist(), 'max': overall_max.tolist()}
+                            overall_center_of_mass = (vertex_sum / total_vertices).tolist()
+                        else:
+                            overall_bounds = {'min': [0, 0, 0], 'max': [0, 0, 0]}
+                            overall_center_of_mass = [0, 0, 0]
                         analysis['summary'].update({
                             'total_vertices': total_vertices,
                             'total_triangles': total_triangles,
-                            'overall_bounds': self._calculate_bounds(all_vertices),
-                            'overall_center_of_mass': self._calculate_center_of_mass(all_vertices)
+                            'overall_bounds': overall_bounds,
+                            'overall_center_of_mass': overall_center_of_mass
                         })
                         
-                        if all_vertices:
+                        if total_vertices:
                             bounds = analysis['summary']['overall_bounds']
                             analysis['summary']['overall_dimensions'] = [
                                 bounds['max'][0] - bounds['min'][0],
@@ -86,8 +218,10 @@ class Analyzer:
     
     def _analyze_object(self, obj: Dict[str, Any], obj_id: int) -> Dict[str, Any]:
         """Analyze a single object."""
-        vertices = obj['vertices']
-        triangles = obj['triangles']
+        # Model stores meshes as float32/uint32 arrays, the vertices are
+        # widened to float64 once and shared by the calculations below
+        vertices = _as_vertex_array(obj['vertices'])
+        triangles = _as_triangle_array(obj['triangles'], len(vertices))
         
         bounds = self._calculate_bounds(vertices)
         dimensions = [
@@ -96,8 +230,7 @@ class Analyzer:
             bounds['max'][2] - bounds['min'][2]
         ]
         center_of_mass = self._calculate_center_of_mass(vertices)
-        volume = self._calculate_volume(vertices, triangles)
-        surface_area = self._calculate_surface_area(vertices, triangles)
+        volume, surface_area = _volume_and_area(vertices, triangles)
         
         return {
             'object_id': obj_id,
@@ -111,70 +244,31 @@ class Analyzer:
             'surface_area': surface_area
         }
     
-    def _calculate_bounds(self, vertices: List[List[float]]) -> Dict[str, List[float]]:
+    def _calculate_bounds(self, vertices: np.ndarray) -> Dict[str, List[float]]:
         """Calculate bounding box."""
-        if not vertices:
+        vertices = _as_vertex_array(vertices)
+        if not len(vertices):
             return {'min': [0, 0, 0], 'max': [0, 0, 0]}
         
-        min_coords = [min(v[i] for v in vertices) for i in range(3)]
-        max_coords = [max(v[i] for v in vertices) for i in range(3)]
-        
-        return {'min': min_coords, 'max': max_coords}
+        return {'min': vertices.min(axis=0).tolist(), 'max': vertices.max(axis=0).tolist()}
     
-    def _calculate_center_of_mass(self, vertices: List[List[float]]) -> List[float]:
+    def _calculate_center_of_mass(self, vertices: np.ndarray) -> List[float]:
         """Calculate center of mass."""
-        if not vertices:
+        vertices = _as_vertex_array(vertices)
+        if not len(vertices):
             return [0, 0, 0]
         
-        return [sum(v[i] for v in vertices) / len(vertices) for i in range(3)]
+        return vertices.mean(axis=0).tolist()
     
-    def _calculate_volume(self, vertices: List[List[float]], triangles: List[List[int]]) -> float:
+    def _calculate_volume(self, vertices: np.ndarray, triangles: np.ndarray) -> float:
         """Calculate mesh volume."""
-        if not triangles or not vertices:
-            return 0.0
-        
-        volume = 0.0
-        for triangle in triangles:
-            if len(triangle) >= 3:
-                try:
-                    v1, v2, v3 = [vertices[triangle[i]] for i in range(3)]
-                    volume += (v1[0] * (v2[1] * v3[2] - v2[2] * v3[1]) +
-                              v2[0] * (v3[1] * v1[2] - v3[2] * v1[1]) +
-                              v3[0] * (v1[1] * v2[2] - v1[2] * v2[1])) / 6.0
-                except (IndexError, TypeError):
-                    continue
-        
-        return abs(volume)
+        vertices = _as_vertex_array(vertices)
+        return _volume_and_area(vertices, _as_triangle_array(triangles, len(vertices)))[0]
     
-    def _calculate_surface_area(self, vertices: List[List[float]], triangles: List[List[int]]) -> float:
+    def _calculate_surface_area(self, vertices: np.ndarray, triangles: np.ndarray) -> float:
         """Calculate surface area."""
-        if not triangles or not vertices:
-            return 0.0
-        
-        import math
-        total_area = 0.0
-        
-        for triangle in triangles:
-            if len(triangle) >= 3:
-                try:
-                    v1, v2, v3 = [vertices[triangle[i]] for i in range(3)]
-                    
-                    edge1 = [v2[i] - v1[i] for i in range(3)]
-                    edge2 = [v3[i] - v1[i] for i in range(3)]
-                    
-                    cross = [
-                        edge1[1] * edge2[2] - edge1[2] * edge2[1],
-                        edge1[2] * edge2[0] - edge1[0] * edge2[2],
-                        edge1[0] * edge2[1] - edge1[1] * edge2[0]
-                    ]
-                    
-                    area = 0.5 * math.sqrt(sum(c**2 for c in cross))
-                    total_area += area
-                    
-                except (IndexError, TypeError, ValueError):
-                    continue
-        
-        return total_area
+        vertices = _as_vertex_array(vertices)
+        return _volume_and_area(vertices, _as_triangle_array(triangles, len(vertices)))[1]
     
     def get_model_info(self, file_path: Path, model_id: int = None) -> Optional[Dict[str, Any]]:
         """Get information for a specific model or all models."""
@@ -193,6 +287,17 @@ class Analyzer:
         return None
 
 
+@lru_cache(maxsize=32)
+def _analyze_cached(file_path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Analyze a 3MF file once per path, modification time and size."""
+    return Analyzer()._analyze_file(file_path)
+
+
+def _analyze_worker(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Analyze one 3MF file in a worker process of :meth:`Analyzer.analyze_many`."""
+    return Analyzer().analyze_file(file_path)
+
+
 def analyze_3mf(file_path: Path) -> Dict[str, Any]:
     """
     Convenience function to analyze a 3MF file.
@@ -207,6 +312,21 @@ def analyze_3mf(file_path: Path) -> Dict[str, Any]:
     return analyzer.analyze_file(file_path)
 
 
+def analyze_3mf_files(file_paths: Iterable[Path], max_workers: Optional[int] = None) -> Dict[Path, Dict[str, Any]]:
+    """
+    Convenience function to analyze several 3MF files in parallel.
+    
+    Args:
+        file_paths: Paths to the 3MF files
+        max_workers: Number of worker processes (default: one per CPU)
+        
+    Returns:
+        Dictionary mapping each path to its analysis results
+    """
+    analyzer = Analyzer()
+    return analyzer.analyze_many(file_paths, max_workers=max_workers)
+
+
 def get_model_center_of_mass(file_path: Path, model_id: int = None) -> Optional[List[float]]:
     """
     Get center of mass for a model in a 3MF file.
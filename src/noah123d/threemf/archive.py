@@ -1,12 +1,18 @@
 """Archive class for managing 3MF zip archives."""
 
+import copy
+import mmap
+import shutil
+import struct
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Dict, Iterable, Iterator, Optional, Tuple, Union
 from contextvars import ContextVar
 import contextlib
+import numpy as np
 from rich import print 
 from rich.console import Console
 
@@ -16,20 +22,122 @@ from ..core.context_decorators import context_function
 # Context variable to track the current archive
 current_archive: ContextVar[Optional['Archive']] = ContextVar('current_archive', default=None)
 
+# The headers every new archive starts with, encoded once
+_CONTENT_TYPES_BYTES = content_types_header.encode('utf-8')
+_RELATIONSHIPS_BYTES = relationships_header.encode('utf-8')
+
+# Entries smaller than this (metadata, reports, rels) are stored, deflate would
+# save a few hundred bytes at best but sets up a compressor per entry
+_STORE_BELOW = 512
+
+# Larger entries are stored when a sample of them is already near-random
+# (textures, thumbnails, embedded archives), deflate would not shrink them
+_STORE_ENTROPY_BITS = 7.5
+_ENTROPY_SAMPLE_SIZE = 64 * 1024
+
+
+def _walk_files(root: str, prefix: str = '') -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield the files below ``root`` with their archive names, from the scandir cache."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                yield entry, prefix + entry.name
+            elif entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, f"{prefix}{entry.name}/")
+
+
+def _is_incompressible(file_path: Union[str, Path], size: int) -> bool:
+    """Check whether a file of ``size`` bytes is too small or too random to be worth deflating."""
+    if size < _STORE_BELOW:
+        return True
+    with open(file_path, 'rb') as fh:
+        sample = np.frombuffer(fh.read(_ENTROPY_SAMPLE_SIZE), dtype=np.uint8)
+    counts = np.bincount(sample, minlength=256)
+    frequencies = counts[counts > 0] / len(sample)
+    return float(-(frequencies * np.log2(frequencies)).sum()) > _STORE_ENTROPY_BITS
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map with the ``seekable`` method zipfile expects from a file."""
+    
+    def seekable(self) -> bool:
+        return True
+
+
+# Streamed entries are written in pieces of at least this size, so the many
+# small strings of a generator cost one file write and thread handoff
+# per MiB instead of one each
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _coalesce_chunks(chunks: Iterable[Union[str, bytes]],
+                     size: int = _WRITE_BUFFER_SIZE) -> Iterator[bytes]:
+    """Encode text chunks and join them into pieces of at least ``size`` bytes."""
+    pending = []
+    pending_size = 0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= size:
+            yield b''.join(pending)
+            pending = []
+            pending_size = 0
+    if pending:
+        yield b''.join(pending)
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Drop the zip64 record (ID 0x0001) from an extra field, FileHeader() adds its own when needed."""
+    kept = []
+    offset = 0
+    while offset + 4 <= len(extra):
+        record_id, size = struct.unpack('<HH', extra[offset:offset + 4])
+        if record_id != 0x0001:
+            kept.append(extra[offset:offset + 4 + size])
+        offset += 4 + size
+    return b''.join(kept)
+
+
+# ZipFile internals the raw member copy appends an entry through; when a
+# Python version lacks one of them, members are re-compressed instead
+_RAW_COPY_ATTRIBUTES = ('fp', 'filelist', 'NameToInfo', 'start_dir')
+
+
+def _recompress_member(source: zipfile.ZipFile, dest: zipfile.ZipFile, info: zipfile.ZipInfo,
+                       chunk_size: int):
+    """Copy one member through the public ZipFile API, inflating and deflating it again."""
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.comment = info.comment
+    with source.open(info) as src, \
+         dest.open(zinfo, 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dst:
+        shutil.copyfileobj(src, dst, chunk_size)
+
 
 class Archive:
     """Manages a 3MF zip archive using Python's standard library."""
-    def __init__(self, file_path: Union[str, Path], mode: str = 'r'):
+    def __init__(self, file_path: Union[str, Path], mode: str = 'r', compresslevel: int = 1):
         """
         Initialize the Archive3mf.
         
         Args:
             file_path: Path to the 3MF file
             mode: File mode ('r', 'w', 'a')
+            compresslevel: Deflate level used when writing (default: 1).
+                Mesh XML compresses nearly as well at level 1 as at the zlib
+                default of 6 while taking a fraction of the CPU time, often
+                halving the write time.
+                0 stores all entries uncompressed.
         """
         self.file_path = Path(file_path)
         self.mode = mode
+        self.compresslevel = compresslevel
+        self._mmap: Optional[mmap.mmap] = None
         self._zipfile: Optional[zipfile.ZipFile] = None
+        self._infos: Dict[str, zipfile.ZipInfo] = {}
         self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
         self._context_token = None
         
@@ -38,33 +146,46 @@ class Archive:
         # Set this archive as the current archive in context
         self._context_token = current_archive.set(self)
         
-        # Create temporary directory for all modes
-        self._temp_dir = tempfile.TemporaryDirectory()
+        # Read mode serves members straight from the zip. Writable archives
+        # are staged in a temporary directory only, file_path is not touched
+        # until they are packed from it on exit
+        if not self.is_writable():
+            self._zipfile = self._open_zipfile('r')
+            # Index the central directory once for list_contents/extract_file
+            self._infos = {info.filename: info for info in self._zipfile.infolist()}
+            return self
             
-        # Open the zip file
-        if self.mode == 'w' or not self.file_path.exists():
-            self._zipfile = zipfile.ZipFile(self.file_path, 'w', zipfile.ZIP_DEFLATED)
+        self._temp_dir = tempfile.TemporaryDirectory()
+        if self.mode == 'w' or not self.file_path.exists() or not self.file_path.stat().st_size:
             # Create basic 3MF structure
             self._create_basic_structure()
         else:
-            self._zipfile = zipfile.ZipFile(self.file_path, self.mode)
-            if self._temp_dir:
-                self._zipfile.extractall(self._temp_dir.name)
+            # Stage the existing entries, the original file is only read
+            with self._open_zipfile('r') as source:
+                source.extractall(self._temp_dir.name)
+            self._mmap.close()
+            self._mmap = None
                 
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the context manager."""
+        # Pack a writable archive from the temporary directory
+        if self._temp_dir:
+            self._repack_from_temp()
+            
         # Close the zip file
         if self._zipfile:
-            if self.mode in ('w', 'a') and self._temp_dir:
-                # Re-pack the temporary directory if it was used
-                self._repack_from_temp()
             self._zipfile.close()
+            self._zipfile = None
+            if self._mmap:
+                self._mmap.close()
+                self._mmap = None
             
         # Clean up temporary directory
         if self._temp_dir:
             self._temp_dir.cleanup()
+            self._temp_dir = None
             
         # Reset the context variable
         if self._context_token:
@@ -75,54 +196,170 @@ class Archive:
         """Get the current archive from context."""
         return current_archive.get()
 
+    def _open_zipfile(self, mode: str) -> zipfile.ZipFile:
+        """Open the archive file, deflating new entries at ``compresslevel`` (0: stored)."""
+        compression = zipfile.ZIP_DEFLATED if self.compresslevel else zipfile.ZIP_STORED
+        target = self.file_path
+        if mode == 'r' and self.file_path.stat().st_size:
+            # Members are read from the page cache without a seek/read syscall pair each
+            with open(self.file_path, 'rb') as fh:
+                self._mmap = target = _MappedFile(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return zipfile.ZipFile(target, mode, compression,
+                               compresslevel=self.compresslevel)
+    
     def _create_basic_structure(self):
         """Create the basic 3MF file structure."""
         # Create [Content_Types].xml
-        self._zipfile.writestr('[Content_Types].xml', content_types_header)
+        self.add_file('[Content_Types].xml', _CONTENT_TYPES_BYTES)
         
         # Create _rels/.rels
-        self._zipfile.writestr('_rels/.rels', relationships_header)
+        self.add_file('_rels/.rels', _RELATIONSHIPS_BYTES)
         
     def _repack_from_temp(self):
-        """Repack the archive from temporary directory."""
+        """Pack the archive from the temporary directory, the only write to ``file_path``."""
         if not self._temp_dir:
             return
             
-        # Close current zipfile
-        self._zipfile.close()
-        
         # Create new zipfile
-        self._zipfile = zipfile.ZipFile(self.file_path, 'w', zipfile.ZIP_DEFLATED)
+        self._zipfile = self._open_zipfile('w')
         
         # Add all files from temp directory
-        temp_path = Path(self._temp_dir.name)
-        for file_path in temp_path.rglob('*'):
-            if file_path.is_file():
-                arc_name = file_path.relative_to(temp_path)
-                self._zipfile.write(file_path, arc_name)
+        for entry, arc_name in _walk_files(self._temp_dir.name):
+            incompressible = _is_incompressible(entry.path, entry.stat().st_size)
+            compress_type = zipfile.ZIP_STORED if incompressible else None
+            self._zipfile.write(entry.path, arc_name, compress_type=compress_type)
                 
     def get_temp_path(self) -> Optional[Path]:
-        """Get the temporary directory path for file operations."""
+        """Get the temporary directory path for file operations, None in read mode."""
         return Path(self._temp_dir.name) if self._temp_dir else None
         
     def list_contents(self) -> list[str]:
         """List all files in the archive."""
+        if self._temp_dir:
+            return [arc_name for _entry, arc_name in _walk_files(self._temp_dir.name)]
         if self._zipfile:
-            return self._zipfile.namelist()
+            return list(self._infos)
         return []
         
+    def _staged_path(self, filename: str) -> Optional[Path]:
+        """Path of a staged member in the temporary directory, None if it does not exist."""
+        staged_path = Path(self._temp_dir.name) / filename
+        return staged_path if staged_path.is_file() else None
+        
+    def open_member(self, filename: str) -> Optional[IO[bytes]]:
+        """Open a file in the archive for streamed reading, None if it does not exist."""
+        if self._temp_dir:
+            staged_path = self._staged_path(filename)
+            return open(staged_path, 'rb') if staged_path else None
+        info = self._infos.get(filename)
+        if self._zipfile and info:
+            return self._zipfile.open(info)
+        return None
+        
     def extract_file(self, filename: str) -> Optional[bytes]:
         """Extract a specific file from the archive."""
-        if self._zipfile and filename in self._zipfile.namelist():
-            return self._zipfile.read(filename)
+        if self._temp_dir:
+            staged_path = self._staged_path(filename)
+            return staged_path.read_bytes() if staged_path else None
+        info = self._infos.get(filename)
+        if self._zipfile and info:
+            return self._zipfile.read(info)
         return None
         
-    def add_file(self, filename: str, data: Union[str, bytes]):
-        """Add a file to the archive."""
-        if self._zipfile:
-            if isinstance(data, str):
-                data = data.encode('utf-8')
-            self._zipfile.writestr(filename, data)
+    def add_file(self, filename: str, data: Union[str, bytes, Iterable[Union[str, bytes]]]):
+        """
+        Add a file to the archive.
+        
+        Args:
+            filename: Path of the file inside the archive
+            data: File content, or an iterable of text/byte chunks that are
+                encoded and written one at a time as they are produced
+        """
+        temp_path = self.get_temp_path()
+        if not temp_path:
+            if self._zipfile:
+                raise ValueError("Cannot add files to an archive opened for reading")
+            return
+        streamed = not isinstance(data, (str, bytes))
+        data = _coalesce_chunks(data) if streamed else [data]
+            
+        # Entries are only staged, the archive is packed from the temporary directory on exit
+        staged_path = temp_path / filename
+        staged_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.ExitStack() as stack:
+            staged_file = stack.enter_context(open(staged_path, 'wb'))
+            # File writes release the GIL, so a generator's chunks are written
+            # in a background thread while the next chunk is produced
+            writer = stack.enter_context(ThreadPoolExecutor(max_workers=1)) if streamed else None
+            pending = None
+            for chunk in data:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                if writer:
+                    if pending:
+                        pending.result()
+                    pending = writer.submit(staged_file.write, chunk)
+                else:
+                    staged_file.write(chunk)
+            if pending:
+                pending.result()
+    
+    @staticmethod
+    def copy_raw_member(source: zipfile.ZipFile, dest: zipfile.ZipFile, info: zipfile.ZipInfo,
+                        chunk_size: int = 64 * 1024):
+        """
+        Copy one member's compressed bytes from ``source`` to ``dest`` without inflating and deflating them.
+        
+        The entry is appended through ZipFile internals; if they or the
+        member's local header are not what this expects, the member is
+        re-compressed through ``ZipFile.open`` instead.
+        
+        Args:
+            source: Zip file opened for reading
+            dest: Zip file opened in 'w' mode with no member open for writing,
+                the entry is appended to it behind ``ZipFile``'s back
+            info: Member of ``source`` to copy
+            chunk_size: Size of the pieces the member data is copied in
+            
+        Raises:
+            ValueError: If ``dest`` is not in 'w' mode or has a member open for writing
+            zipfile.BadZipFile: If ``source`` ends before the member data does
+        """
+        if dest.mode != 'w' or getattr(dest, '_writing', False):
+            raise ValueError("Raw members can only be copied into a 'w' zip file with no open member")
+        
+        if not all(hasattr(dest, name) for name in _RAW_COPY_ATTRIBUTES):
+            _recompress_member(source, dest, info, chunk_size)
+            return
+        
+        # Skip the member's local header, its name and extra field lengths are at offset 26
+        source.fp.seek(info.header_offset)
+        header = source.fp.read(zipfile.sizeFileHeader)
+        if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+            _recompress_member(source, dest, info, chunk_size)
+            return
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        
+        # Same CRC, sizes and compression, written with a fresh local header;
+        # the sizes are known, so no data descriptor follows the data
+        copied = copy.copy(info)
+        copied.flag_bits &= ~0x08
+        copied.extra = _strip_zip64_extra(info.extra)
+        copied.header_offset = dest.fp.tell()
+        dest.fp.write(copied.FileHeader())
+        
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.fp.read(min(chunk_size, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename!r}")
+            dest.fp.write(chunk)
+            remaining -= len(chunk)
+        
+        dest.filelist.append(copied)
+        dest.NameToInfo[copied.filename] = copied
+        dest.start_dir = dest.fp.tell()
     
     def is_writable(self) -> bool:
         """Check if the archive is opened in a writable mode."""
@@ -137,7 +374,7 @@ def list_contents() -> list[str]:
 def extract_file(filename: str) -> Optional[bytes]:
     pass
 @context_function(current_archive)
-def add_file(filename: str, data: Union[str, bytes]) -> None:
+def add_file(filename: str, data: Union[str, bytes, Iterable[Union[str, bytes]]]) -> None:
     pass
 @context_function(current_archive)
 def get_temp_path() -> Optional[Path]:
@@ -38,7 +38,7 @@ class Directory:
             raise RuntimeError("Directory must be used within an Archive context")
             
         # Create directory in the temporary location if needed
-        if self.create:
+        if self.create and not self._reads_archive():
             self._ensure_directory_exists()
             
         return self
@@ -69,12 +69,24 @@ class Directory:
             full_path = temp_path / self.path
             full_path.mkdir(parents=True, exist_ok=True)
                     
+    def _reads_archive(self) -> bool:
+        """Whether the parent archive is read-only and served from its index."""
+        return self._parent_archive is not None and not self._parent_archive.is_writable()
+        
+    def _member_names(self) -> List[str]:
+        """Archive member names below this directory, relative to it."""
+        prefix = self.get_archive_path().rstrip('/') + '/'
+        return [name[len(prefix):] for name in self._parent_archive.list_contents()
+                if name.startswith(prefix)]
+                    
     def get_archive_path(self) -> str:
         """Get the path as it appears in the archive."""
         return str(self.path).replace('\\', '/')
         
     def exists(self) -> bool:
         """Check if this directory exists."""
+        if self._reads_archive():
+            return bool(self._member_names())
         full_path = self.get_full_path()
         return full_path.exists() if full_path else False
 
@@ -95,6 +107,9 @@ class Directory:
         
     def list_subdirectories(self) -> List[str]:
         """List subdirectories in this directory."""
+        if self._reads_archive():
+            names = self._member_names()
+            return list(dict.fromkeys(name.split('/', 1)[0] for name in names if '/' in name))
         full_path = self.get_full_path()
         if full_path and full_path.exists():
             return [d.name for d in full_path.iterdir() if d.is_dir()]
@@ -102,6 +117,8 @@ class Directory:
 
     def list_files(self) -> List[str]:
         """List files in this directory."""
+        if self._reads_archive():
+            return [name for name in self._member_names() if name and '/' not in name]
         full_path = self.get_full_path()
         if full_path and full_path.exists():
             return [f.name for f in full_path.iterdir() if f.is_file()]
@@ -121,6 +138,8 @@ class Directory:
                 
     def read_file(self, filename: str) -> Optional[bytes]:
         """Read a file from this directory."""
+        if self._reads_archive():
+            return self._parent_archive.extract_file(f"{self.get_archive_path()}/{filename}")
         full_path = self.get_full_path()
         if full_path:
             file_path = full_path / filename
@@ -3,9 +3,19 @@
 
 """
 
+import io
+import itertools
+import os
+import re
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import quoteattr, unescape
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterator, Union
 from contextvars import ContextVar
 import numpy as np
 from stl import mesh
@@ -14,6 +24,12 @@ from noah123d.visual.console import Console as NoahConsole
 
 from ..core.context_decorators import context_function
 
+# Optional vertex cache optimization for add_object(optimize=True)
+try:
+    import meshoptimizer
+except ImportError:
+    meshoptimizer = None
+
 from .archive import Archive, current_archive
 from .directory import Directory, current_directory, current_directory
 
@@ -21,6 +37,370 @@ from .directory import Directory, current_directory, current_directory
 current_model: ContextVar[Optional['Model']] = ContextVar('current_model', default=None)
 
 
+def _as_vertex_array(vertices) -> np.ndarray:
+    """Return vertex coordinates as a contiguous float32 (N, 3) array."""
+    return np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+
+
+def _as_triangle_array(triangles, vertex_count: Optional[int] = None) -> np.ndarray:
+    """Return triangle indices as a contiguous uint32 (M, 3) array.
+    
+    Indices are checked before the cast, a negative index, one that does not
+    fit uint32 or, when ``vertex_count`` is given, one past the last vertex
+    raises ValueError.
+    """
+    indices = np.asarray(triangles)
+    if indices.size:
+        if indices.dtype.kind != 'u' and indices.min() < 0:
+            raise ValueError("Triangle indices must not be negative")
+        if vertex_count is None:
+            limit, scope = np.iinfo(np.uint32).max, "uint32"
+        else:
+            limit, scope = vertex_count - 1, f"{vertex_count} vertices"
+        if indices.max() > limit:
+            raise ValueError(f"Triangle index out of range for {scope}")
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
+    if indices.ndim != 2 or indices.shape[1] != 3:
+        # An array that already fits is passed through, copies keep sharing it
+        indices = indices.reshape(-1, 3)
+    return indices
+
+
+def _optimize_mesh(vertices: np.ndarray, triangles: np.ndarray) -> tuple:
+    """
+    Reorder a mesh for vertex cache and vertex fetch locality.
+    
+    With ``meshoptimizer`` installed the triangles are first reordered for
+    the post-transform vertex cache. The vertices are then renumbered in the
+    order the triangles first use them, dropping unused vertices, so they
+    are read sequentially.
+    
+    Args:
+        vertices: float32 array of shape (N, 3)
+        triangles: uint32 array of shape (M, 3)
+        
+    Returns:
+        Tuple of the reordered (vertices, triangles) arrays
+    """
+    indices = triangles.ravel()
+    if meshoptimizer is not None and len(indices):
+        cache_ordered = np.empty_like(indices)
+        meshoptimizer.optimize_vertex_cache(cache_ordered, indices, len(indices), len(vertices))
+        indices = cache_ordered
+        
+    used, first_use = np.unique(indices, return_index=True)
+    fetch_order = used[np.argsort(first_use)]
+    remap = np.zeros(len(vertices), dtype=np.uint32)
+    remap[fetch_order] = np.arange(len(fetch_order), dtype=np.uint32)
+    return vertices[fetch_order], remap[indices].reshape(-1, 3)
+
+
+_CORE_NAMESPACE = 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'
+
+# One line per vertex/triangle, indented like ET.indent() would; '%.9g'
+# round-trips float32 coordinates exactly
+_VERTEX_LINE = '          <vertex x="%.9g" y="%.9g" z="%.9g" />\n'
+_TRIANGLE_LINE = '          <triangle v1="%d" v2="%d" v3="%d" />\n'
+
+# Document scaffolding with the constants baked in, only ids and types vary per object
+_MODEL_HEADER = ("<?xml version='1.0' encoding='utf-8'?>\n"
+                 f'<model unit="millimeter" xmlns="{_CORE_NAMESPACE}">\n')
+_OBJECT_OPEN = '    <object id="%d" type=%s>\n      <mesh>\n        <vertices>\n'
+_OBJECT_EMPTY = '    <object id="%d" type=%s />\n'
+_MESH_MIDDLE = '        </vertices>\n        <triangles>\n'
+_OBJECT_CLOSE = '        </triangles>\n      </mesh>\n    </object>\n'
+_ITEM_LINE = '    <item objectid="%d" />\n'
+# Build item placing an object translated, the 3MF transform is a 3x4 matrix
+# written row by row with the translation last
+_ITEM_TRANSLATED_LINE = '    <item objectid="%d" transform="1 0 0 0 1 0 0 0 1 %.9g %.9g %.9g" />\n'
+_IDENTITY_ROTATION = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+# Loading fast path for documents laid out like the ones written above
+_CORE_XMLNS = f'xmlns="{_CORE_NAMESPACE}"'.encode()
+_OBJECT_PATTERN = re.compile(rb'<object\b([^>]*?)(?:/>|>(.*?)</object>)', re.S)
+_ATTRIBUTE_PATTERN = re.compile(rb'(\w+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_VERTEX_PATTERN = re.compile(rb'<vertex x="([^"]*)" y="([^"]*)" z="([^"]*)"\s*/>')
+_TRIANGLE_PATTERN = re.compile(rb'<triangle v1="([^"]*)" v2="([^"]*)" v3="([^"]*)"\s*/>')
+_ITEM_PATTERN = re.compile(rb'<item\b([^>]*?)/?>')
+
+
+def _scan_attributes(tag: bytes) -> Dict[bytes, bytes]:
+    """Map the attribute names of a start tag to their raw values, in either quote style."""
+    return {name: double or single for name, double, single in _ATTRIBUTE_PATTERN.findall(tag)}
+
+
+def _parse_numbers(values: List[tuple], dtype) -> Optional[np.ndarray]:
+    """Convert regex captured number triples to a flat array, None if one does not parse."""
+    text = b' '.join(itertools.chain.from_iterable(values)).decode('latin-1')
+    try:
+        numbers = np.fromstring(text, dtype=dtype, sep=' ')
+    except ValueError:
+        return None
+    return numbers if len(numbers) == 3 * len(values) else None
+
+
+def _parse_attribute_numbers(values: List[str], dtype) -> np.ndarray:
+    """Convert attribute strings to a flat array, ParseError unless each holds exactly one number."""
+    try:
+        numbers = np.fromstring(' '.join(values), dtype=dtype, sep=' ')
+    except ValueError:
+        numbers = None
+    if numbers is None or len(numbers) != len(values):
+        raise ET.ParseError("Mesh attributes must each hold a single number")
+    return numbers
+
+
+def _scan_mesh_objects(model_data: bytes) -> Optional[List[Dict[str, Any]]]:
+    """
+    Parse the objects of a model document with regular expressions.
+    
+    Handles the layout this module writes (core namespace as the default
+    namespace, attributes in ``x y z`` and ``v1 v2 v3`` order) several times
+    faster than ``iterparse``, as no element is ever built.
+    
+    Args:
+        model_data: Model XML document
+        
+    Returns:
+        List of object dicts, or None if the document is laid out differently
+        and has to go through the XML parser
+    """
+    if _CORE_XMLNS not in model_data[:4096]:
+        return None
+    objects = []
+    vertex_count = triangle_count = 0
+    for match in _OBJECT_PATTERN.finditer(model_data):
+        attributes = _scan_attributes(match.group(1))
+        body = match.group(2) or b''
+        vertex_rows = _VERTEX_PATTERN.findall(body)
+        triangle_rows = _TRIANGLE_PATTERN.findall(body)
+        vertices = _parse_numbers(vertex_rows, np.float32)
+        triangles = _parse_numbers(triangle_rows, np.int64)
+        if vertices is None or triangles is None:
+            return None
+        # An index past the matched vertices is either invalid or points at a
+        # vertex the pattern skipped, the XML parser tells the two apart
+        if len(triangles) and triangles.max() >= len(vertex_rows):
+            return None
+        vertex_count += len(vertex_rows)
+        triangle_count += len(triangle_rows)
+        objects.append({
+            'id': int(attributes.get(b'id', b'0')),
+            'type': unescape(attributes.get(b'type', b'model').decode('utf-8')),
+            'vertices': _as_vertex_array(vertices),
+            'triangles': _as_triangle_array(triangles)
+        })
+        
+    # Any element the patterns skipped (other attribute order, prefixes, ...)
+    # shows up as a count mismatch
+    if (len(objects) != model_data.count(b'<object')
+            or vertex_count != model_data.count(b'<vertex')
+            or triangle_count != model_data.count(b'<triangle') - model_data.count(b'<triangles')):
+        return None
+    return objects
+
+
+def _scan_build_instances(model_data: bytes) -> Dict[int, List[tuple]]:
+    """
+    Read the translated build items of a model document.
+    
+    Args:
+        model_data: Model XML document
+        
+    Returns:
+        Dictionary mapping object IDs to their instance translations, for
+        objects placed by more than one item or by a translated item. Items
+        with a rotation or scale cannot be represented and are skipped, as
+        are items with a malformed object ID or transform.
+    """
+    placements: Dict[int, List[tuple]] = {}
+    for match in _ITEM_PATTERN.finditer(model_data):
+        attributes = _scan_attributes(match.group(1))
+        try:
+            obj_id = int(attributes[b'objectid'])
+            values = tuple(float(value) for value in attributes.get(b'transform', b'').split())
+        except (KeyError, ValueError):
+            continue
+        translation = (0.0, 0.0, 0.0)
+        if values:
+            if len(values) != 12 or values[:9] != _IDENTITY_ROTATION:
+                continue
+            translation = values[9:]
+        placements.setdefault(obj_id, []).append(translation)
+    return {obj_id: translations for obj_id, translations in placements.items()
+            if len(translations) > 1 or translations[0] != (0.0, 0.0, 0.0)}
+
+
+@lru_cache(maxsize=None)
+def _quote_type(obj_type: str) -> str:
+    """Return an object type as a quoted XML attribute value (few distinct types exist)."""
+    return quoteattr(obj_type)
+
+
+def _iter_row_blocks(line: str, rows: np.ndarray, block_size: int = 8192) -> Iterator[str]:
+    """
+    Format a (N, 3) array with the ``line`` template, one block of rows at a time.
+    
+    Each block of rows is formatted by one ``%`` operation over the repeated
+    template, so no Python code runs per row. A block of 8192 rows is a few
+    hundred KB of text, small enough to stay in cache while it is encoded
+    and compressed.
+    """
+    for i in range(0, len(rows), block_size):
+        block = rows[i:i + block_size]
+        yield (line * len(block)) % tuple(block.ravel().tolist())
+
+
+# Parsed STL meshes and their indexed arrays are kept for reuse up to this
+# many bytes in total, so repeated layouts of the same parts share one parse
+# while a batch of large files does not stay pinned in memory
+_STL_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class _ByteBoundedCache:
+    """Least recently used cache bounded by the total size of its values, not their count."""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        
+    def get(self, key: tuple, load, sizeof):
+        """Return the cached value for ``key``, calling ``load()`` and keeping the result if it fits."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+        value = load()
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self._size += size
+            while self._size > self.max_bytes:
+                _key, (_value, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+        return value
+
+
+_stl_cache = _ByteBoundedCache(_STL_CACHE_BYTES)
+
+
+def _load_stl_mesh(stl_path: Union[str, Path]) -> mesh.Mesh:
+    """
+    Load an STL file as a numpy-stl mesh.
+    
+    Parsed meshes are cached per resolved path and modification time, so
+    loading the same file again is a dictionary lookup. The cached mesh is
+    shared and its data is read-only.
+    """
+    stl_path = Path(stl_path).resolve()
+    return _cached_stl_mesh(stl_path, stl_path.stat().st_mtime_ns)
+
+
+def _cached_stl_mesh(stl_path: Path, mtime_ns: int) -> mesh.Mesh:
+    """Get the mesh of ``stl_path`` from the STL cache, reading it on a miss."""
+    return _stl_cache.get(('mesh', stl_path, mtime_ns), lambda: _read_stl_mesh(stl_path),
+                          lambda stl_mesh: np.asarray(stl_mesh.vectors).nbytes)
+
+
+def _read_stl_mesh(stl_path: Path) -> mesh.Mesh:
+    """
+    Read an STL file.
+    
+    Binary files (84 byte header + 50 byte records) are read with a single
+    ``np.fromfile`` into numpy-stl's record dtype; anything else (ASCII STL)
+    goes through ``mesh.Mesh.from_file``. Normals are not recalculated, 3MF
+    meshes do not store them.
+    """
+    stl_mesh = None
+    with open(stl_path, 'rb') as fh:
+        header = fh.read(84)
+        if len(header) == 84:
+            count = int(np.frombuffer(header, dtype='<u4', count=1, offset=80)[0])
+            if stl_path.stat().st_size == 84 + count * mesh.Mesh.dtype.itemsize:
+                data = np.fromfile(fh, dtype=mesh.Mesh.dtype, count=count)
+                stl_mesh = mesh.Mesh(data, calculate_normals=False, name=stl_path.name)
+    if stl_mesh is None:
+        stl_mesh = mesh.Mesh.from_file(str(stl_path), calculate_normals=False, speedups=True)
+    
+    stl_mesh.data.setflags(write=False)
+    return stl_mesh
+
+
+def _stl_bounds(stl_path: Union[str, Path]) -> tuple:
+    """
+    Get the triangle count and bounding box of an STL file.
+    
+    Binary files are memory-mapped and reduced over the triangle corners
+    in place, without parsing or caching the mesh; ASCII files fall back to
+    :func:`_load_stl_mesh`.
+    
+    Returns:
+        Tuple of (triangle count, bbox min (3,), bbox max (3,))
+    """
+    stl_path = Path(stl_path)
+    file_size = stl_path.stat().st_size
+    with open(stl_path, 'rb') as fh:
+        fh.seek(80)
+        count = int.from_bytes(fh.read(4), 'little')
+    if count and file_size == 84 + count * mesh.Mesh.dtype.itemsize:
+        corners = np.memmap(stl_path, dtype=mesh.Mesh.dtype, mode='r',
+                            offset=84, shape=(count,))['vectors']
+    else:
+        corners = _load_stl_mesh(stl_path).vectors
+        count = len(corners)
+    return count, corners.min(axis=(0, 1)), corners.max(axis=(0, 1))
+
+
+def _load_stl_arrays(stl_path: Union[str, Path]) -> tuple:
+    """
+    Load an STL file as shared (vertices, triangles) arrays.
+    
+    Cached like :func:`_load_stl_mesh`; both arrays are read-only.
+    """
+    stl_path = Path(stl_path).resolve()
+    mtime_ns = stl_path.stat().st_mtime_ns
+    return _stl_cache.get(('arrays', stl_path, mtime_ns), lambda: _index_stl_mesh(stl_path, mtime_ns),
+                          lambda arrays: arrays[0].nbytes + arrays[1].nbytes)
+
+
+def _index_stl_mesh(stl_path: Path, mtime_ns: int) -> tuple:
+    """Index the cached mesh of ``stl_path`` into read-only SoA arrays."""
+    vertices, triangles = _index_vertices(_cached_stl_mesh(stl_path, mtime_ns).vectors)
+    vertices = _as_vertex_array(vertices)
+    triangles = _as_triangle_array(triangles)
+    vertices.setflags(write=False)
+    triangles.setflags(write=False)
+    return vertices, triangles
+
+
+def _index_vertices(vectors) -> tuple:
+    """
+    Collapse per-triangle corner coordinates into shared vertices.
+    
+    Args:
+        vectors: Triangle corners, shape (M, 3, 3)
+        
+    Returns:
+        Tuple of (vertices (N, 3), triangles (M, 3)); vertices are numbered in
+        order of first appearance
+    """
+    corners = np.asarray(vectors, dtype=np.float32).reshape(-1, 3)
+    _unique, first, inverse = np.unique(corners, axis=0, return_index=True, return_inverse=True)
+    
+    # np.unique sorts the rows, renumber them by first appearance instead
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    
+    return corners[first[order]], rank[inverse.reshape(-1)].reshape(-1, 3)
+
+
 class Model:
     """Manages 3D objects within a 3MF archive."""
     
@@ -36,6 +416,7 @@ class Model:
         self._parent_archive: Optional[Archive] = None
         self._parent_directory: Optional[Directory] = None
         self._objects: List[Dict[str, Any]] = []
+        self._instances: Dict[int, List[tuple]] = {}
         self._next_object_id = 1
         self.console = NoahConsole()
         
@@ -74,173 +455,199 @@ class Model:
         # Get the model directory name from parent directory context
         model_dir = self._parent_directory.path.name if self._parent_directory else "3D"
         model_path = f"{model_dir}/{self.name}"
-        model_data = self._parent_archive.extract_file(model_path)
+        model_file = self._parent_archive.open_member(model_path)
         
-        if model_data:
+        if model_file:
+            with model_file:
+                model_data = model_file.read()
             try:
-                root = ET.fromstring(model_data.decode('utf-8'))
-                self._parse_existing_objects(root)
-            except (ET.ParseError, UnicodeDecodeError):
+                objects = self._parse_existing_objects(model_data)
+                instances = _scan_build_instances(model_data)
+            except (ET.ParseError, UnicodeDecodeError, ValueError):
                 # If parsing fails, start with empty model
-                pass
+                return
+                
+            for obj in objects:
+                # Update next object ID
+                if obj['id'] >= self._next_object_id:
+                    self._next_object_id = obj['id'] + 1
+            self._objects.extend(objects)
+            self._instances.update(instances)
                 
-    def _parse_existing_objects(self, root: ET.Element):
-        """Parse existing objects from XML."""
-        # Find all object elements
-        ns = {'model': 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'}
+    def _parse_existing_objects(self, model_data: bytes) -> List[Dict[str, Any]]:
+        """Parse existing objects from XML.
+        
+        Documents in the layout this module writes are scanned with regular
+        expressions. Anything else is parsed with ``iterparse``, and every
+        ``<object>`` element is cleared once consumed, so the element tree
+        never holds more than a single object instead of the whole document.
+        """
+        objects = _scan_mesh_objects(model_data)
+        if objects is not None:
+            return objects
+            
+        ns = f'{{{_CORE_NAMESPACE}}}'
+        object_tag = f'{ns}object'
+        vertex_path = f'{ns}mesh/{ns}vertices/{ns}vertex'
+        triangle_path = f'{ns}mesh/{ns}triangles/{ns}triangle'
+        objects = []
         
-        for obj_elem in root.findall('.//model:object', ns):
+        for _event, obj_elem in ET.iterparse(io.BytesIO(model_data), events=('end',)):
+            if obj_elem.tag != object_tag:
+                continue
+                
             obj_id = int(obj_elem.get('id', 0))
             obj_type = obj_elem.get('type', 'model')
-            
-            # Update next object ID
-            if obj_id >= self._next_object_id:
-                self._next_object_id = obj_id + 1
                 
-            # Parse mesh data if present
-            mesh_elem = obj_elem.find('model:mesh', ns)
-            vertices = []
-            triangles = []
-            
-            if mesh_elem is not None:
-                # Parse vertices
-                for vertex_elem in mesh_elem.findall('model:vertices/model:vertex', ns):
-                    x = float(vertex_elem.get('x', 0))
-                    y = float(vertex_elem.get('y', 0))
-                    z = float(vertex_elem.get('z', 0))
-                    vertices.append([x, y, z])
+            # Parse mesh data if present, the attribute strings are collected
+            # flat and converted to typed arrays in one pass
+            coordinates = []
+            for v in obj_elem.iterfind(vertex_path):
+                attrib = v.attrib
+                coordinates += (attrib.get('x', '0'), attrib.get('y', '0'), attrib.get('z', '0'))
+            indices = []
+            for t in obj_elem.iterfind(triangle_path):
+                attrib = t.attrib
+                indices += (attrib.get('v1', '0'), attrib.get('v2', '0'), attrib.get('v3', '0'))
                     
-                # Parse triangles
-                for triangle_elem in mesh_elem.findall('model:triangles/model:triangle', ns):
-                    v1 = int(triangle_elem.get('v1', 0))
-                    v2 = int(triangle_elem.get('v2', 0))
-                    v3 = int(triangle_elem.get('v3', 0))
-                    triangles.append([v1, v2, v3])
-                    
-            self._objects.append({
+            vertices = _as_vertex_array(_parse_attribute_numbers(coordinates, np.float32))
+            objects.append({
                 'id': obj_id,
                 'type': obj_type,
                 'vertices': vertices,
-                'triangles': triangles
+                'triangles': _as_triangle_array(_parse_attribute_numbers(indices, np.int64), len(vertices))
             })
+            obj_elem.clear()
+            
+        return objects
             
     def _save_model(self):
         """Save the model to the archive."""
         if not self._parent_archive:
             return
             
-        # Create XML structure
-        model_xml = self._create_model_xml()
-        
         # Get the model directory name from parent directory context
         model_dir = self._parent_directory.path.name if self._parent_directory else "3D"
         model_path = f"{model_dir}/{self.name}"
-        self._parent_archive.add_file(model_path, model_xml)
+        
+        # Stream the XML into the archive block by block instead of building the whole document
+        self._parent_archive.add_file(model_path, self._iter_model_xml())
         
     def _create_model_xml(self) -> str:
         """Create the 3MF model XML."""
-        # Create root element
-        root = ET.Element('model')
-        root.set('unit', 'millimeter')
-        root.set('xmlns', 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02')
+        return ''.join(self._iter_model_xml())
         
-        # Create resources element
-        resources = ET.SubElement(root, 'resources')
+    def _iter_model_xml(self) -> Iterator[str]:
+        """Generate the 3MF model XML in pieces.
+        
+        The document is written as text rather than through an element tree;
+        each mesh block is produced by a single ``%`` format over a block of
+        the mesh array (see :func:`_iter_row_blocks`).
+        """
+        yield _MODEL_HEADER
         
         # Add objects
-        for obj in self._objects:
-            obj_elem = ET.SubElement(resources, 'object')
-            obj_elem.set('id', str(obj['id']))
-            obj_elem.set('type', obj['type'])
+        yield '  <resources>\n' if self._objects else '  <resources />\n'
+        # Copies of one mesh (grids, assemblies) share their triangle array,
+        # its text is kept while formatting it and repeated for the following
+        # copies; it is dropped when the run of copies ends, so a mesh that is
+        # not shared is still streamed block by block
+        objects = self._objects
+        shared_triangles = shared_text = None
+        for index, obj in enumerate(objects):
+            obj_attrs = (obj['id'], _quote_type(obj['type']))
             
-            if obj['vertices'] and obj['triangles']:
-                # Create mesh
-                mesh_elem = ET.SubElement(obj_elem, 'mesh')
-                
-                # Add vertices
-                vertices_elem = ET.SubElement(mesh_elem, 'vertices')
-                for vertex in obj['vertices']:
-                    vertex_elem = ET.SubElement(vertices_elem, 'vertex')
-                    vertex_elem.set('x', str(vertex[0]))
-                    vertex_elem.set('y', str(vertex[1]))
-                    vertex_elem.set('z', str(vertex[2]))
-                    
-                # Add triangles
-                triangles_elem = ET.SubElement(mesh_elem, 'triangles')
-                for triangle in obj['triangles']:
-                    triangle_elem = ET.SubElement(triangles_elem, 'triangle')
-                    triangle_elem.set('v1', str(triangle[0]))
-                    triangle_elem.set('v2', str(triangle[1]))
-                    triangle_elem.set('v3', str(triangle[2]))
+            if len(obj['vertices']) and len(obj['triangles']):
+                yield _OBJECT_OPEN % obj_attrs
+                yield from _iter_row_blocks(_VERTEX_LINE, obj['vertices'])
+                yield _MESH_MIDDLE
+                triangles = obj['triangles']
+                next_shares = index + 1 < len(objects) and objects[index + 1]['triangles'] is triangles
+                if triangles is shared_triangles:
+                    yield from shared_text
+                elif next_shares:
+                    shared_text = []
+                    for block in _iter_row_blocks(_TRIANGLE_LINE, triangles):
+                        shared_text.append(block)
+                        yield block
+                else:
+                    yield from _iter_row_blocks(_TRIANGLE_LINE, triangles)
+                if next_shares:
+                    shared_triangles = triangles
+                else:
+                    shared_triangles = shared_text = None
+                yield _OBJECT_CLOSE
+            else:
+                yield _OBJECT_EMPTY % obj_attrs
+        if self._objects:
+            yield '  </resources>\n'
                     
-        # Create build element
-        build = ET.SubElement(root, 'build')
+        # Create build element, only model objects are added to the build,
+        # once per instance for objects that have instances
+        items = []
         for obj in self._objects:
-            if obj['type'] == 'model':  # Only add model objects to build
-                item = ET.SubElement(build, 'item')
-                item.set('objectid', str(obj['id']))
-                
-        # Convert to string
-        ET.indent(root, space="  ", level=0)
-        return ET.tostring(root, encoding='unicode', xml_declaration=True)
+            if obj['type'] != 'model':
+                continue
+            translations = self._instances.get(obj['id'])
+            if translations is None:
+                items.append(_ITEM_LINE % obj['id'])
+            else:
+                items.extend(_ITEM_TRANSLATED_LINE % (obj['id'], *translation) for translation in translations)
+        if items:
+            yield '  <build>\n'
+            yield from items
+            yield '  </build>\n'
+        else:
+            yield '  <build />\n'
+        yield '</model>'
         
     def add_object_from_stl(self, stl_path: Union[str, Path]) -> int:
         """
         Add an object from an STL file.
         
+        The mesh arrays are shared with the STL cache and read-only; copy them
+        before modifying the object in place.
+        
         Args:
             stl_path: Path to the STL file
             
         Returns:
             Object ID of the added object
         """
-        stl_mesh = mesh.Mesh.from_file(str(stl_path))
-        
-        # Convert STL mesh to vertices and triangles
-        vertices = []
-        triangles = []
-        
-        vertex_map = {}
-        vertex_index = 0
-        
-        for triangle in stl_mesh.vectors:
-            triangle_indices = []
-            
-            for vertex in triangle:
-                # Create a hashable key for the vertex
-                vertex_key = tuple(vertex)
-                
-                if vertex_key not in vertex_map:
-                    vertex_map[vertex_key] = vertex_index
-                    # Handle both numpy arrays and plain lists
-                    if hasattr(vertex, 'tolist'):
-                        vertices.append(vertex.tolist())
-                    else:
-                        vertices.append(list(vertex))
-                    vertex_index += 1
-                    
-                triangle_indices.append(vertex_map[vertex_key])
-                
-            triangles.append(triangle_indices)
+        # Shared vertices and triangles, parsed once per file version
+        vertices, triangles = _load_stl_arrays(stl_path)
             
         return self.add_object(vertices, triangles)
         
     def add_object( self, vertices: List[List[float]], triangles: List[List[int]], 
-                    obj_type: str = "model") -> int:
+                    obj_type: str = "model", optimize: bool = False) -> int:
         """
         Add a 3D object to the model.
         
+        The mesh is stored as two contiguous arrays, ``float32`` vertex
+        coordinates of shape (N, 3) and ``uint32`` triangle indices of
+        shape (M, 3), converted once from whatever sequence is passed in.
+        
         Args:
-            vertices: List of vertex coordinates [x, y, z]
-            triangles: List of triangle vertex indices [v1, v2, v3]
+            vertices: List (or array) of vertex coordinates [x, y, z]
+            triangles: List (or array) of triangle vertex indices [v1, v2, v3]
             obj_type: Type of object (default: "model")
+            optimize: Reorder triangles and vertices for cache locality
+                (default: False). Unused vertices are dropped; the vertex
+                cache pass needs ``meshoptimizer`` to be installed.
             
         Returns:
-            Object ID of the added object
+            Object ID of the added object, a negative or out-of-range
+            triangle index raises ValueError
         """
+        vertices = _as_vertex_array(vertices)
+        triangles = _as_triangle_array(triangles, len(vertices))
         obj_id = self._next_object_id
         self._next_object_id += 1
         
+        if optimize:
+            vertices, triangles = _optimize_mesh(vertices, triangles)
+        
         self._objects.append({
             'id': obj_id,
             'type': obj_type,
@@ -263,11 +670,42 @@ class Model:
         for i, obj in enumerate(self._objects):
             if obj['id'] == obj_id:
                 del self._objects[i]
+                self._instances.pop(obj_id, None)
                 return True
         return False
         
+    def add_instance(self, obj_id: int, translation: List[float]) -> bool:
+        """
+        Place a translated instance of an object in the build.
+        
+        The mesh is written once and every instance becomes a build item
+        with a translation transform, instead of a full copy of the mesh.
+        Once an object has instances, it is placed only by them.
+        
+        Args:
+            obj_id: ID of the object to place
+            translation: X, Y, Z offset of the instance
+            
+        Returns:
+            True if the instance was added, False if the object was not found
+        """
+        if obj_id not in self.list_objects():
+            return False
+        x, y, z = (float(value) for value in translation)
+        self._instances.setdefault(obj_id, []).append((x, y, z))
+        return True
+        
+    def get_instances(self, obj_id: int) -> List[List[float]]:
+        """Get the instance translations of an object, empty if it is placed once as is."""
+        return [list(translation) for translation in self._instances.get(obj_id, [])]
+        
     def get_object(self, obj_id: int) -> Optional[Dict[str, Any]]:
-        """Get an object by ID."""
+        """Get an object by ID.
+        
+        The returned dict is a copy, but its ``vertices`` (float32, N x 3) and
+        ``triangles`` (uint32, M x 3) arrays are the stored ones; use
+        ``len()``/``.shape`` on them and replace rather than modify them.
+        """
         for obj in self._objects:
             if obj['id'] == obj_id:
                 return obj.copy()
@@ -284,6 +722,7 @@ class Model:
     def clear_objects(self):
         """Remove all objects from the model."""
         self._objects.clear()
+        self._instances.clear()
         self._next_object_id = 1
         
     @classmethod
@@ -389,16 +828,22 @@ Conversion Date: {Path.cwd()}
 
     
     @classmethod
-    def convert_stl_to_3mf(cls, stl_path: Path, output_path: Path) -> Optional[Path]:
+    def convert_stl_to_3mf(cls, stl_path: Path, output_path: Path, 
+                           return_model: bool = False,
+                           verbose: bool = True) -> Optional[Union[Path, tuple]]:
         """
         Convert an STL file to a 3MF archive using the context system.
         
         Args:
             stl_path: Path to the input STL file
             output_path: Path to the output 3MF file
+            return_model: Also return the written Model, which can be passed
+                to :meth:`analyze_3mf_content` to skip re-reading the archive
+            verbose: Print each conversion step; errors are always printed
             
         Returns:
-            Path to the created 3MF file or None if conversion failed
+            Path to the created 3MF file (or a (path, model) tuple with
+            ``return_model``), None if conversion failed
         """
         console = NoahConsole()
         
@@ -406,23 +851,29 @@ Conversion Date: {Path.cwd()}
             console.print_error(f"Error: STL file not found: {stl_path}")
             return None
 
-        console.print_start('conversion', 
-                            {'summary': 'STL to 3MF', 
-                                '- input': stl_path, 
-                                '- output': output_path})
+        if verbose:
+            console.print_start('conversion', 
+                                {'summary': 'STL to 3MF', 
+                                    '- input': stl_path, 
+                                    '- output': output_path})
 
         # Create the 3MF archive using the context system
         with Archive(output_path, 'w') as archive:
-            console.print_archive_created(archive.file_path)
+            if verbose:
+                console.print_archive_created(archive.file_path)
             
             # Create the 3D directory using the context system
             with Directory('3D') as models_dir:
-                console.print_directory_created("3D models")
+                if verbose:
+                    console.print_directory_created("3D models")
                 
                 # Create a model within the directory context
                 with cls("3dmodel.model") as model:
                     # Load STL using the new method
-                    obj_id = model.load_stl_with_info(stl_path)
+                    if verbose:
+                        obj_id = model.load_stl_with_info(stl_path)
+                    else:
+                        obj_id = model.add_object_from_stl(stl_path)
                     if obj_id is None:
                         return None
                     
@@ -436,18 +887,23 @@ Converted by: Noah123d STL Converter
 Objects: {object_count}
 """
                 metadata_dir.create_file('conversion_info.txt', metadata_content)
-                console.print_metadata_added()
+                if verbose:
+                    console.print_metadata_added()
                 
-        console.print_success("conversion")
-        return output_path
+        if verbose:
+            console.print_success("conversion")
+        return (output_path, model) if return_model else output_path
     
     @classmethod
-    def analyze_3mf_content(cls, file_path: Path) -> None:
+    def analyze_3mf_content(cls, file_path: Path, model: Optional['Model'] = None) -> None:
         """
         Analyze and display detailed information about a 3MF file using the context system.
         
         Args:
             file_path: Path to the 3MF file to analyze
+            model: The model just written to ``file_path`` (see
+                :meth:`convert_stl_to_3mf`); its objects are analyzed in
+                memory and only the archive listing is read from disk
         """
         console = NoahConsole()
         
@@ -457,6 +913,13 @@ Objects: {object_count}
             
         console.print_analyzing_file(file_path)
         
+        if model is not None:
+            # The central directory is enough for the listing, the objects are already parsed
+            with zipfile.ZipFile(file_path) as archive_file:
+                console.print_archive_contents(archive_file.namelist())
+            model.analyze_model_content()
+            return
+        
         # Open archive using the context system
         with Archive(file_path, 'r') as archive:
             # Show archive contents
@@ -471,16 +934,26 @@ Objects: {object_count}
                     model.analyze_model_content()
     
     @classmethod
-    def batch_convert_stl_files(cls, input_dir: Path, output_dir: Path) -> List[Path]:
+    def batch_convert_stl_files(cls, input_dir: Path, output_dir: Path,
+                                max_workers: Optional[int] = None,
+                                verbose: bool = False) -> List[Path]:
         """
         Convert all STL files in a directory to 3MF format.
         
+        Files are converted in worker processes, one archive per file, and
+        reported with one line each. Files sharing an output path (same stem
+        in different directories) are converted one after another instead.
+        
         Args:
             input_dir: Directory containing STL files
             output_dir: Directory to save 3MF files
+            max_workers: Number of worker processes (default: CPU count);
+                1 converts the files one after another in this process
+            verbose: Also print the steps of each conversion; worker
+                processes always convert quietly
             
         Returns:
-            List of successfully converted 3MF files
+            List of successfully converted 3MF files, in input order
         """
         console = NoahConsole()
         
@@ -500,27 +973,65 @@ Objects: {object_count}
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        converted_files = []
+        results: Dict[Path, Optional[Path]] = {}
+        workers = min(len(stl_files), max_workers or os.cpu_count() or 1)
+        jobs = [(stl_file, output_dir / f"{stl_file.stem}.3mf") for stl_file in stl_files]
+        concurrent, serial = ([], jobs) if workers == 1 else _split_output_collisions(jobs)
         
-        for stl_file in stl_files:
-            # Create output filename
-            output_file = output_dir / f"{stl_file.stem}.3mf"
-            
-            console.print_processing_file(stl_file.name)
-            
+        if concurrent:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_convert_stl_file, cls, stl_file, output_file): stl_file
+                           for stl_file, output_file in concurrent}
+                for future in as_completed(futures):
+                    stl_file = futures[future]
+                    try:
+                        results[stl_file] = future.result()
+                        if results[stl_file]:
+                            console.print_converted_file(results[stl_file].name)
+                    except Exception as e:
+                        console.print_conversion_failed(stl_file.name, e)
+        
+        for stl_file, output_file in serial:
+            if verbose:
+                console.print_processing_file(stl_file.name)
             try:
-                result = cls.convert_stl_to_3mf(stl_file, output_file)
-                if result:
-                    converted_files.append(result)
+                results[stl_file] = cls.convert_stl_to_3mf(stl_file, output_file, verbose=verbose)
+                if results[stl_file]:
                     console.print_converted_file(output_file.name)
             except Exception as e:
                 console.print_conversion_failed(stl_file.name, e)
         
+        converted_files = [results[stl_file] for stl_file in stl_files if results.get(stl_file)]
         console.print_batch_conversion_complete(len(converted_files), output_dir)
         
         return converted_files
 
 
+def _split_output_collisions(jobs: List[tuple]) -> tuple:
+    """
+    Split (input, output path) jobs into the ones that can run concurrently and the rest.
+    
+    Inputs in different directories can share a stem and with it an output
+    path. Only the first job for each output runs concurrently, the others
+    follow one after another in input order, so the last one wins as it
+    would in a serial run instead of two processes writing one file.
+    
+    Returns:
+        Tuple of (concurrent jobs, serial jobs)
+    """
+    claimed = set()
+    concurrent, serial = [], []
+    for job in jobs:
+        (serial if job[1] in claimed else concurrent).append(job)
+        claimed.add(job[1])
+    return concurrent, serial
+
+
+def _convert_stl_file(model_cls: type, stl_path: Path, output_path: Path) -> Optional[Path]:
+    """Run ``convert_stl_to_3mf`` quietly in a worker process."""
+    return model_cls.convert_stl_to_3mf(stl_path, output_path, verbose=False)
+
+
 # Module-level convenience functions using decorators
 @context_function(current_model)
 def add_object_from_stl(stl_path: Union[str, Path]) -> int:
@@ -533,7 +1044,7 @@ def add_object_from_stl(stl_path: Union[str, Path]) -> int:
 
 @context_function(current_model)
 def add_object(vertices: List[List[float]], triangles: List[List[int]], 
-               obj_type: str = "model") -> int:
+               obj_type: str = "model", optimize: bool = False) -> int:
     """Add a 3D object to the current model.
     
     Must be called within a Model context manager.
@@ -550,6 +1061,15 @@ def remove_object(obj_id: int) -> bool:
     pass  # Implementation handled by decorator
 
 
+@context_function(current_model)
+def add_instance(obj_id: int, translation: List[float]) -> bool:
+    """Place a translated instance of an object in the current model.
+    
+    Must be called within a Model context manager.
+    """
+    pass  # Implementation handled by decorator
+
+
 @context_function(current_model)
 def get_object(obj_id: int) -> Optional[Dict[str, Any]]:
     """Get an object by ID from the current model.
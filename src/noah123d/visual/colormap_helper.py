@@ -23,12 +23,8 @@ from typing import (
     Tuple
 )
 
-from build123d import (
-    Box,
-    GridLocations,
-    Pos,
-    Sphere
-)
+# build123d is imported inside the grid builders, it loads OCP and takes
+# seconds, which every `import noah123d` would otherwise pay
 
 # %% [Parameters]
 
@@ -172,6 +168,8 @@ class ColorMapHelper:
         Returns:
             List of sphere objects positioned in a grid
         """
+        from build123d import GridLocations, Sphere
+        
         if cols is None:
             cols = self.grid_size
             
@@ -205,6 +203,8 @@ class ColorMapHelper:
         Returns:
             List of box objects positioned in a grid
         """
+        from build123d import Box, Pos
+        
         if cols is None:
             cols = self.grid_size
             
@@ -0,0 +1,41 @@
+"""Test the 3MF analyzer examples on a converted file.
+- state: passing, 2026-10-16
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+import numpy as np
+import pytest
+from noah123d import STLConverter
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+def _load_example(name):
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(params=["analyze_3mf", "analyzer_3mf"])
+def demo(request):
+    return _load_example(request.param)
+
+def test_analyze_converted_tetrahedron(demo, tmp_path):
+    from stl import mesh
+    tetra = mesh.Mesh(np.zeros(4, dtype=mesh.Mesh.dtype))
+    corners = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+    tetra.vectors[:] = corners[[[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]]]
+    tetra.save(str(tmp_path / "tetra.stl"))
+    assert STLConverter().convert(tmp_path / "tetra.stl", tmp_path / "tetra.3mf")
+
+    analysis = demo.Model3MFAnalyzer().analyze_3mf_file(tmp_path / "tetra.3mf")
+    assert 'error' not in analysis
+    model = analysis['models'][0]
+    assert model['volume'] == pytest.approx(1 / 6)
+    assert model['surface_area'] == pytest.approx(1.5 + np.sqrt(3) / 2)
+    assert model['quality']['edge_count'] == 6
+    assert analysis['summary']['overall_bounds'] == {'min': [0.0, 0.0, 0.0], 'max': [1.0, 1.0, 1.0]}
+    assert analysis['summary']['overall_center_of_mass'] == pytest.approx([0.25, 0.25, 0.25])
+    json.dumps(analysis)
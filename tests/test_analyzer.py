@@ -0,0 +1,102 @@
+"""Test the 3MF analyzer.
+- state: passing, 2026-10-16
+"""
+
+import math
+import numpy as np
+import pytest
+from noah123d import Archive, Directory, Model
+from noah123d.threemf.analyzer import Analyzer
+
+TETRA_VERTICES = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+TETRA_TRIANGLES = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]], dtype=np.uint32)
+
+
+def test_analyze_object_tetrahedron():
+    analysis = Analyzer()._analyze_object({'vertices': TETRA_VERTICES, 'triangles': TETRA_TRIANGLES}, 1)
+    assert analysis['vertex_count'] == 4
+    assert analysis['triangle_count'] == 4
+    assert analysis['bounds'] == {'min': [0.0, 0.0, 0.0], 'max': [1.0, 1.0, 1.0]}
+    assert analysis['dimensions'] == [1.0, 1.0, 1.0]
+    assert analysis['center_of_mass'] == pytest.approx([0.25, 0.25, 0.25])
+    assert analysis['volume'] == pytest.approx(1 / 6)
+    assert analysis['surface_area'] == pytest.approx(1.5 + math.sqrt(3) / 2)
+
+def test_analyze_empty_object():
+    analysis = Analyzer()._analyze_object({'vertices': [], 'triangles': []}, 1)
+    assert analysis['bounds'] == {'min': [0, 0, 0], 'max': [0, 0, 0]}
+    assert analysis['center_of_mass'] == [0, 0, 0]
+    assert analysis['volume'] == 0.0
+    assert analysis['surface_area'] == 0.0
+
+def test_analyze_file_overall_summary(tmp_path):
+    file_path = tmp_path / "two_tetras.3mf"
+    with Archive(file_path, 'w'):
+        with Directory('3D'):
+            with Model() as model:
+                model.add_object(TETRA_VERTICES, TETRA_TRIANGLES)
+                model.add_object(TETRA_VERTICES + [2, 0, 0], TETRA_TRIANGLES)
+    
+    summary = Analyzer().analyze_file(file_path)['summary']
+    assert summary['object_count'] == 2
+    assert summary['total_vertices'] == 8
+    assert summary['overall_bounds'] == {'min': [0.0, 0.0, 0.0], 'max': [3.0, 1.0, 1.0]}
+    assert summary['overall_dimensions'] == [3.0, 1.0, 1.0]
+    assert summary['overall_center_of_mass'] == pytest.approx([1.25, 0.25, 0.25])
+
+def test_volume_and_area_large_mesh_path(monkeypatch):
+    from noah123d.threemf import analyzer
+    vertices = np.random.default_rng(0).random((500, 3))
+    triangles = np.random.default_rng(1).integers(0, 500, (2000, 3))
+    expected = analyzer._volume_and_area(vertices, triangles)
+    # Force the compiled kernel (when numba is installed) for this small mesh
+    monkeypatch.setattr(analyzer, '_NUMBA_MIN_TRIANGLES', 1)
+    assert analyzer._volume_and_area(vertices, triangles) == pytest.approx(expected, rel=1e-9)
+
+def test_numba_kernel_matches_numpy_path(monkeypatch):
+    pytest.importorskip("numba")
+    from noah123d.threemf import analyzer
+    vertices = np.random.default_rng(2).random((500, 3))
+    triangles = np.random.default_rng(3).integers(0, 500, (2000, 3))
+    expected = analyzer._volume_and_area(vertices, triangles)
+    assert analyzer._volume_and_area_kernel() is not None
+    monkeypatch.setattr(analyzer, '_NUMBA_MIN_TRIANGLES', 1)
+    assert analyzer._volume_and_area(vertices, triangles) == pytest.approx(expected, rel=1e-9)
+
+def test_analyze_file_cached_until_file_changes(tmp_path):
+    import os
+    file_path = tmp_path / "tetra.3mf"
+    with Archive(file_path, 'w'):
+        with Directory('3D'):
+            with Model() as model:
+                model.add_object(TETRA_VERTICES, TETRA_TRIANGLES)
+    
+    first = Analyzer().analyze_file(file_path)
+    first['models'].clear()
+    second = Analyzer().analyze_file(file_path)
+    assert second['file_path'] == str(file_path)
+    assert len(second['models']) == 1
+    
+    with Archive(file_path, 'w'):
+        with Directory('3D'):
+            with Model() as model:
+                model.add_object(TETRA_VERTICES, TETRA_TRIANGLES)
+                model.add_object(TETRA_VERTICES, TETRA_TRIANGLES)
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert len(Analyzer().analyze_file(file_path)['models']) == 2
+
+def test_analyze_many_in_worker_processes(tmp_path):
+    paths = []
+    for count in (1, 2):
+        file_path = tmp_path / f"tetras_{count}.3mf"
+        with Archive(file_path, 'w'):
+            with Directory('3D'):
+                with Model() as model:
+                    for _ in range(count):
+                        model.add_object(TETRA_VERTICES, TETRA_TRIANGLES)
+        paths.append(file_path)
+    
+    results = Analyzer().analyze_many(paths + [tmp_path / "missing.3mf"], max_workers=2)
+    assert [len(results[path]['models']) for path in paths] == [1, 2]
+    assert 'error' in results[tmp_path / "missing.3mf"]
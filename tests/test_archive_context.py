@@ -143,3 +143,242 @@ def test_complex_archive_workflow_with_context_function_with_checks():
         # has issues with repacking, so reading back from closed archive may not work)
         # The decorators themselves work correctly within the same context.
         print("Archive created successfully. Note: repacking issue prevents full verification.")
+
+
+def test_archive_added_files_survive_repack():
+    """Test that files added in write mode are kept, deflated at the given level."""
+    import zipfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w', compresslevel=9) as archive:
+            assert archive.compresslevel == 9
+            add_file("3D/3dmodel.model", "<model/>" * 100)
+        
+        with zipfile.ZipFile(archive_path) as zf:
+            names = zf.namelist()
+            assert "3D/3dmodel.model" in names
+            assert "[Content_Types].xml" in names
+            assert "_rels/.rels" in names
+            info = zf.getinfo("3D/3dmodel.model")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("3D/3dmodel.model") == b"<model/>" * 100
+            # small entries are stored rather than deflated
+            assert zf.getinfo("_rels/.rels").compress_type == zipfile.ZIP_STORED
+
+
+def test_archive_add_file_streams_chunks():
+    """Test that a file can be added from an iterable of text and byte chunks."""
+    import zipfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w'):
+            add_file("3D/3dmodel.model", (chunk for chunk in ["<model>", b"<build />", "</model>"]))
+            assert extract_file("3D/3dmodel.model") == b"<model><build /></model>"
+        
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.read("3D/3dmodel.model") == b"<model><build /></model>"
+
+
+def test_archive_stores_incompressible_entries():
+    """Test that random payloads are stored while text is deflated."""
+    import os
+    import zipfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w'):
+            add_file("Textures/noise.png", os.urandom(4096))
+            add_file("3D/3dmodel.model", "<vertex x=\"1\" />\n" * 200)
+        
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.getinfo("Textures/noise.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("3D/3dmodel.model").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_archive_read_mode_uses_indexed_entries():
+    """Test listing and extracting entries of an existing archive."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w'):
+            add_file("Metadata/info.txt", "info")
+        
+        with Archive(archive_path, 'r') as archive:
+            assert sorted(archive.list_contents()) == ['Metadata/info.txt', '[Content_Types].xml', '_rels/.rels']
+            assert extract_file("Metadata/info.txt") == b"info"
+            assert extract_file("missing.txt") is None
+
+
+def test_archive_read_mode_streams_without_extracting():
+    """Test that read mode serves directories from the index without a temporary directory."""
+    from noah123d import Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w'):
+            add_file("Metadata/info.txt", "info")
+            add_file("Metadata/thumbs/a.png", b"png")
+        
+        with Archive(archive_path, 'r') as archive:
+            with archive.open_member("Metadata/info.txt") as member:
+                assert member.read() == b"info"
+            assert archive.open_member("missing.txt") is None
+            
+            with Directory("Metadata") as metadata:
+                assert metadata.exists()
+                assert metadata.list_files() == ["info.txt"]
+                assert metadata.list_subdirectories() == ["thumbs"]
+                assert metadata.read_file("info.txt") == b"info"
+            assert get_temp_path() is None
+
+
+def test_archive_stages_entries_until_repack():
+    """Test that entries are only staged in the temporary directory until the archive is packed."""
+    import zipfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w') as archive:
+            add_file("3D/3dmodel.model", "<vertex x=\"1\" />\n" * 200)
+            assert not archive_path.exists()
+            assert (archive.get_temp_path() / "3D/3dmodel.model").is_file()
+            with archive.open_member("3D/3dmodel.model") as member:
+                assert member.read(8) == b"<vertex "
+        
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.getinfo("3D/3dmodel.model").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_archive_append_mode_only_reads_original_until_exit():
+    """Test that append mode leaves the original file alone until it is re-packed."""
+    import zipfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w'):
+            add_file("Metadata/info.txt", "info")
+        original = archive_path.read_bytes()
+        
+        with Archive(archive_path, 'a'):
+            assert extract_file("Metadata/info.txt") == b"info"
+            add_file("Metadata/more.txt", "more")
+            assert "Metadata/more.txt" in list_contents()
+            assert archive_path.read_bytes() == original
+        
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.testzip() is None
+            assert zf.read("Metadata/info.txt") == b"info"
+            assert zf.read("Metadata/more.txt") == b"more"
+            assert len(zf.namelist()) == len(set(zf.namelist()))
+
+
+def test_archive_read_mode_maps_file_until_exit():
+    """Test that read mode serves members from a memory map released on exit."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = Path(temp_dir) / "test.3mf"
+        
+        with Archive(archive_path, 'w'):
+            add_file("Metadata/info.txt", "info")
+        
+        with Archive(archive_path, 'r') as archive:
+            assert archive._mmap is not None
+            assert extract_file("Metadata/info.txt") == b"info"
+        assert archive._mmap is None
+
+
+def test_streamed_chunks_coalesced():
+    """Test that streamed text and byte chunks are joined into larger writes."""
+    from noah123d.threemf.archive import _coalesce_chunks
+    pieces = list(_coalesce_chunks(["ab", b"cd", "é", "fg"], size=4))
+    assert pieces == [b"abcd", "éfg".encode("utf-8")]
+    assert list(_coalesce_chunks([])) == []
+
+
+def test_copy_raw_member_stored_and_deflated(tmp_path):
+    """Test that raw copies keep each member's compressed bytes and compression."""
+    import zipfile
+    with zipfile.ZipFile(tmp_path / "source.3mf", 'w') as zf:
+        zf.writestr("stored.txt", "stored " * 100, compress_type=zipfile.ZIP_STORED)
+        zf.writestr("deflated.txt", "deflated " * 100, compress_type=zipfile.ZIP_DEFLATED)
+    
+    with zipfile.ZipFile(tmp_path / "source.3mf") as source, \
+         zipfile.ZipFile(tmp_path / "copy.3mf", 'w') as dest:
+        for info in source.infolist():
+            Archive.copy_raw_member(source, dest, info)
+    
+    with zipfile.ZipFile(tmp_path / "copy.3mf") as zf:
+        assert zf.testzip() is None
+        assert [info.compress_type for info in zf.infolist()] == [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED]
+        assert zf.read("deflated.txt") == b"deflated " * 100
+
+
+def _write_copy_sources(path):
+    """Write stored, deflated and zip64-header members, returning their contents."""
+    import zipfile
+    contents = {"stored.txt": b"stored " * 100, "deflated.txt": b"deflated " * 100,
+                "zip64.txt": b"zip64 " * 100}
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr("stored.txt", contents["stored.txt"], compress_type=zipfile.ZIP_STORED)
+        zf.writestr("deflated.txt", contents["deflated.txt"], compress_type=zipfile.ZIP_DEFLATED)
+        # force_zip64 puts a zip64 record in the local header extra field
+        with zf.open("zip64.txt", 'w', force_zip64=True) as member:
+            member.write(contents["zip64.txt"])
+    return contents
+
+
+@pytest.mark.parametrize("raw", [True, False])
+def test_copy_raw_member_output_passes_crc_check(tmp_path, monkeypatch, raw):
+    """Test that copied archives reopen with valid CRCs, raw or through the re-compressing fallback."""
+    import struct
+    import zipfile
+    from noah123d.threemf import archive as archive_module
+    if not raw:
+        monkeypatch.setattr(archive_module, "_RAW_COPY_ATTRIBUTES", ("fp", "missing_internal"))
+    contents = _write_copy_sources(tmp_path / "source.3mf")
+    
+    with zipfile.ZipFile(tmp_path / "source.3mf") as source, \
+         zipfile.ZipFile(tmp_path / "copy.3mf", 'w') as dest:
+        for info in source.infolist():
+            if info.filename == "zip64.txt":
+                # As read from an archive whose central directory needed zip64 sizes
+                info.extra = struct.pack('<HHQQ', 0x0001, 16, info.file_size, info.compress_size) + info.extra
+            Archive.copy_raw_member(source, dest, info)
+        dest.writestr("added.txt", "added after the copies")
+    
+    with zipfile.ZipFile(tmp_path / "copy.3mf") as zf:
+        assert zf.testzip() is None
+        assert {name: zf.read(name) for name in contents} == contents
+        assert zf.read("added.txt") == b"added after the copies"
+        assert zf.getinfo("stored.txt").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("deflated.txt").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_copy_raw_member_rejects_unsafe_destinations(tmp_path):
+    """Test that raw copies need a 'w' destination with no open member and a complete source."""
+    import zipfile
+    with zipfile.ZipFile(tmp_path / "source.3mf", 'w') as zf:
+        zf.writestr("stored.txt", "stored " * 100, compress_type=zipfile.ZIP_STORED)
+    
+    with zipfile.ZipFile(tmp_path / "source.3mf") as source:
+        info = source.getinfo("stored.txt")
+        with pytest.raises(ValueError, match="'w' zip file"):
+            Archive.copy_raw_member(source, source, info)
+        with zipfile.ZipFile(tmp_path / "copy.3mf", 'w') as dest:
+            with dest.open("open.txt", 'w'):
+                with pytest.raises(ValueError, match="no open member"):
+                    Archive.copy_raw_member(source, dest, info)
+            
+            info.compress_size += 100
+            with pytest.raises(zipfile.BadZipFile, match="Truncated"):
+                Archive.copy_raw_member(source, dest, info)
+
+
+def test_strip_zip64_extra():
+    """Test that only the zip64 record is dropped from an extra field."""
+    import struct
+    from noah123d.threemf.archive import _strip_zip64_extra
+    other = struct.pack('<HH', 0x5455, 5) + b'\x01abcd'
+    zip64 = struct.pack('<HHQQ', 0x0001, 16, 1, 2)
+    assert _strip_zip64_extra(zip64 + other) == other
@@ -0,0 +1,204 @@
+"""Test converter helpers.
+- state: passing, 2026-10-16
+"""
+
+from pathlib import Path
+import numpy as np
+import pytest
+from noah123d import STLConverter, StlSpec
+from noah123d.converters import (_glob_files, _grid_offsets, _instance_vertices, _linear_offsets,
+                                  _mesh_stats, _stl_spec_arrays)
+
+
+def test_grid_offsets_centered():
+    offsets = _grid_offsets(4, 2, 10.0, 20.0, center=True)
+    assert offsets.shape == (4, 3)
+    assert offsets.tolist() == [[-5.0, -10.0, 0.0], [5.0, -10.0, 0.0],
+                                [-5.0, 10.0, 0.0], [5.0, 10.0, 0.0]]
+
+def test_grid_offsets_partial_row_not_centered():
+    offsets = _grid_offsets(5, 3, 1.0, 2.0, center=False)
+    assert offsets.tolist() == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0],
+                                [0.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+
+def test_calculate_grid_positions_matches_layout():
+    converter = STLConverter()
+    layout = converter._calculate_grid_layout(6)
+    assert layout == (2, 3)
+    positions = converter._calculate_grid_positions(layout, [10.0, 10.0, 5.0], 1.1, True, 6)
+    assert len(positions) == 6
+    assert positions[0] == pytest.approx([-11.0, -5.5, 0.0])
+    assert positions[-1] == pytest.approx([11.0, 5.5, 0.0])
+
+def test_linear_offsets_separate_object_types():
+    offsets = _linear_offsets(np.array([10.0, 4.0]), np.array([2, 1]), 1.0, axis=0, center=False)
+    # two copies 10 apart, then half an extent (5) extra before the next type
+    assert offsets.tolist() == [[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [25.0, 0.0, 0.0]]
+
+def test_multi_object_layout_stack_centered():
+    converter = STLConverter()
+    objects = [{'count': 2, 'info': {'dimensions': [1.0, 1.0, 2.0]}}]
+    positions = converter._calculate_multi_object_layout(objects, "stack", 1.0, True)
+    # stack ends at z=2, plus the object height, centered around the origin
+    assert positions.tolist() == [[0.0, 0.0, -2.0], [0.0, 0.0, 0.0]]
+
+def test_stl_spec_arrays_accepts_specs_and_dicts():
+    paths, counts, names = _stl_spec_arrays([
+        StlSpec('parts/base.stl', 2, 'Base'),
+        {'path': 'parts/screw.stl', 'count': 4},
+        {'path': 'parts/washer.stl'},
+    ])
+    assert [p.name for p in paths] == ['base.stl', 'screw.stl', 'washer.stl']
+    assert counts.dtype == np.int32
+    assert counts.tolist() == [2, 4, 1]
+    assert names == ['Base', 'screw', 'washer']
+
+def test_instance_vertices_one_block_per_offset():
+    vertices = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]], dtype=np.float32)
+    instances = _instance_vertices(vertices, [[0.0, 0.0, 0.0], [10.0, 0.0, -1.0]])
+    assert instances.shape == (2, 2, 3)
+    assert instances.dtype == np.float32
+    assert instances[1].tolist() == [[10.0, 0.0, -1.0], [11.0, 2.0, 2.0]]
+
+def test_instance_vertices_writes_into_preallocated_buffer():
+    buffer = np.zeros((3, 3), dtype=np.float32)
+    instances = _instance_vertices(np.zeros((1, 3)), [[1, 0, 0], [2, 0, 0], [3, 0, 0]],
+                                   out=buffer.reshape(3, 1, 3))
+    assert np.shares_memory(instances, buffer)
+    assert buffer[:, 0].tolist() == [1.0, 2.0, 3.0]
+
+def test_mesh_stats_counts_and_validation():
+    vertices = np.array([[0, 0, 0], [2, 0, 0], [0, 3, np.nan]], dtype=np.float32)
+    triangles = np.array([[0, 1, 2], [0, 0, 1]], dtype=np.uint32)
+    stats = _mesh_stats(vertices, triangles, validate=True)
+    assert stats['vertices'] == 3 and stats['triangles'] == 2
+    assert stats['bounding_box']['max'][:2] == [2.0, 3.0]
+    assert stats['invalid_vertices'] == 1
+    assert stats['degenerate_triangles'] == 1
+    assert 'degenerate_triangles' not in _mesh_stats(vertices, triangles)
+
+def test_translate_object_replaces_read_only_vertices():
+    vertices = np.array([[0, 0, 0], [1, 1, 1]], dtype=np.float32)
+    vertices.setflags(write=False)
+    obj = {'vertices': vertices, 'triangles': np.zeros((0, 3), dtype=np.uint32)}
+    STLConverter()._translate_object(obj, [1.0, 2.0, 3.0])
+    assert obj['vertices'].dtype == np.float32
+    assert obj['vertices'].tolist() == [[1, 2, 3], [2, 3, 4]]
+    assert vertices.tolist() == [[0, 0, 0], [1, 1, 1]]
+
+def _write_tetrahedron(stl_path):
+    from stl import mesh
+    tetra = mesh.Mesh(np.zeros(4, dtype=mesh.Mesh.dtype))
+    corners = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+    tetra.vectors[:] = corners[[[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]]]
+    tetra.save(str(stl_path))
+
+def test_batch_convert_in_worker_processes(tmp_path):
+    for name in ("a", "b"):
+        _write_tetrahedron(tmp_path / f"{name}.stl")
+    converter = STLConverter()
+    converted = converter.batch_convert(str(tmp_path / "*.stl"), tmp_path / "out", max_workers=2)
+    assert sorted(converted) == [str(tmp_path / "out" / "a.3mf"), str(tmp_path / "out" / "b.3mf")]
+    assert all(converter.conversion_stats[path]['triangles'] == 4 for path in converted)
+
+def test_batch_convert_same_stem_inputs_run_serially(tmp_path):
+    from stl import mesh
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    _write_tetrahedron(tmp_path / "a" / "part.stl")
+    _write_tetrahedron(tmp_path / "b" / "part.stl")
+    triangle = mesh.Mesh(np.zeros(1, dtype=mesh.Mesh.dtype))
+    triangle.vectors[:] = [[[0, 0, 0], [1, 0, 0], [0, 1, 0]]]
+    triangle.save(str(tmp_path / "b" / "part.stl"))
+    _write_tetrahedron(tmp_path / "a" / "other.stl")
+    
+    converter = STLConverter()
+    pattern = str(tmp_path / "**" / "*.stl")
+    converted = converter.batch_convert(pattern, tmp_path / "out", max_workers=3)
+    output_path = str(tmp_path / "out" / "part.3mf")
+    assert sorted(converted) == [str(tmp_path / "out" / "other.3mf"), output_path, output_path]
+    # The input matched last overwrote the other one and the archive is intact
+    last_part = [path for path in _glob_files(pattern) if path.endswith("part.stl")][-1]
+    triangles = 1 if Path(last_part).parent.name == "b" else 4
+    assert converter.conversion_stats[output_path]['triangles'] == triangles
+    import zipfile
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("3D/3dmodel.model").count(b"<triangle ") == triangles
+
+def test_stl_info_surface_area(tmp_path):
+    import math
+    _write_tetrahedron(tmp_path / "tetra.stl")
+    info = STLConverter().get_stl_info(tmp_path / "tetra.stl")
+    assert info['surface_area'] == pytest.approx(1.5 + math.sqrt(3) / 2)
+    # Faces standing upright have no area in the XY plane but are not degenerate
+    assert info['is_valid']
+
+def test_stl_info_cached_per_file_version(tmp_path, monkeypatch):
+    import os
+    stl_path = tmp_path / "tetra.stl"
+    _write_tetrahedron(stl_path)
+    converter = STLConverter()
+    calls = []
+    read_stl_info = converter._read_stl_info
+    monkeypatch.setattr(converter, '_read_stl_info', lambda path: calls.append(path) or read_stl_info(path))
+    
+    converter.get_stl_info(stl_path)['bounding_box']['min'].clear()
+    assert converter.get_stl_info(stl_path)['bounding_box']['min'] == [0.0, 0.0, 0.0]
+    assert len(calls) == 1
+    
+    stat = stl_path.stat()
+    os.utime(stl_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    converter.get_stl_info(stl_path)
+    assert len(calls) == 2
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_validate_stl_checks_binary_size_without_parsing(tmp_path, monkeypatch):
+    stl_path = tmp_path / "tetra.stl"
+    _write_tetrahedron(stl_path)
+    converter = STLConverter()
+    monkeypatch.setattr(converter, 'get_stl_info', lambda path: pytest.fail("parsed"))
+    converter._validate_stl(stl_path)
+    
+    monkeypatch.undo()
+    stl_path.write_bytes(b"not an stl file")
+    with pytest.raises(ValueError, match="Invalid STL file"):
+        converter._validate_stl(stl_path)
+
+def test_stl_to_3mf_compression_level(tmp_path):
+    import zipfile
+    from noah123d import stl_to_3mf
+    _write_tetrahedron(tmp_path / "tetra.stl")
+    assert stl_to_3mf(tmp_path / "tetra.stl", tmp_path / "stored.3mf", compression_level=0)
+    with zipfile.ZipFile(tmp_path / "stored.3mf") as zf:
+        assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_STORED}
+        assert b"<triangle" in zf.read("3D/3dmodel.model")
+
+def test_glob_files_matches_glob(tmp_path):
+    import glob
+    for name in ("a.stl", "b.STL", ".hidden.stl", "notes.txt", "sub/c.stl", "sub/deep/d.stl",
+                 ".git/e.stl", "sub/.f.stl"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("solid")
+    for pattern in ("*.stl", "?.stl", ".*.stl", "**/*.stl", "**/.*.stl", "sub/**/*.stl",
+                    "sub/*.stl", "missing/*.stl", "missing/**/*.stl"):
+        full_pattern = str(tmp_path / pattern)
+        assert sorted(_glob_files(full_pattern)) == sorted(glob.glob(full_pattern, recursive=True))
+
+def test_convert_with_copies_instances_share_one_mesh(tmp_path):
+    import zipfile
+    from noah123d import Archive, Directory, Model, stl_to_3mf_grid
+    _write_tetrahedron(tmp_path / "tetra.stl")
+    assert stl_to_3mf_grid(tmp_path / "tetra.stl", tmp_path / "grid.3mf", count=4, use_instances=True)
+    with zipfile.ZipFile(tmp_path / "grid.3mf") as zf:
+        xml = zf.read("3D/3dmodel.model")
+    assert xml.count(b"<object ") == 1
+    assert xml.count(b"<triangle ") == 4
+    assert xml.count(b' transform="') == 4
+    
+    with Archive(tmp_path / "grid.3mf", 'r'):
+        with Directory('3D'):
+            with Model() as model:
+                instances = model.get_instances(model.list_objects()[0])
+    assert len(instances) == 4
+    assert instances[0] != instances[-1]
@@ -2,6 +2,7 @@
 - state: passing, 2025-07-31
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
@@ -24,8 +25,35 @@ def test_add_object(a_model):
     assert a_model.get_object_count() == 1
     obj = a_model.get_object(obj_id)
     assert obj is not None
-    assert obj['vertices'] == vertices
-    assert obj['triangles'] == triangles
+    assert obj['vertices'].dtype == np.float32
+    assert obj['triangles'].dtype == np.uint32
+    assert obj['vertices'].tolist() == vertices
+    assert obj['triangles'].tolist() == triangles
+
+def test_add_object_rejects_invalid_triangle_indices(a_model):
+    from noah123d.threemf.model import _as_triangle_array
+    vertices = [[0,0,0], [1,0,0], [0,1,0]]
+    with pytest.raises(ValueError, match="negative"):
+        a_model.add_object(vertices, [[0,-1,2]])
+    with pytest.raises(ValueError, match="out of range"):
+        a_model.add_object(vertices, [[0,1,3]])
+    assert a_model.get_object_count() == 0
+    
+    a_model.add_object(vertices, [[0,1,2]])
+    xml = a_model._create_model_xml().encode('utf-8')
+    with pytest.raises(ValueError, match="negative"):
+        a_model._parse_existing_objects(xml.replace(b'v2="1"', b'v2="-1"'))
+    with pytest.raises(ValueError, match="out of range"):
+        a_model._parse_existing_objects(xml.replace(b'v2="1"', b'v2="7"'))
+    # Checked before the uint32 cast, which would wrap 2**32 + 1 around to 1
+    wrapped = xml.replace(b'v2="1"', b'v2="4294967297"')
+    with pytest.raises(ValueError, match="out of range"):
+        a_model._parse_existing_objects(wrapped)
+    with pytest.raises(ValueError, match="out of range"):
+        a_model._parse_existing_objects(wrapped.replace(b'<vertex x="0" y="0" z="0" />',
+                                                        b'<vertex z="0" y="0" x="0" />'))
+    with pytest.raises(ValueError, match="uint32"):
+        _as_triangle_array([[0, 1, 2**32 + 1]])
 
 def test_remove_object(a_model):
     vertices = [[0,0,0], [1,0,0], [0,1,0]]
@@ -72,7 +100,7 @@ def test_add_object_from_stl_calls_mesh(monkeypatch, a_model, tmp_path):
         [[0,0,0],[1,0,0],[0,1,0]],
         [[1,0,0],[1,1,0],[0,1,0]]
     ]
-    monkeypatch.setattr("stl.mesh.Mesh.from_file", lambda path: fake_mesh)
+    monkeypatch.setattr("stl.mesh.Mesh.from_file", lambda path, **kwargs: fake_mesh)
     stl_path = tmp_path / "fake.stl"
     stl_path.write_text("fake stl content")
     obj_id = a_model.add_object_from_stl(stl_path)
@@ -86,6 +114,7 @@ def test_save_and_load_model(monkeypatch):
     # Patch Archive and Directory context
     mock_archive = MagicMock()
     mock_archive.extract_file.return_value = None
+    mock_archive.open_member.return_value = None
     mock_archive.is_writable.return_value = True
     mock_archive.add_file = MagicMock()
     mock_directory = MagicMock()
@@ -139,7 +168,7 @@ def test_load_stl_with_info(monkeypatch, a_model, tmp_path, capsys):
         [[0,0,0],[1,0,0],[0,1,0]],
         [[1,0,0],[1,1,0],[0,1,0]]
     ]
-    monkeypatch.setattr("stl.mesh.Mesh.from_file", lambda path: fake_mesh)
+    monkeypatch.setattr("stl.mesh.Mesh.from_file", lambda path, **kwargs: fake_mesh)
     
     # Test successful loading
     obj_id = a_model.load_stl_with_info(stl_path)
@@ -156,6 +185,228 @@ def test_load_stl_with_info(monkeypatch, a_model, tmp_path, capsys):
     result = a_model.load_stl_with_info(non_existent)
     assert result is None
 
+def test_add_object_from_binary_stl(a_model, tmp_path):
+    """Test that binary STL files are read directly and vertices shared in first-seen order."""
+    from stl import mesh
+    data = np.zeros(2, dtype=mesh.Mesh.dtype)
+    data['vectors'] = [
+        [[0,0,0],[1,0,0],[0,1,0]],
+        [[1,0,0],[1,1,0],[0,1,0]]
+    ]
+    stl_path = tmp_path / "binary.stl"
+    mesh.Mesh(data).save(str(stl_path))
+    
+    obj = a_model.get_object(a_model.add_object_from_stl(stl_path))
+    assert obj['vertices'].tolist() == [[0,0,0],[1,0,0],[0,1,0],[1,1,0]]
+    assert obj['triangles'].tolist() == [[0,1,2],[1,3,2]]
+
+def test_stl_arrays_cached_until_file_changes(tmp_path):
+    """Test that STL parses are shared read-only and refreshed when the file changes."""
+    import os
+    from stl import mesh
+    from noah123d.threemf.model import _load_stl_arrays
+    data = np.zeros(1, dtype=mesh.Mesh.dtype)
+    data['vectors'] = [[[0,0,0],[1,0,0],[0,1,0]]]
+    stl_path = tmp_path / "cached.stl"
+    mesh.Mesh(data).save(str(stl_path))
+    
+    vertices, triangles = _load_stl_arrays(stl_path)
+    assert _load_stl_arrays(stl_path)[0] is vertices
+    assert not vertices.flags.writeable
+    
+    data['vectors'] = [[[0,0,0],[2,0,0],[0,2,0]]]
+    mesh.Mesh(data).save(str(stl_path))
+    stat = stl_path.stat()
+    os.utime(stl_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _load_stl_arrays(stl_path)[0].tolist() == [[0,0,0],[2,0,0],[0,2,0]]
+
+def test_stl_cache_bounded_by_bytes(tmp_path, monkeypatch):
+    """Test that the STL cache evicts by total size and does not keep meshes above its budget."""
+    from stl import mesh
+    from noah123d.threemf import model as model_module
+    cache = model_module._ByteBoundedCache(max_bytes=100)
+    monkeypatch.setattr(model_module, "_stl_cache", cache)
+    
+    loads = []
+    def load(value):
+        return lambda: loads.append(value) or value
+    assert cache.get('a', load(b'a' * 60), len) == b'a' * 60
+    assert cache.get('a', load(b'x'), len) == b'a' * 60
+    cache.get('b', load(b'b' * 60), len)
+    cache.get('a', load(b'a' * 60), len)
+    assert loads == [b'a' * 60, b'b' * 60, b'a' * 60]
+    cache.get('huge', load(b'h' * 200), len)
+    cache.get('huge', load(b'h' * 200), len)
+    assert loads[-2:] == [b'h' * 200, b'h' * 200]
+    
+    data = np.zeros(4, dtype=mesh.Mesh.dtype)
+    data['vectors'] = np.arange(36).reshape(4, 3, 3)
+    stl_path = tmp_path / "large.stl"
+    mesh.Mesh(data).save(str(stl_path))
+    vertices, _triangles = model_module._load_stl_arrays(stl_path)
+    assert model_module._load_stl_arrays(stl_path)[0] is not vertices
+
+def test_stl_bounds_binary_and_ascii(tmp_path):
+    """Test the memory-mapped bounding box against an ASCII copy of the same mesh."""
+    from stl import Mode, mesh
+    from noah123d.threemf.model import _stl_bounds
+    data = np.zeros(2, dtype=mesh.Mesh.dtype)
+    data['vectors'] = [[[0,0,0],[1,0,0],[0,1,0]], [[-1,2,0],[1,0,3],[0,1,0]]]
+    binary_path, ascii_path = tmp_path / "binary.stl", tmp_path / "ascii.stl"
+    mesh.Mesh(data).save(str(binary_path), mode=Mode.BINARY)
+    mesh.Mesh(data).save(str(ascii_path), mode=Mode.ASCII)
+    
+    for stl_path in (binary_path, ascii_path):
+        count, bbox_min, bbox_max = _stl_bounds(stl_path)
+        assert count == 2
+        assert bbox_min.tolist() == [-1, 0, 0]
+        assert bbox_max.tolist() == [1, 2, 3]
+
+def test_model_xml_round_trips_float32(a_model):
+    """Test that the bulk-formatted model XML parses back to the same mesh."""
+    vertices = np.array([[0.1, -2.5, 1e-7], [3.3333333, 0, 42], [0, 1, 0]], dtype=np.float32)
+    a_model.add_object(vertices, [[0, 1, 2]])
+    a_model.add_object([], [], obj_type="support")
+    
+    objects = a_model._parse_existing_objects(a_model._create_model_xml().encode('utf-8'))
+    assert [obj['type'] for obj in objects] == ["model", "support"]
+    assert np.array_equal(objects[0]['vertices'], vertices)
+    assert objects[0]['triangles'].tolist() == [[0, 1, 2]]
+    assert len(objects[1]['vertices']) == 0
+
+def test_model_xml_repeats_shared_triangles(a_model):
+    """Test that copies sharing a triangle array each get their triangle block."""
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+    triangles = np.array([[0, 1, 2]], dtype=np.uint32)
+    for offset in range(3):
+        a_model.add_object(vertices + offset, triangles)
+    a_model.add_object(vertices, [[2, 1, 0]])
+    
+    objects = a_model._parse_existing_objects(a_model._create_model_xml().encode('utf-8'))
+    assert [obj['triangles'].tolist() for obj in objects] == [[[0, 1, 2]]] * 3 + [[[2, 1, 0]]]
+    assert objects[2]['vertices'][0].tolist() == [2, 2, 2]
+
+def test_model_xml_formats_triangles_once_per_run_of_copies(a_model, monkeypatch):
+    """Test that only a run of copies reuses triangle text, other meshes are streamed."""
+    from noah123d.threemf import model as model_module
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+    triangles = np.array([[0, 1, 2]], dtype=np.uint32)
+    a_model.add_object(vertices, [[0, 2, 1]])
+    for offset in range(3):
+        a_model.add_object(vertices + offset, triangles)
+    a_model.add_object(vertices, triangles.copy())
+    formatted = []
+    iter_row_blocks = model_module._iter_row_blocks
+    def counting(line, rows):
+        if line is model_module._TRIANGLE_LINE:
+            formatted.append(rows)
+        return iter_row_blocks(line, rows)
+    monkeypatch.setattr(model_module, '_iter_row_blocks', counting)
+    
+    xml = a_model._create_model_xml()
+    assert len(formatted) == 3
+    assert xml.count('<triangle v1="0" v2="1" v3="2" />') == 4
+
+def test_model_xml_scan_falls_back_to_xml_parser(a_model):
+    """Test that documents the regex scan cannot handle parse the same with iterparse."""
+    from noah123d.threemf.model import _scan_mesh_objects
+    a_model.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    xml = a_model._create_model_xml().encode('utf-8')
+    reordered = xml.replace(b'<vertex x="0" y="0" z="0" />', b'<vertex z="0" y="0" x="0" />')
+    
+    assert _scan_mesh_objects(xml) is not None
+    assert _scan_mesh_objects(reordered) is None
+    expected = a_model._parse_existing_objects(xml)
+    objects = a_model._parse_existing_objects(reordered)
+    assert np.array_equal(objects[0]['vertices'], expected[0]['vertices'])
+    assert objects[0]['triangles'].tolist() == expected[0]['triangles'].tolist()
+
+def test_model_xml_scan_reads_single_quoted_attributes(a_model):
+    """Test that the regex scan reads single-quoted object and item attributes like iterparse."""
+    from noah123d.threemf.model import _scan_mesh_objects, _scan_build_instances
+    a_model._next_object_id = 5
+    obj_id = a_model.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    a_model.add_instance(obj_id, [1, 2, 3])
+    xml = a_model._create_model_xml().encode('utf-8')
+    quoted = (xml.replace(b'<object id="5"', b"<object id='5'")
+                 .replace(b'type="model"', b"type='model'")
+                 .replace(b'<item objectid="5"', b"<item objectid='5'"))
+    
+    objects = _scan_mesh_objects(quoted)
+    assert [(obj['id'], obj['type']) for obj in objects] == [(5, 'model')]
+    assert _scan_build_instances(quoted) == {5: [(1.0, 2.0, 3.0)]}
+
+def test_model_xml_instances_round_trip(a_model):
+    """Test that instances become translated build items and are read back."""
+    from noah123d.threemf.model import _scan_build_instances
+    obj_id = a_model.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    other_id = a_model.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    assert a_model.add_instance(obj_id, [0, 0, 0])
+    assert a_model.add_instance(obj_id, np.array([12.5, -3.0, 0.25]))
+    assert not a_model.add_instance(99, [1, 2, 3])
+    
+    xml = a_model._create_model_xml().encode('utf-8')
+    assert xml.count(b'<triangle ') == 2
+    assert b'transform="1 0 0 0 1 0 0 0 1 12.5 -3 0.25"' in xml
+    assert _scan_build_instances(xml) == {obj_id: [(0.0, 0.0, 0.0), (12.5, -3.0, 0.25)]}
+    
+    malformed = xml.replace(b'12.5 -3 0.25', b'12.5 oops 0.25', 1)
+    assert _scan_build_instances(malformed) == {}
+    assert len(a_model._parse_existing_objects(malformed)) == 2
+    
+    a_model.remove_object(obj_id)
+    assert a_model.get_instances(obj_id) == []
+    assert other_id not in _scan_build_instances(xml)
+
+def test_model_xml_invalid_numbers_raise_parse_error(a_model):
+    """Test that a non-numeric coordinate falls back to the XML parser and fails as a parse error."""
+    import xml.etree.ElementTree as ET
+    from noah123d.threemf.model import _scan_mesh_objects
+    a_model.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    xml = a_model._create_model_xml().encode('utf-8')
+    bad = xml.replace(b'y="1"', b'y="bad"')
+    
+    assert _scan_mesh_objects(bad) is None
+    for document in (bad, bad.replace(b'<vertex x="0" y="0" z="0" />', b'<vertex z="0" y="0" x="0" />'),
+                     xml.replace(b'y="1"', b'y="1 2"')):
+        with pytest.raises(ET.ParseError):
+            a_model._parse_existing_objects(document)
+
+def test_add_object_optimize_reorders_vertices_by_first_use(a_model):
+    """Test that optimize=True keeps the triangles and renumbers used vertices in fetch order."""
+    vertices = [[9, 9, 9], [0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]]
+    triangles = [[3, 1, 2], [2, 4, 3]]
+    obj = a_model.get_object(a_model.add_object(vertices, triangles, optimize=True))
+    
+    # the unused vertex is dropped and indices appear in first-use order
+    assert len(obj['vertices']) == 4
+    first_use = list(dict.fromkeys(obj['triangles'].ravel().tolist()))
+    assert first_use == [0, 1, 2, 3]
+    expected = sorted(sorted(map(tuple, np.array(vertices)[t].tolist())) for t in triangles)
+    actual = sorted(sorted(map(tuple, obj['vertices'][t].tolist())) for t in obj['triangles'])
+    assert actual == expected
+
+def test_optimize_mesh_meshoptimizer_matches_numpy_path(monkeypatch):
+    """Test that the meshoptimizer reorder keeps the same triangles as the NumPy-only path."""
+    pytest.importorskip("meshoptimizer")
+    from noah123d.threemf import model as model_module
+    rng = np.random.default_rng(0)
+    vertices = rng.random((200, 3)).astype(np.float32)
+    triangles = rng.integers(0, 200, (500, 3)).astype(np.uint32)
+    
+    def corner_sets(result):
+        new_vertices, new_triangles = result
+        return sorted(tuple(map(tuple, new_vertices[t].tolist())) for t in new_triangles)
+    accelerated = model_module._optimize_mesh(vertices, triangles)
+    monkeypatch.setattr(model_module, "meshoptimizer", None)
+    plain = model_module._optimize_mesh(vertices, triangles)
+    
+    assert len(accelerated[0]) == len(plain[0])
+    assert corner_sets(accelerated) == corner_sets(plain)
+    # Vertices are numbered in first-use order on both paths
+    first_use = list(dict.fromkeys(accelerated[1].ravel().tolist()))
+    assert first_use == list(range(len(accelerated[0])))
+
 def test_analyze_model_content(a_model, capsys):
     """Test analyze_model_content method."""
     # Test with empty model
@@ -214,12 +465,13 @@ def test_convert_stl_to_3mf(mock_directory_class, mock_archive_class, monkeypatc
     # Mock STL mesh
     fake_mesh = MagicMock()
     fake_mesh.vectors = [[[0,0,0],[1,0,0],[0,1,0]]]
-    monkeypatch.setattr("stl.mesh.Mesh.from_file", lambda path: fake_mesh)
+    monkeypatch.setattr("stl.mesh.Mesh.from_file", lambda path, **kwargs: fake_mesh)
     
     # Mock archive and directory context managers
     mock_archive = MagicMock()
     mock_archive.file_path = output_path
     mock_archive.extract_file.return_value = None  # No existing model data
+    mock_archive.open_member.return_value = None
     mock_archive.is_writable.return_value = True
     mock_archive.add_file = MagicMock()
     mock_archive.__enter__ = MagicMock(return_value=mock_archive)
@@ -271,6 +523,7 @@ def test_analyze_3mf_content(mock_directory_class, mock_archive_class, monkeypat
     mock_archive = MagicMock()
     mock_archive.list_contents.return_value = ["3D/model.model", "Metadata/info.txt"]
     mock_archive.extract_file.return_value = None  # No existing model data
+    mock_archive.open_member.return_value = None
     mock_archive.__enter__ = MagicMock(return_value=mock_archive)
     mock_archive.__exit__ = MagicMock(return_value=None)
     mock_archive_class.return_value = mock_archive
@@ -332,8 +585,8 @@ def test_batch_convert_stl_files(mock_convert, tmp_path, capsys):
         output_dir / "model3.3mf"
     ]
     
-    # Test successful batch conversion
-    result = Model.batch_convert_stl_files(input_dir, output_dir)
+    # Test successful batch conversion (in-process, so the mock is seen)
+    result = Model.batch_convert_stl_files(input_dir, output_dir, max_workers=1)
     assert len(result) == 3
     assert mock_convert.call_count == 3
     captured = capsys.readouterr()
@@ -353,4 +606,43 @@ def test_batch_convert_stl_files(mock_convert, tmp_path, capsys):
     result = Model.batch_convert_stl_files(empty_dir, output_dir)
     assert result == []
     captured = capsys.readouterr()
-    assert "No STL files found" in captured.out
\ No newline at end of file
+    assert "No STL files found" in captured.out
+
+def test_batch_convert_stl_files_same_stem_in_subdirectories(tmp_path):
+    """Test that inputs sharing an output path are converted one after another."""
+    import zipfile
+    from stl import mesh
+    from noah123d.threemf.model import _split_output_collisions
+    jobs = [("a/part.stl", "part.3mf"), ("other.stl", "other.3mf"), ("b/part.stl", "part.3mf")]
+    assert _split_output_collisions(jobs) == (jobs[:2], jobs[2:])
+    
+    for sub_dir, count in (("a", 2), ("b", 1)):
+        (tmp_path / sub_dir).mkdir()
+        part = mesh.Mesh(np.zeros(count, dtype=mesh.Mesh.dtype))
+        part.vectors[:] = [[[0, 0, 0], [1, 0, 0], [0, 1, 0]]]
+        part.save(str(tmp_path / sub_dir / "part.stl"))
+    
+    result = Model.batch_convert_stl_files(tmp_path, tmp_path / "out", max_workers=2)
+    assert result == [tmp_path / "out" / "part.3mf"] * 2
+    with zipfile.ZipFile(tmp_path / "out" / "part.3mf") as zf:
+        assert zf.testzip() is None
+        xml = zf.read("3D/3dmodel.model")
+    # The input globbed last wins, as in a serial run
+    last_input = list(tmp_path.glob("**/*.stl"))[-1]
+    assert xml.count(b"<triangle ") == (1 if last_input.parent.name == "b" else 2)
+
+def test_analyze_3mf_content_with_written_model(tmp_path, capsys):
+    """Test that a just-written model is analyzed without reopening the archive."""
+    from noah123d import Archive, Directory
+    file_path = tmp_path / "written.3mf"
+    with Archive(file_path, 'w'):
+        with Directory('3D'):
+            with Model() as model:
+                model.add_object([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    
+    with patch('noah123d.threemf.model.Archive') as mock_archive_class:
+        Model.analyze_3mf_content(file_path, model=model)
+        mock_archive_class.assert_not_called()
+    captured = capsys.readouterr()
+    assert "3D/3dmodel.model" in captured.out
+    assert "Total Objects: 1" in captured.out
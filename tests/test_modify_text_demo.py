@@ -0,0 +1,60 @@
+"""Test the modify text demos.
+- state: passing, 2026-10-16
+"""
+
+import importlib.util
+import zipfile
+from pathlib import Path
+import pytest
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+def _load_example(name):
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(params=["modify_text_demo", "modify_text_demo_new"])
+def demo(request):
+    pytest.importorskip("toml")
+    return _load_example(request.param)
+
+def test_modify_text_copies_other_members_raw(demo, tmp_path):
+    config = b'<metadata type="object" key="name" value="Old name"/>'
+    with zipfile.ZipFile(tmp_path / "part.3mf", 'w') as zf:
+        zf.writestr("3D/3dmodel.model", "<vertex />" * 100, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr(demo.CONFIG_ENTRY, config)
+
+    assert demo.modify_text_in_3mf(str(tmp_path / "part.3mf"), str(tmp_path / "out"),
+                                   {"Old name": "New name"}, create_backup=False)
+
+    with zipfile.ZipFile(tmp_path / "part.3mf") as source, \
+         zipfile.ZipFile(tmp_path / "out" / "part_modified.3mf") as zf:
+        assert zf.testzip() is None
+        assert zf.read(demo.CONFIG_ENTRY) == config.replace(b"Old name", b"New name")
+        assert zf.getinfo("3D/3dmodel.model").CRC == source.getinfo("3D/3dmodel.model").CRC
+        assert zf.read("3D/3dmodel.model") == b"<vertex />" * 100
+
+def test_find_3mf_files_hidden_only_for_dot_patterns(demo, tmp_path, monkeypatch):
+    for name in ("part.3mf", ".hidden.3mf", "part.3mf.backup"):
+        (tmp_path / name).write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+
+    def find(*patterns):
+        return demo.find_3mf_files({'processing': {'include_patterns': list(patterns),
+                                                   'exclude_patterns': ['*.backup']}})
+    assert find("*.3mf") == ["part.3mf"]
+    assert find(".*.3mf") == [".hidden.3mf"]
+    assert find("*.3mf", ".*.3mf") == [".hidden.3mf", "part.3mf"]
+
+def test_find_3mf_files_matches_normcased_names(demo, tmp_path, monkeypatch):
+    for name in ("PART.3MF", "other.3mf", "OLD.3MF.BACKUP"):
+        (tmp_path / name).write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+    # Case-insensitive file systems normcase names, as os.path.normcase does on Windows
+    monkeypatch.setattr(demo.os.path, "normcase", str.lower)
+
+    config = {'processing': {'include_patterns': ['*.3mf', '*.BACKUP'], 'exclude_patterns': ['*.backup']}}
+    assert demo.find_3mf_files(config) == ["PART.3MF", "other.3mf"]